@@ -0,0 +1,23 @@
+import ast
+import functools
+import os
+
+import pytest
+
+from .corpus import generate
+
+# 1M line modules take a while to generate and parse, so they are opt-in.
+SIZES = [1_000, 10_000, 100_000] + (
+    [1_000_000] if os.environ.get("PANDAS_VET_BENCH_HUGE") else []
+)
+
+
+@functools.lru_cache(maxsize=None)
+def parsed(lines: int = 10_000, density: float = 0.2, depth: int = 2) -> ast.Module:
+    """Parse a generated module once per benchmark session."""
+    return ast.parse(generate(lines, density, depth))
+
+
+@pytest.fixture(params=SIZES, ids=lambda lines: f"{lines}-lines")
+def sized_tree(request):
+    return parsed(request.param)
@@ -0,0 +1,129 @@
+"""Deterministic generator of pandas-heavy Python modules.
+
+The generated code looks like typical analysis code: imports, helper
+functions, loops, method chains and literals, mixed with statements that
+trigger pandas-vet checks at a configurable density. The same arguments
+always produce the same source, so benchmark results stay comparable.
+"""
+import random
+
+HEADER = """\
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+"""
+
+# Statements producing at least one pandas-vet error.
+TRIGGERS = [
+    "{frame}.drop(columns=[{col!r}], inplace=True)",
+    "{name} = {frame}.isnull().sum()",
+    "{name} = {frame}[{col!r}].notnull()",
+    "{name} = {frame}[{col!r}].add({frame}[{col2!r}])",
+    "{name} = {frame}[{col!r}].gt({i})",
+    "{name} = {frame}.ix[{i}]",
+    "{name} = {frame}.at[{i}, {col!r}]",
+    "{name} = {frame}.iat[{i}, 0]",
+    "{name} = {frame}.pivot(index={col!r}, columns={col2!r}, values='value')",
+    "{name} = {frame}.set_index([{col!r}, {col2!r}]).unstack()",
+    "{name} = {frame}.stack()",
+    "{name} = {frame}.values",
+    "{name} = pd.read_table({path!r})",
+    "{name} = pd.merge({frame}, {frame2}, on={col!r})",
+    "df = {frame}.copy()",
+]
+
+# Statements without any pandas-vet error.
+CLEAN = [
+    "{name} = {frame}.isna().sum()",
+    "{name} = {frame}[{col!r}] + {frame}[{col2!r}]",
+    "{name} = {frame}.loc[{i}, {col!r}]",
+    "{name} = {frame}.to_numpy()",
+    "pieces.append(pd.read_csv({path!r}, usecols=[{col!r}, {col2!r}]))",
+    "{name} = {frame}.merge({frame2}, on={col!r}, how='left')",
+    "{name} = {frame}.groupby({col!r})[{col2!r}].agg(['mean', 'sum'])",
+    "{name} = {{{col!r}: {i}, {col2!r}: [{i}, {i} + 1]}}",
+    "{name} = [value * 2 for value in range({i}) if value % 3]",
+    "{name} = helper({frame}, key={col!r}).strip().lower()",
+    "{name} = np.where({frame}[{col!r}] > {i}, 'high', 'low')",
+    "logger.info('processed %s rows of %s', len({frame}), {path!r})",
+    "{frame}[{col!r}] = {frame}[{col2!r}].fillna({i}).astype('int64')",
+]
+
+BLOCKS = [
+    "for {var} in range({i}):",
+    "if {frame}.shape[0] > {i}:",
+    "while {var} < {i}:",
+    "with pd.option_context('display.max_rows', {i}):",
+]
+
+COLUMNS = ["price", "amount", "region", "customer", "date", "value", "count"]
+
+
+class _Generator:
+    def __init__(self, density: float, depth: int, seed: int):
+        self.random = random.Random(seed)
+        self.density = density
+        self.depth = depth
+        self.counter = 0
+
+    def fields(self) -> dict:
+        pick = self.random.choice
+        self.counter += 1
+        return dict(
+            name=f"result_{self.counter}",
+            frame=pick(["sales", "orders", "frame"]),
+            frame2=pick(["customers", "regions"]),
+            col=pick(COLUMNS),
+            col2=pick(COLUMNS),
+            path=f"data/part_{self.counter % 97}.csv",
+            var=pick(["row", "index", "step"]),
+            i=self.random.randrange(1, 1000),
+        )
+
+    def statement(self) -> str:
+        pool = TRIGGERS if self.random.random() < self.density else CLEAN
+        return self.random.choice(pool).format(**self.fields())
+
+    def block(self, indent: int, level: int) -> list:
+        """A few statements, some of them nested `level` more levels deep."""
+        prefix = "    " * indent
+        lines = []
+        for _ in range(self.random.randrange(2, 6)):
+            if level and self.random.random() < 0.3:
+                header = self.random.choice(BLOCKS).format(**self.fields())
+                lines.append(prefix + header)
+                lines.extend(self.block(indent + 1, level - 1))
+            else:
+                lines.append(prefix + self.statement())
+        return lines
+
+    def function(self) -> list:
+        self.counter += 1
+        lines = [f"def step_{self.counter}(sales, orders, frame, customers, regions):"]
+        lines.extend(self.block(1, self.depth))
+        lines.append(f"    return result_{self.counter - 1}")
+        return lines + ["", ""]
+
+
+def generate(
+    lines: int = 1000, density: float = 0.2, depth: int = 2, seed: int = 0
+) -> str:
+    """Generate a module of about `lines` lines of pandas code.
+
+    Args:
+        lines (int): Approximate number of lines of the module
+        density (float): Fraction of statements triggering a pandas-vet error
+        depth (int): Maximum nesting of loops and conditionals in functions
+        seed (int): Seed of the random generator
+
+    Returns:
+        source (str): The generated source
+    """
+    generator = _Generator(density, depth, seed)
+    source = HEADER.splitlines() + ["", ""]
+    while len(source) < lines:
+        source.extend(generator.function())
+    return "\n".join(source) + "\n"
@@ -0,0 +1,75 @@
+"""Measure the peak memory of linting many files with pandas-vet.
+
+Every file is parsed, checked with `VetPlugin.run` and dropped again, the
+way flake8 processes a project. Each measurement runs in a fresh
+interpreter so the reported peak RSS only belongs to that run.
+
+Usage:
+    python -m benchmarks.memory [--files N] [--lines N] [--src PATH]
+
+Pass `--src` pointing at the `src` directory of another checkout (e.g. a
+`git worktree` of the previous release) to compare before/after numbers.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+from .corpus import generate
+
+CHILD = """\
+import ast, gc, json, resource, sys, time
+from pandas_vet import VetPlugin
+
+source, files = sys.stdin.read(), int(sys.argv[1])
+gc.collect()
+start = time.perf_counter()
+for _ in range(files):
+    tree = ast.parse(source)
+    VetPlugin(tree).run()
+    del tree
+elapsed = time.perf_counter() - start
+collected = sum(stats["collected"] for stats in gc.get_stats())
+print(json.dumps({
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "gc_collected": collected,
+    "seconds": elapsed,
+}))
+"""
+
+
+def measure(source: str, files: int, src: str = None) -> dict:
+    """Run the child process and return its measurements."""
+    env = dict(os.environ)
+    if src:
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [src, env.get("PYTHONPATH")]))
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, str(files)],
+        input=source,
+        check=True,
+        capture_output=True,
+        env=env,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=5000)
+    parser.add_argument("--src", help="`src` directory of pandas-vet to measure")
+    args = parser.parse_args(argv)
+
+    result = measure(generate(args.lines), args.files, args.src)
+    print(
+        f"{args.files} files x {args.lines} lines: "
+        f"peak RSS {result['peak_rss_kb'] / 1024:.1f} MiB, "
+        f"{result['gc_collected']} objects collected by gc, "
+        f"{result['seconds']:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmarks of the dispatch per node type and of every rule on its own."""
+import ast
+
+import pytest
+
+from pandas_vet import DISPATCH, RULES, Findings, Visitor, compile_rules
+
+from .conftest import parsed
+
+
+def nodes_of(node_type):
+    return [node for node in ast.walk(parsed()) if isinstance(node, node_type)]
+
+
+@pytest.mark.parametrize("node_type", sorted(DISPATCH, key=lambda t: t.__name__))
+def test_dispatch_node_type(benchmark, node_type):
+    """Time the checks of the nodes of a type, without walking their children."""
+    nodes = nodes_of(node_type)
+    table = DISPATCH[node_type]
+    visitor = Visitor()
+
+    def dispatch():
+        visitor.errors = Findings()
+        for node in nodes:
+            visitor.run_checks(node, table)
+
+    benchmark(dispatch)
+
+
+@pytest.mark.parametrize(
+    "rule", RULES, ids=lambda rule: f"{rule.code}-{rule.check.__name__}"
+)
+def test_rule(benchmark, rule):
+    """Time a check on the nodes it is dispatched to."""
+    key, keyed, unkeyed = compile_rules(RULES, combine=False)[rule.node_type]
+    nodes = [
+        node
+        for node in nodes_of(rule.node_type)
+        if rule in (keyed.get(key(node), unkeyed) if key else unkeyed)
+    ]
+    context = (Visitor(),) if rule.context else ()
+
+    def check():
+        for node in nodes:
+            rule.check(node, *context)
+
+    benchmark(check)
@@ -0,0 +1,51 @@
+"""Benchmarks of the walk as the number of pattern rules grows."""
+import ast
+
+import pytest
+
+from pandas_vet import RULES, Code, Matcher, NodePattern, Rule, Visitor, compile_rules
+
+from .conftest import parsed
+
+COUNTS = [0, 10, 100, 1000]
+
+
+def synthetic(count, shared):
+    """Build `count` pattern rules on top of the registered ones.
+
+    With `shared`, all of them match `.isnull()` calls passing a keyword
+    argument the corpus never uses, so they share their tests. Otherwise
+    every rule matches another method name.
+    """
+    rules = []
+    for i in range(count):
+        code = Code(f"PX{i:04d} synthetic rule")
+        names = frozenset(["isnull" if shared else f"method_{i}"])
+        node_pattern = NodePattern(
+            code.code, ast.Call, names, keyword=("synthetic", True)
+        )
+        rules.append(
+            Rule(
+                code.code,
+                Matcher((node_pattern,)),
+                ast.Call,
+                names,
+                keywords=names,
+                pattern=node_pattern,
+            )
+        )
+    return rules
+
+
+@pytest.mark.parametrize("shared", [False, True], ids=["distinct", "shared"])
+@pytest.mark.parametrize("count", COUNTS, ids=lambda count: f"{count}-rules")
+def test_walk_with_rules(benchmark, count, shared):
+    """Walk a generated module with `count` more rules.
+
+    The time should not depend on `count`: distinct names are dispatched
+    to nothing on most nodes and shared tests run once per node.
+    """
+    tree = parsed()
+    rules = RULES + synthetic(count, shared)
+    visitor = Visitor(dispatch=compile_rules(rules), track_ancestors=True)
+    benchmark(lambda: visitor.check(tree))
@@ -0,0 +1,22 @@
+"""Benchmarks of `VetPlugin.run` on whole generated modules."""
+import pytest
+
+from pandas_vet import VetPlugin
+
+from .conftest import parsed
+
+
+def test_run(benchmark, sized_tree):
+    benchmark(lambda: VetPlugin(sized_tree).run())
+
+
+@pytest.mark.parametrize("density", [0.0, 0.2, 0.8])
+def test_run_density(benchmark, density):
+    tree = parsed(density=density)
+    benchmark(lambda: VetPlugin(tree).run())
+
+
+@pytest.mark.parametrize("depth", [0, 4, 8])
+def test_run_depth(benchmark, depth):
+    tree = parsed(depth=depth)
+    benchmark(lambda: VetPlugin(tree).run())
@@ -0,0 +1,20 @@
+"""Benchmarks of the incremental re-check of `pandas-vet serve`."""
+from pandas_vet.server import Linter
+
+from .corpus import generate
+
+
+def test_recheck_after_edit(benchmark):
+    """Re-check a 5k line module after editing one statement, as on a save."""
+    source = generate(5_000)
+    edits = [source, source.replace("result_1 =", "result_one =", 1)]
+    linter = Linter()
+    linter.check("module.py", source)
+    versions = iter(edits * 1_000_000)
+    benchmark(lambda: linter.check("module.py", next(versions)))
+
+
+def test_first_check(benchmark):
+    """Check a 5k line module the server has not seen yet."""
+    source = generate(5_000)
+    benchmark(lambda: Linter().check("module.py", source))
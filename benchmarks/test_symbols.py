@@ -0,0 +1,27 @@
+"""Benchmarks of the symbol table pre-pass against the full walk."""
+import pytest
+
+from pandas_vet import Visitor
+from pandas_vet.symbols import Symbols
+
+from .conftest import parsed
+
+
+@pytest.mark.parametrize("depth", [2, 8])
+def test_symbols_scan(benchmark, depth):
+    """Build the symbol table of a generated module."""
+    tree = parsed(depth=depth)
+    assert Symbols(tree).frames
+    benchmark(lambda: Symbols(tree))
+
+
+def test_walk_with_symbols(benchmark):
+    """Walk a generated module and build its symbol table, as PD015 does."""
+    tree = parsed()
+
+    def check():
+        visitor = Visitor()
+        visitor.check(tree)
+        return visitor.symbols
+
+    benchmark(check)
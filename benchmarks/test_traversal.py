@@ -0,0 +1,53 @@
+"""Benchmarks of the explicit-stack walk against a recursive `ast.NodeVisitor`."""
+import ast
+
+import pytest
+
+from pandas_vet import DISPATCH, Findings, Visitor
+from pandas_vet.engine import NESTING, _nest
+
+from .conftest import parsed
+
+
+class RecursiveVisitor(ast.NodeVisitor):
+    """The recursive walk `Visitor` replaced, running the same checks."""
+
+    def __init__(self):
+        self.visitor = Visitor()
+
+    def generic_visit(self, node):
+        ancestors, nesting = self.visitor.ancestors, self.visitor.nesting
+        if not ancestors:
+            nesting.append((0, ()))
+        elif type(ancestors[-1]) in NESTING:
+            nesting.append(_nest(ancestors[-1], node, *nesting[-1]))
+        else:
+            nesting.append(nesting[-1])
+        ancestors.append(node)
+        super().generic_visit(node)
+        ancestors.pop()
+        nesting.pop()
+        table = DISPATCH.get(type(node))
+        if table is not None:
+            self.visitor.run_checks(node, table)
+
+    def check(self, tree):
+        self.visitor.errors = Findings()
+        self.visitor.tree = self.visitor.module = tree
+        self.visitor._symbols = None
+        self.visit(tree)
+        return self.visitor.errors
+
+
+@pytest.mark.parametrize("engine", [Visitor, RecursiveVisitor])
+def test_walk(benchmark, engine):
+    tree = parsed()
+    assert Visitor().check(tree) == RecursiveVisitor().check(tree)
+    benchmark(lambda: engine().check(tree))
+
+
+@pytest.mark.parametrize("engine", [Visitor, RecursiveVisitor])
+def test_walk_deep(benchmark, engine):
+    """Walk the most deeply nested generated module."""
+    tree = parsed(depth=8)
+    benchmark(lambda: engine().check(tree))
@@ -1,116 +1,141 @@
-import ast
-from collections import namedtuple
-from functools import partial
-from typing import List
+"""The flake8 plugin entry point.
 
-import attr
+flake8 imports this module in every run, so it only holds `VetPlugin` and
+its options. The rule engine (`engine`, `checks` and `performance`) is
+imported on the first `VetPlugin.run`, and its names, such as `PD002` or
+`Visitor`, stay available from this module through `__getattr__`, like the
+`check_paths` and `Summary` batch API.
+"""
+import os
 
+from . import stats
 from .__about__ import __version__
+from .cache import DEFAULT_MAX_ENTRIES, default_directory
 
+disabled_by_default = ["PD9"]
 
-@attr.s
-class Visitor(ast.NodeVisitor):
-    """
-    ast.NodeVisitor calls the appropriate method for a given node type
 
-    i.e. calling self.visit on an Import node calls visit_import
+class PandasVetException(Exception):
+    pass
 
-    The `check` functions should be called from the `visit_` method that
-    would produce a 'fail' condition.
-    """
 
-    errors = attr.ib(default=attr.Factory(list))
+class VetPlugin:
+    name = "flake8-pandas-vet"
+    version = __version__
 
-    def visit_Import(self, node):
-        """
-        Called for `import ..` and `import .. as ..` nodes.
-        """
-        self.generic_visit(node)  # continue checking children
-        self.errors.extend(check_import_name(node))
+    # The arguments of the last `configure` call.
+    settings = {}
+    # Whether `load` built the attributes below from the `settings`.
+    loaded = False
+    # See `engine.compile_prefilter`.
+    prefilter = None
+    # A `ResultCache`, unless disabled.
+    cache = None
+    # Creates the visitor walking a tree; replaced when profiling.
+    visitor = None
+
+    def __init__(self, tree, lines=None, filename=None):
+        self.tree = tree
+        self.lines = lines
+        self.filename = filename
 
-    def visit_Call(self, node):
-        """
-        Called for `.method()` nodes.
-        """
-        self.generic_visit(node)  # continue checking children
-        self.errors.extend(check_inplace_false(node))
-        self.errors.extend(check_for_isnull(node))
-        self.errors.extend(check_for_notnull(node))
-        self.errors.extend(check_for_pivot(node))
-        self.errors.extend(check_for_unstack(node))
-        self.errors.extend(check_for_stack(node))
-        self.errors.extend(check_for_arithmetic_methods(node))
-        self.errors.extend(check_for_comparison_methods(node))
-        self.errors.extend(check_for_read_table(node))
-        self.errors.extend(check_for_merge(node))
-
-    def visit_Subscript(self, node):
-        """
-        Called for `[slicing]` nodes.
-        """
-        self.generic_visit(node)  # continue checking children
-        self.errors.extend(check_for_ix(node))
-        self.errors.extend(check_for_at(node))
-        self.errors.extend(check_for_iat(node))
+    def run(self):
+        VetPlugin.load()
+        stats.COUNTERS["files"] += 1
+        try:
+            errors = self.check()
+        except Exception as e:
+            raise PandasVetException(e)
+        stats.flush()
+        return errors
 
-    def visit_Attribute(self, node):
-        """
-        Called for `.attribute` nodes.
-        """
-        self.generic_visit(node)  # continue checking children
-        self.errors.extend(check_for_values(node))
+    def check(self):
+        """Check the tree, unless the source allows to skip it or is cached.
 
-    def visit_Name(self, node):
+        Both shortcuts need the source `lines` passed by flake8. Without a
+        `tree`, the source is only parsed when it has to be walked.
         """
-        Called for `Assignment` nodes.
-        """
-        self.generic_visit(node)  # continue checking children
-        self.errors.extend(check_for_df(node))
+        if self.lines is None:
+            return self.visitor().check(self.tree)
+        source = "".join(self.lines)
+        if self.prefilter is not None and self.prefilter.search(source) is None:
+            stats.COUNTERS["files_skipped"] += 1
+            return []
+        if self.cache is None:
+            return self.visitor().check(self.parse(source))
 
-    def check(self, node):
-        self.errors = []
-        self.visit(node)
-        return self.errors
+        key = self.cache.key(source)
+        cached = self.cache.get(key)
+        if cached is not None:
+            from .engine import error
 
-    def generic_visit(self, node):
-        """Called if no explicit visitor function exists for a node.
+            return [error(*cached_error, type=VetPlugin) for cached_error in cached]
+        errors = self.visitor().check(self.parse(source))
+        self.cache.put(key, [e[:3] for e in errors])
+        return errors
 
-        This also attaches breadcrumbs before visiting a node so we can
-        later look up the syntax tree. This way, there's more
-        information to decide whether or not to raise.
+    def parse(self, source: str):
+        """Return the tree given by flake8, or parse it from `source`."""
+        if self.tree is None:
+            import ast
 
-        The breadcrumb name is `__pandas_vet_parent` (name mangled) to
-        avoid all reasonable name collisions.
+            self.tree = ast.parse(source, self.filename or "<unknown>")
+        return self.tree
 
-        .. seealso:: `check_for_values`.
+    @staticmethod
+    def configure(
+        skip_agnostic: bool = False,
+        cache_dir: str = None,
+        cache_size: int = DEFAULT_MAX_ENTRIES,
+        profile: str = None,
+        select=None,
+        loop_only=(),
+        escalate=(),
+    ):
+        """Set up the rules, pre-filter, result cache and profiling of every instance.
+
+        Nothing is built until `load` is called, before the first file is
+        checked, so configuring the plugin does not load the rule engine,
+        unless profiling is enabled.
+
+        Args:
+            skip_agnostic (bool): See `--pandas-vet-skip-agnostic`
+            cache_dir (str): Directory of the result cache, or None to
+                disable it
+            cache_size (int): Number of entries kept in the result cache
+            profile (str): See `--pandas-vet-profile`. None disables
+                profiling.
+            select (Callable): Whether an error code is enabled, or None to
+                enable every rule
+            loop_only (Sequence[str]): See `--pandas-vet-loop-only`
+            escalate (Sequence[str]): See `--pandas-vet-escalate`
         """
-        for field, value in ast.iter_fields(node):
-            if isinstance(value, list):
-                for item in value:
-                    if isinstance(item, ast.AST):
-                        item.__pandas_vet_parent = node
-                        self.visit(item)
-            elif isinstance(value, ast.AST):
-                value.__pandas_vet_parent = node
-                self.visit(value)
-
-
-class PandasVetException(Exception):
-    pass
+        VetPlugin.settings = dict(
+            skip_agnostic=skip_agnostic,
+            cache_dir=cache_dir,
+            cache_size=cache_size,
+            profile=profile,
+            select=select,
+            loop_only=tuple(loop_only),
+            escalate=tuple(escalate),
+        )
+        VetPlugin.loaded = False
+        if profile is not None:
+            from . import profile as profiling
 
+            profiling.enable(profile)
 
-class VetPlugin:
-    name = "flake8-pandas-vet"
-    version = __version__
-
-    def __init__(self, tree):
-        self.tree = tree
+    @staticmethod
+    def load():
+        """Import the rule engine and build what `configure` set up, once."""
+        if VetPlugin.loaded:
+            return
+        from . import engine
 
-    def run(self):
-        try:
-            return Visitor().check(self.tree)
-        except Exception as e:
-            raise PandasVetException(e)
+        VetPlugin.prefilter, VetPlugin.cache, VetPlugin.visitor = engine.build(
+            **VetPlugin.settings
+        )
+        VetPlugin.loaded = True
 
     @staticmethod
     def add_options(optmanager):
@@ -123,341 +148,131 @@ class VetPlugin:
             dest="annoy",
             default=False,
         )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-skip-agnostic",
+            action="store_true",
+            dest="pandas_vet_skip_agnostic",
+            default=False,
+            parse_from_config=True,
+            help="Skip files whose only possible pandas-vet findings come from "
+            "rules that are not specific to pandas, such as PD002 "
+            "'inplace=True'. (Default: %(default)s)",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-stats",
+            action="store_true",
+            dest="pandas_vet_stats",
+            default=False,
+            parse_from_config=True,
+            help="Report how many files pandas-vet checked and skipped. "
+            "(Default: %(default)s)",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-cache-dir",
+            dest="pandas_vet_cache_dir",
+            default=default_directory(),
+            parse_from_config=True,
+            help="Directory of the pandas-vet result cache. (Default: %(default)s)",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-cache-size",
+            type=int,
+            dest="pandas_vet_cache_size",
+            default=DEFAULT_MAX_ENTRIES,
+            parse_from_config=True,
+            help="Number of files kept in the pandas-vet result cache. "
+            "(Default: %(default)s)",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-no-cache",
+            action="store_true",
+            dest="pandas_vet_no_cache",
+            default=False,
+            parse_from_config=True,
+            help="Do not read or write the pandas-vet result cache. "
+            "(Default: %(default)s)",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-loop-only",
+            comma_separated_list=True,
+            dest="pandas_vet_loop_only",
+            default=[],
+            parse_from_config=True,
+            help="Comma-separated list of error codes (or prefixes) only reported "
+            "inside a loop, a comprehension or a lambda, such as PD008,PD009.",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-escalate",
+            comma_separated_list=True,
+            dest="pandas_vet_escalate",
+            default=[],
+            parse_from_config=True,
+            help="Comma-separated list of error codes (or prefixes) whose message "
+            "tells how many loops they are nested in.",
+        )
+        optmanager.add_option(
+            long_option_name="--pandas-vet-profile",
+            nargs="?",
+            const="-",
+            dest="pandas_vet_profile",
+            default=None,
+            metavar="PATH",
+            help="Time every pandas-vet rule and count the visited nodes. The "
+            "profile is printed to stderr, or written as JSON to PATH. Also "
+            "enabled by the PANDAS_VET_PROFILE environment variable.",
+        )
 
     @staticmethod
     def parse_options(optmanager, options, args):
-        """Receives the parsed options and values."""
-        if not options.annoy:
-            return
-        for v in disabled_by_default:
-            try:
-                options.ignore.remove(v)
-            except ValueError:
-                pass
-
-
-def check_import_name(node: ast.Import) -> List:
-    """Check AST for imports of pandas not using the preferred alias 'pd'.
-
-    Error/warning message to recommend use of 'pd' alias.
-
-    Args:
-        node (ast.Call): An AST node of type Call
-
-    Returns:
-        errors (List): list of errors of type PD001 with line number and column offset
-    """
-    errors = []
-    for n in node.names:
-        if n.name == "pandas" and n.asname != "pd":
-            errors.append(PD001(node.lineno, node.col_offset))
-    return errors
-
-
-def check_inplace_false(node: ast.Call) -> List:
-    """Check AST for function calls using inplace=True keyword argument.
-
-    Disapproved:
-        df.method(inplace=True)
-
-    Approved:
-        df = df.method(inplace=False)
-
-    Error/warning message to recommend avoidance of inplace=True due to inconsistent behavior.
-
-    Args:
-        node (ast.Call): An AST node of type Call
-
-    Returns:
-        errors (List): list of errors of type PD002 with line number and column offset
-    """
-    errors = []
-    for kw in node.keywords:
-        if (
-            kw.arg == "inplace"
-            and hasattr(kw.value, "value")
-            and kw.value.value is True
-        ):
-            errors.append(PD002(node.lineno, node.col_offset))
-    return errors
-
-
-def check_for_isnull(node: ast.Call) -> List:
-    """Check AST for function calls using the isnull() method.
-
-    Disapproved:
-        df.isnull()
-
-    Approved:
-        df.isna()
-
-    Error/warning message to recommend usage of .isna() instead of .isnull().
-    Functionality is equivalent.
-
-    Args:
-        node (ast.Call): An AST node of type Call
-
-    Returns:
-        errors (List): list of errors of type PD003 with line number and column offset
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "isnull":
-        return [PD003(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_notnull(node: ast.Call) -> List:
-    """Check AST for function calls using the notnull() method.
-
-    Disapproved:
-        df.notnull()
-
-    Approved:
-        df.notna()
-
-    Error/warning message to recommend usage of .notna() instead of .notnull().
-    Functionality is equivalent.
+        """Receives the parsed options and values.
 
-    Args:
-        node (ast.Call): An AST node of type Call
-
-    Returns:
-        errors (List): list of errors of type PD004 with line number and column offset
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "notnull":
-        return [PD004(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_arithmetic_methods(node: ast.Call) -> List:
-    """
-    Check AST for occurence of explicit arithmetic methods.
-
-    Error/warning message to recommend use of binary arithmetic operators.
-    """
-    arithmetic_methods = [
-        "add",
-        "sub",
-        "subtract",
-        "mul",
-        "multiply",
-        "div",
-        "divide",
-        "truediv",
-        "pow",
-        "floordiv",
-        "mod",
-    ]
-
-    if isinstance(node.func, ast.Attribute) and node.func.attr in arithmetic_methods:
-        return [PD005(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_comparison_methods(node: ast.Call) -> List:
-    """
-    Check AST for occurence of explicit comparison methods.
-
-    Error/warning message to recommend use of binary comparison operators.
-    """
-    comparison_methods = ["gt", "lt", "ge", "le", "eq", "ne"]
-
-    if isinstance(node.func, ast.Attribute) and node.func.attr in comparison_methods:
-        return [PD006(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_ix(node: ast.Subscript) -> List:
-    """
-    Check AST for use of deprecated `.ix[]` attribute on data frame.
-
-    Error/warning message to recommend use of explicit `.iloc[]` or `.loc[]` instead.
-    """
-    if isinstance(node.value, ast.Attribute) and node.value.attr == "ix":
-        return [PD007(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_at(node: ast.Subscript) -> List:
-    """
-    Check AST for use of deprecated `.at[]` attribute on data frame.
-
-    Error/warning message to recommend use of explicit `.loc[]` instead.
-    """
-    if isinstance(node.value, ast.Attribute) and node.value.attr == "at":
-        return [PD008(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_iat(node: ast.Subscript) -> List:
-    """
-    Check AST for use of deprecated `.iat[]` attribute on data frame.
-
-    Error/warning message to recommend use of explicit `.iloc[]` instead.
-    """
-    if isinstance(node.value, ast.Attribute) and node.value.attr == "iat":
-        return [PD009(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_pivot(node: ast.Call) -> List:
-    """
-    Check AST for occurence of the `.pivot()` method on the pandas data frame.
-
-    Error/warning message to recommend use of `.pivot_table()` method instead.
-    This check should work for both the `df.pivot()` method, as well as the
-    `pd.pivot(df)` function.
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "pivot":
-        return [PD010(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_unstack(node: ast.Call) -> List:
-    """
-    Check occurence of the `.unstack()` method on the pandas data frame.
-
-    Error/warning message to recommend use of `.pivot_table()` method.
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "unstack":
-        return [PD010(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_stack(node: ast.Call) -> List:
-    """
-    Check AST for occurence of the `.stack()` method on the pandas data frame.
-
-    Error/warning message to recommend use of `.melt()` method instead.
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "stack":
-        return [PD013(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_values(node: ast.Attribute) -> List:
-    """
-    Check occurence of the `.values` attribute on the pandas data frame.
-
-    Error/warning message to recommend use of `.to_numpy()` method for NumPy array.
-
-    In order to discriminate `df.values` (where this check should raise) vs
-    calls, like `dict().values()` (where this should not), this function
-    needs to check the node breadcrumb defined at `Visitor.generic_visit`,
-    raising only in the first case.
-
-    .. seealso:: `Visitor.generic_visit`.
-    """
-    if node.attr == "values":
-        parent = getattr(node, "_Visitor__pandas_vet_parent", None)
-        if (
-            parent
-            and isinstance(parent, ast.Call)
-            and isinstance(parent.func, ast.Attribute)
-            and parent.func.attr == "values"
-        ):
-            return []
-        return [PD011(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_read_table(node: ast.Call) -> List:
-    """
-    Check AST for occurence of the `.read_table()` method on the pandas object.
-
-    Error/warning message to recommend use of `.read_csv()` method instead.
-    """
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "read_table":
-        return [PD012(node.lineno, node.col_offset)]
-    return []
-
-
-def check_for_merge(node: ast.Call) -> List:
-    """
-    Check for use of `.merge()` method on the pandas object.
-
-    Error/warning message to recommend use of `df.merge()` method instead.
-    """
-    # The AST does not retain any of the pandas semantic information, so the
-    # current implementation of this test will infer based on the name of the
-    # object.  If the object name is `pd`, and if the `.merge()` method has at
-    # least two arguments (left, right, ... ) we will assume that it matches
-    # the pattern that we are trying to check, `pd.merge(left, right)`
-    if not hasattr(node.func, "value"):
-        return []  # ignore functions
-    elif not hasattr(node.func.value, "id"):
-        return []  # it could be the case that id is not present
-
-    if node.func.value.id != "pd":
-        return []  # assume object name is `pd`
+        The codes flake8 would report are resolved once here, from the
+        select, ignore and `--annoy` options, so that only their rules run.
+        """
+        if options.annoy:
+            # Remove PD9 from the ignored codes flake8 adds to --ignore.
+            options.extended_default_ignore = [
+                code
+                for code in options.extended_default_ignore
+                if code not in disabled_by_default
+            ]
+        VetPlugin.configure(
+            skip_agnostic=options.pandas_vet_skip_agnostic,
+            cache_dir=None
+            if options.pandas_vet_no_cache
+            else options.pandas_vet_cache_dir,
+            cache_size=options.pandas_vet_cache_size,
+            profile=options.pandas_vet_profile or os.environ.get("PANDAS_VET_PROFILE"),
+            select=_selected_by(options),
+            loop_only=options.pandas_vet_loop_only,
+            escalate=options.pandas_vet_escalate,
+        )
+        if options.pandas_vet_stats:
+            stats.enable()
 
-    if not len(node.args) >= 2:
-        return []  # at least two arguments
 
-    if isinstance(node.func, ast.Attribute) and node.func.attr == "merge":
-        return [PD015(node.lineno, node.col_offset)]
-    return []
+def _selected_by(options):
+    """Whether flake8 reports an error code with the given `options`."""
+    from flake8.style_guide import Decision, DecisionEngine
 
+    engine = DecisionEngine(options)
+    return lambda code: engine.decision_for(code) is Decision.Selected
 
-def check_for_df(node: ast.Name) -> List:
-    """
-    Check for variables named `df`
-    """
-    if node.id == "df" and isinstance(node.ctx, ast.Store):
-        return [PD901(node.lineno, node.col_offset)]
-    return []
 
+# Modules holding the names served by `__getattr__`.
+_ENGINE = ("engine", "checks", "performance", "batch")
 
-error = namedtuple("Error", ["lineno", "col", "message", "type"])
-VetError = partial(partial, error, type=VetPlugin)
 
-disabled_by_default = ["PD9"]
+def __getattr__(name):
+    """Import the rule engine when one of its names is first used."""
+    import importlib
+    import importlib.util
 
-PD001 = VetError(
-    message="PD001 pandas should always be imported as 'import pandas as pd'"
-)
-
-PD002 = VetError(
-    message="PD002 'inplace = True' should be avoided; it has inconsistent behavior"
-)
-
-PD003 = VetError(
-    message="PD003 '.isna' is preferred to '.isnull'; functionality is equivalent"
-)
-
-PD004 = VetError(
-    message="PD004 '.notna' is preferred to '.notnull'; functionality is equivalent"
-)
-PD005 = VetError(message="PD005 Use arithmetic operator instead of method")
-
-PD006 = VetError(message="PD006 Use comparison operator instead of method")
-
-PD007 = VetError(
-    message="PD007 '.ix' is deprecated; use more explicit '.loc' or '.iloc'"
-)
-PD008 = VetError(
-    message="PD008 Use '.loc' instead of '.at'.  If speed is important, use numpy."
-)
-PD009 = VetError(
-    message="PD009 Use '.iloc' instead of '.iat'.  If speed is important, use numpy."
-)
-PD010 = VetError(
-    message="PD010 '.pivot_table' is preferred to '.pivot' or '.unstack'; "
-    "provides same functionality"
-)
-PD011 = VetError(
-    message="PD011 Use '.to_numpy()' instead of '.values'; 'values' is ambiguous"
-)
-PD012 = VetError(
-    message="PDO12 '.read_csv' is preferred to '.read_table'; provides same functionality"
-)
-PD013 = VetError(
-    message="PD013 '.melt' is preferred to '.stack'; provides same functionality"
-)
-PD015 = VetError(
-    message="PD015 Use '.merge' method instead of 'pd.merge' function. "
-    "They have equivalent functionality."
-)
-
-PD901 = VetError(
-    message="PD901 'df' is a bad variable name. Be kinder to your future self."
-)
+    if name.startswith("_") or importlib.util.find_spec(f"{__name__}.{name}"):
+        # Let `from . import diff` import the submodule rather than the engine.
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    for module in _ENGINE:
+        module = importlib.import_module(f"{__name__}.{module}")
+        if hasattr(module, name):
+            return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,131 @@
+"""Programmatic checking of many files.
+
+`check_paths` checks an iterable of paths in worker processes and yields
+the errors of every file as soon as it is checked, keeping only a bounded
+number of files in flight, so that any number of files can be checked with
+constant memory. `Summary` collects the errors in a columnar form, one
+array per field, for cheap aggregation::
+
+    from pandas_vet import Summary, check_paths
+
+    summary = Summary()
+    for path, errors in summary.collect(check_paths(paths, jobs=8)):
+        ...
+    counts = summary.counts()  # {"PD002": 130, "PD011": 2250, ...}
+"""
+from array import array
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from . import VetPlugin, disabled_by_default
+from .cli import _initialize_worker, check_file, is_selected
+
+Result = Tuple[str, List[Tuple]]
+
+
+def check_paths(
+    paths: Iterable[str],
+    jobs: int = 1,
+    window: int = None,
+    annoy: bool = False,
+    **configuration,
+) -> Iterator[Result]:
+    """Check Python files and notebooks, yielding `(path, errors)` pairs.
+
+    Files are read, parsed and checked in `jobs` worker processes and
+    yielded in the order they finish. The errors are `(lineno, col,
+    message)` tuples, or `(cell, lineno, col, message)` for notebooks, with
+    unreadable files and syntax errors reported as E902 and E999 errors.
+
+    Args:
+        paths (Iterable[str]): The files to check, consumed lazily
+        jobs (int): Number of worker processes. With 1, files are checked in
+            the calling process.
+        window (int): Maximum number of files submitted but not yielded yet.
+            Defaults to 4 files per job.
+        annoy (bool): Whether to run the checks that are off by default
+            (`PD9xx`) too, unless `select` is given
+        **configuration: Arguments of `VetPlugin.configure`, applied in
+            every process checking files
+
+    Yields:
+        result (Tuple): The path and the errors of a checked file
+    """
+    if configuration.get("select") is None:
+        ignore = [] if annoy else list(disabled_by_default)
+        configuration["select"] = partial(is_selected, select=["PD"], ignore=ignore)
+    VetPlugin.configure(**configuration)
+    if jobs <= 1:
+        for path in paths:
+            yield path, check_file(path)
+        return
+
+    window = window or 4 * jobs
+    paths = iter(paths)
+    with ProcessPoolExecutor(
+        jobs, initializer=_initialize_worker, initargs=(configuration,)
+    ) as executor:
+        pending = {}
+        while True:
+            for path in paths:
+                pending[executor.submit(check_file, path)] = path
+                if len(pending) >= window:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield pending.pop(future), future.result()
+
+
+class Summary:
+    """The errors of checked files, as one array per field.
+
+    The `i`-th error has the code `codes[code[i]]` and was found in
+    `paths[path[i]]` at line `line[i]` and column `col[i]` (0-based) of cell
+    `cell[i]` of a notebook, or of the file itself when `cell[i]` is 0.
+    Messages are not kept. The arrays support the buffer protocol, e.g.
+    `numpy.frombuffer(summary.line, dtype=numpy.int32)`.
+    """
+
+    def __init__(self):
+        self.paths: List[str] = []
+        self.codes: List[str] = []
+        self._code_ids: Dict[str, int] = {}
+        self.code = array("i")
+        self.path = array("i")
+        self.cell = array("i")
+        self.line = array("i")
+        self.col = array("i")
+
+    def __len__(self):
+        return len(self.code)
+
+    def update(self, path: str, errors: List[Tuple]):
+        """Add the errors of one file, as yielded by `check_paths`."""
+        path_id = len(self.paths)
+        self.paths.append(path)
+        for error in errors:
+            *cell, lineno, col, message = error
+            code = message.split(" ", 1)[0]
+            if code not in self._code_ids:
+                self._code_ids[code] = len(self.codes)
+                self.codes.append(code)
+            self.code.append(self._code_ids[code])
+            self.path.append(path_id)
+            self.cell.append(cell[0] if cell else 0)
+            self.line.append(lineno)
+            self.col.append(col)
+
+    def collect(self, results: Iterable[Result]) -> Iterator[Result]:
+        """Add every result to the summary while passing it through."""
+        for path, errors in results:
+            self.update(path, errors)
+            yield path, errors
+
+    def counts(self) -> Dict[str, int]:
+        """The number of errors of every code."""
+        counts = Counter(self.code)
+        return {self.codes[i]: counts[i] for i in sorted(counts)}
@@ -0,0 +1,121 @@
+"""Persistent cache of the errors found in previously checked sources.
+
+Entries are keyed by a hash of the source, the pandas-vet version, the
+Python interpreter and the rule set, so a changed file, an upgrade or a
+different configuration never returns stale results. The store is a SQLite
+database, which is safe to share between the worker processes of
+`flake8 --jobs`, and keeps at most `max_entries` entries, evicting the
+least recently used ones.
+"""
+import json
+import os
+import sys
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from . import stats
+from .__about__ import __version__
+
+if TYPE_CHECKING:
+    import sqlite3  # imported on first use, it is slow to import
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def default_directory() -> str:
+    """The cache directory used when none is configured."""
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "pandas-vet")
+
+
+class ResultCache:
+    """Errors of checked sources, stored in `<directory>/results.sqlite3`.
+
+    The database connection is opened lazily in each process, so an instance
+    created before flake8 forks its workers can be used by all of them. Any
+    database error disables the cache for the rest of the run instead of
+    failing the lint.
+
+    Args:
+        directory (str): Directory holding the database
+        salt (str): Description of the rule set, part of every key
+        max_entries (int): Number of entries kept before evicting
+    """
+
+    def __init__(
+        self, directory: str, salt: str = "", max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.path = os.path.join(directory, "results.sqlite3")
+        # The syntax trees, and so the errors, differ between interpreters.
+        python = f"{sys.implementation.name}{sys.version_info[0]}.{sys.version_info[1]}"
+        self.salt = f"{__version__}\0{python}\0{salt}\0"
+        self.max_entries = max_entries
+        self._connection = None
+        self._pid = None
+        self.disabled = False
+
+    def key(self, source: str) -> str:
+        """Hash `source` together with the versions and the rule set."""
+        import hashlib
+
+        digest = hashlib.sha256(self.salt.encode())
+        digest.update(source.encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[List[Tuple[int, int, str]]]:
+        """Return the `(lineno, col, message)` errors stored under `key`.
+
+        Returns:
+            errors (List): The stored errors, or None on a cache miss
+        """
+        row = self._execute("SELECT errors FROM entries WHERE key = ?", (key,))
+        row = row and row.fetchone()
+        if row is None:
+            stats.COUNTERS["cache_misses"] += 1
+            return None
+        stats.COUNTERS["cache_hits"] += 1
+        self._execute(
+            "UPDATE entries SET used = julianday('now') WHERE key = ?", (key,)
+        )
+        return [tuple(error) for error in json.loads(row[0])]
+
+    def put(self, key: str, errors: List[Tuple[int, int, str]]):
+        """Store the `(lineno, col, message)` errors under `key`."""
+        self._execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, julianday('now'))",
+            (key, json.dumps(errors)),
+        )
+        self._execute(
+            "DELETE FROM entries WHERE key IN "
+            "(SELECT key FROM entries ORDER BY used DESC, rowid DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def _execute(self, query: str, parameters: tuple) -> Optional["sqlite3.Cursor"]:
+        import sqlite3
+
+        if self.disabled:
+            return None
+        try:
+            return self._connect().execute(query, parameters)
+        except (OSError, sqlite3.Error):
+            self.disabled = True
+            return None
+
+    def _connect(self) -> "sqlite3.Connection":
+        import sqlite3
+
+        if self._connection is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, errors TEXT NOT NULL, used REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_used ON entries (used)"
+            )
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
@@ -0,0 +1,255 @@
+"""The pandas-vet checks and their error codes.
+
+Every check is declared as a pattern with `engine.pattern`, and compiled
+into a `Matcher` returning the `Code` it found, or None. Checks that a
+pattern cannot express are registered with `engine.register` instead.
+"""
+import ast
+from typing import Optional
+
+from .engine import Code, pattern
+
+ARITHMETIC_METHODS = frozenset(
+    [
+        "add",
+        "sub",
+        "subtract",
+        "mul",
+        "multiply",
+        "div",
+        "divide",
+        "truediv",
+        "pow",
+        "floordiv",
+        "mod",
+    ]
+)
+
+COMPARISON_METHODS = frozenset(["gt", "lt", "ge", "le", "eq", "ne"])
+
+
+@pattern("PD001", ast.Import, imports=("pandas", "pd"))
+def check_import_name(node: ast.Import) -> Optional[Code]:
+    """Check AST for imports of pandas not using the preferred alias 'pd'.
+
+    Error/warning message to recommend use of 'pd' alias.
+
+    Args:
+        node (ast.Import): An AST node of type Import
+
+    Returns:
+        codes (List): PD001 for every such import in the statement
+    """
+
+
+@pattern("PD002", ast.Call, keyword=("inplace", True), agnostic=True)
+def check_inplace_false(node: ast.Call) -> Optional[Code]:
+    """Check AST for function calls using inplace=True keyword argument.
+
+    Disapproved:
+        df.method(inplace=True)
+
+    Approved:
+        df = df.method(inplace=False)
+
+    Error/warning message to recommend avoidance of inplace=True due to inconsistent behavior.
+
+    Args:
+        node (ast.Call): An AST node of type Call
+
+    Returns:
+        code (Code): PD002 if the call passes inplace=True, else None
+    """
+
+
+@pattern("PD003", ast.Call, "isnull")
+def check_for_isnull(node: ast.Call) -> Optional[Code]:
+    """Check AST for function calls using the isnull() method.
+
+    Disapproved:
+        df.isnull()
+
+    Approved:
+        df.isna()
+
+    Error/warning message to recommend usage of .isna() instead of .isnull().
+    Functionality is equivalent.
+
+    Args:
+        node (ast.Call): An AST node of type Call
+
+    Returns:
+        code (Code): PD003 if the call is a `.isnull()` method call, else None
+    """
+
+
+@pattern("PD004", ast.Call, "notnull")
+def check_for_notnull(node: ast.Call) -> Optional[Code]:
+    """Check AST for function calls using the notnull() method.
+
+    Disapproved:
+        df.notnull()
+
+    Approved:
+        df.notna()
+
+    Error/warning message to recommend usage of .notna() instead of .notnull().
+    Functionality is equivalent.
+
+    Args:
+        node (ast.Call): An AST node of type Call
+
+    Returns:
+        code (Code): PD004 if the call is a `.notnull()` method call, else None
+    """
+
+
+@pattern("PD005", ast.Call, *ARITHMETIC_METHODS, agnostic=True)
+def check_for_arithmetic_methods(node: ast.Call) -> Optional[Code]:
+    """
+    Check AST for occurence of explicit arithmetic methods.
+
+    Error/warning message to recommend use of binary arithmetic operators.
+    """
+
+
+@pattern("PD006", ast.Call, *COMPARISON_METHODS, agnostic=True)
+def check_for_comparison_methods(node: ast.Call) -> Optional[Code]:
+    """
+    Check AST for occurence of explicit comparison methods.
+
+    Error/warning message to recommend use of binary comparison operators.
+    """
+
+
+@pattern("PD007", ast.Subscript, "ix")
+def check_for_ix(node: ast.Subscript) -> Optional[Code]:
+    """
+    Check AST for use of deprecated `.ix[]` attribute on data frame.
+
+    Error/warning message to recommend use of explicit `.iloc[]` or `.loc[]` instead.
+    """
+
+
+@pattern("PD008", ast.Subscript, "at")
+def check_for_at(node: ast.Subscript) -> Optional[Code]:
+    """
+    Check AST for use of deprecated `.at[]` attribute on data frame.
+
+    Error/warning message to recommend use of explicit `.loc[]` instead.
+    """
+
+
+@pattern("PD009", ast.Subscript, "iat")
+def check_for_iat(node: ast.Subscript) -> Optional[Code]:
+    """
+    Check AST for use of deprecated `.iat[]` attribute on data frame.
+
+    Error/warning message to recommend use of explicit `.iloc[]` instead.
+    """
+
+
+@pattern("PD010", ast.Call, "pivot")
+def check_for_pivot(node: ast.Call) -> Optional[Code]:
+    """
+    Check AST for occurence of the `.pivot()` method on the pandas data frame.
+
+    Error/warning message to recommend use of `.pivot_table()` method instead.
+    This check should work for both the `df.pivot()` method, as well as the
+    `pd.pivot(df)` function.
+    """
+
+
+@pattern("PD010", ast.Call, "unstack")
+def check_for_unstack(node: ast.Call) -> Optional[Code]:
+    """
+    Check occurence of the `.unstack()` method on the pandas data frame.
+
+    Error/warning message to recommend use of `.pivot_table()` method.
+    """
+
+
+@pattern("PD013", ast.Call, "stack")
+def check_for_stack(node: ast.Call) -> Optional[Code]:
+    """
+    Check AST for occurence of the `.stack()` method on the pandas data frame.
+
+    Error/warning message to recommend use of `.melt()` method instead.
+    """
+
+
+@pattern("PD011", ast.Attribute, "values", called=False)
+def check_for_values(node: ast.Attribute) -> Optional[Code]:
+    """
+    Check occurence of the `.values` attribute on the pandas data frame.
+
+    Error/warning message to recommend use of `.to_numpy()` method for NumPy array.
+
+    In order to discriminate `df.values` (where this check should raise) vs
+    calls, like `dict().values()` (where this should not), the pattern
+    requires that the attribute is not called, which the matcher finds out
+    from `Visitor.parent`.
+
+    .. seealso:: `Visitor.check`.
+    """
+
+
+@pattern("PD012", ast.Call, "read_table")
+def check_for_read_table(node: ast.Call) -> Optional[Code]:
+    """
+    Check AST for occurence of the `.read_table()` method on the pandas object.
+
+    Error/warning message to recommend use of `.read_csv()` method instead.
+    """
+
+
+@pattern("PD015", ast.Call, "merge", function="merge", min_args=2)
+def check_for_merge(node: ast.Call) -> Optional[Code]:
+    """
+    Check for use of `.merge()` method on the pandas object.
+
+    Error/warning message to recommend use of `df.merge()` method instead.
+
+    The pandas function is recognized through the `Visitor.symbols` of the
+    module, whatever its name: `pd.merge(left, right)`, `pandas.merge(left,
+    right)` after `import pandas` or `merge(left, right)` after `from pandas
+    import merge`. The call needs at least two arguments (left, right, ...).
+    """
+
+
+@pattern("PD901", ast.Name, "df", store=True)
+def check_for_df(node: ast.Name) -> Optional[Code]:
+    """
+    Check for variables named `df`
+    """
+
+
+PD001 = Code("PD001 pandas should always be imported as 'import pandas as pd'")
+
+PD002 = Code("PD002 'inplace = True' should be avoided; it has inconsistent behavior")
+
+PD003 = Code("PD003 '.isna' is preferred to '.isnull'; functionality is equivalent")
+
+PD004 = Code("PD004 '.notna' is preferred to '.notnull'; functionality is equivalent")
+PD005 = Code("PD005 Use arithmetic operator instead of method")
+
+PD006 = Code("PD006 Use comparison operator instead of method")
+
+PD007 = Code("PD007 '.ix' is deprecated; use more explicit '.loc' or '.iloc'")
+PD008 = Code("PD008 Use '.loc' instead of '.at'.  If speed is important, use numpy.")
+PD009 = Code("PD009 Use '.iloc' instead of '.iat'.  If speed is important, use numpy.")
+PD010 = Code(
+    "PD010 '.pivot_table' is preferred to '.pivot' or '.unstack'; "
+    "provides same functionality"
+)
+PD011 = Code("PD011 Use '.to_numpy()' instead of '.values'; 'values' is ambiguous")
+PD012 = Code(
+    "PD012 '.read_csv' is preferred to '.read_table'; provides same functionality"
+)
+PD013 = Code("PD013 '.melt' is preferred to '.stack'; provides same functionality")
+PD015 = Code(
+    "PD015 Use '.merge' method instead of 'pd.merge' function. "
+    "They have equivalent functionality."
+)
+
+PD901 = Code("PD901 'df' is a bad variable name. Be kinder to your future self.")
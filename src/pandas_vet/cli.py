@@ -0,0 +1,309 @@
+"""Command line interface running only the pandas-vet checks.
+
+`pandas-vet PATH ...` reports the same errors as `flake8 --select PD`
+without the startup, option parsing and pycodestyle processing of flake8.
+Files are parsed and checked in a pool of worker processes, largest files
+first, so that a single huge file does not end up last in the queue.
+With `--diff REF`, only the lines changed since a git revision are checked.
+Jupyter notebooks are checked cell by cell, see `notebook`.
+"""
+import argparse
+import ast
+import os
+import subprocess
+import sys
+import tokenize
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from . import PandasVetException, VetPlugin, diff, disabled_by_default, notebook
+from .__about__ import __version__
+from .cache import DEFAULT_MAX_ENTRIES, default_directory
+from .diff import Hunk
+
+NOTEBOOK = ".ipynb"
+
+DEFAULT_EXCLUDE = (
+    ".svn",
+    "CVS",
+    ".bzr",
+    ".hg",
+    ".git",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".eggs",
+    "*.egg",
+    ".venv",
+    "venv",
+)
+
+
+def find_files(paths: Iterable[str], exclude: Sequence[str]) -> Iterator[str]:
+    """Yield the Python files and notebooks given or contained in `paths`.
+
+    Files passed explicitly are always yielded, directories are searched
+    recursively for `.py` and `.ipynb` files, skipping the names matching
+    `exclude`.
+    """
+
+    def excluded(name):
+        return any(fnmatch(name, pattern) for pattern in exclude)
+
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not excluded(d))
+            for name in sorted(files):
+                if name.endswith((".py", NOTEBOOK)) and not excluded(name):
+                    yield os.path.join(root, name)
+
+
+def is_selected(code: str, select: Sequence[str], ignore: Sequence[str]) -> bool:
+    """Whether `code` is reported, using the longest matching prefix like flake8."""
+    selected = max((len(s) for s in select if code.startswith(s)), default=-1)
+    ignored = max((len(i) for i in ignore if code.startswith(i)), default=-1)
+    return selected > ignored
+
+
+def check_file(path: str, hunks: List[Hunk] = None) -> List[Tuple]:
+    """Check one file, returning its `(lineno, col, message)` errors.
+
+    Unreadable files and syntax errors are reported like flake8 does, as
+    E902 and E999 errors. The errors of notebooks are `(cell, lineno, col,
+    message)` tuples, see `notebook.check_notebook`. When the changed line
+    ranges `hunks` are given (see `diff.changed_lines`), only the top-level
+    statements touching them are walked and only the errors on changed
+    lines are returned.
+    """
+    try:
+        if path.endswith(NOTEBOOK):
+            return notebook.check_notebook(path)
+        with tokenize.open(path) as f:
+            lines = f.readlines()
+    except (OSError, SyntaxError, ValueError) as e:
+        return [(1, 0, f"E902 {type(e).__name__}: {e}")]
+    try:
+        if hunks is None:
+            return [e[:3] for e in VetPlugin(None, lines, path).run()]
+        return _check_hunks(path, "".join(lines), hunks)
+    except PandasVetException as e:
+        cause = e.args[0]
+        if not isinstance(cause, SyntaxError):
+            raise
+        return [(cause.lineno or 1, 0, f"E999 SyntaxError: {cause.msg}")]
+
+
+def _check_hunks(path: str, source: str, hunks: List[Hunk]):
+    VetPlugin.load()
+    if VetPlugin.prefilter is not None and VetPlugin.prefilter.search(source) is None:
+        return []
+    try:
+        module = ast.parse(source, path)
+    except SyntaxError as e:
+        raise PandasVetException(e)
+    # The pruned tree is walked within the whole module, which the flake8
+    # entry point `VetPlugin` cannot take.
+    errors = VetPlugin.visitor().check(diff.prune(module, hunks), module)
+    return [e[:3] for e in errors if diff.touches(hunks, e[0], e[0])]
+
+
+def _size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def check_files(
+    paths: Sequence[str],
+    jobs: int = 1,
+    hunks: Dict[str, List[Hunk]] = None,
+    **configuration,
+) -> Iterator[Tuple[str, List[Tuple]]]:
+    """Check `paths` in `jobs` processes, yielding `(path, errors)` pairs.
+
+    The files are submitted largest first and yielded in that order. The
+    cells of notebooks are submitted as separate tasks, so a large notebook
+    is checked in parallel too. `hunks` optionally maps paths to their
+    changed line ranges, see `check_file`. `configuration` is passed to
+    `VetPlugin.configure` in every worker process; the calling process is
+    expected to be configured already.
+    """
+    paths = sorted(paths, key=_size, reverse=True)
+    hunks = hunks or {}
+    if jobs <= 1 or (len(paths) <= 1 and not any(p.endswith(NOTEBOOK) for p in paths)):
+        for path in paths:
+            yield path, check_file(path, hunks.get(path))
+        return
+    with ProcessPoolExecutor(
+        jobs, initializer=_initialize_worker, initargs=(configuration,)
+    ) as executor:
+        submitted = [(path, _submit(executor, path, hunks)) for path in paths]
+        for path, futures in submitted:
+            yield path, [e for future in futures for e in future.result()]
+
+
+def _submit(executor: Executor, path: str, hunks: Dict) -> List[Future]:
+    if not path.endswith(NOTEBOOK):
+        return [executor.submit(check_file, path, hunks.get(path))]
+    try:
+        return notebook.submit(executor, path)
+    except (OSError, ValueError) as e:
+        unreadable = Future()
+        unreadable.set_result([(1, 0, f"E902 {type(e).__name__}: {e}")])
+        return [unreadable]
+
+
+def _location(*position: int) -> str:
+    *cell, lineno, col = position
+    return ":".join([*(f"cell_{c}" for c in cell), str(lineno), str(col + 1)])
+
+
+def _excluded(path: str, exclude: Sequence[str]) -> bool:
+    parts = os.path.normpath(path).split(os.sep)
+    return any(fnmatch(part, pattern) for part in parts for pattern in exclude)
+
+
+def _initialize_worker(configuration: dict):
+    VetPlugin.configure(**configuration)
+
+
+def _codes(value: str) -> List[str]:
+    return [code.strip() for code in value.split(",") if code.strip()]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the `pandas-vet` command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="pandas-vet",
+        description="Lint pandas code with the pandas-vet checks only.",
+    )
+    parser.add_argument("paths", nargs="*", default=["."], metavar="PATH")
+    parser.add_argument(
+        "--version", action="version", version=f"%(prog)s {__version__}"
+    )
+    parser.add_argument(
+        "--annoy",
+        action="store_true",
+        help="Activate the checks that are off by default (PD9xx).",
+    )
+    parser.add_argument(
+        "--select",
+        type=_codes,
+        default=["PD"],
+        help="Comma-separated list of error codes to enable. (Default: PD)",
+    )
+    parser.add_argument(
+        "--ignore",
+        type=_codes,
+        default=[],
+        help="Comma-separated list of error codes to ignore.",
+    )
+    parser.add_argument(
+        "--exclude",
+        type=_codes,
+        default=list(DEFAULT_EXCLUDE),
+        help="Comma-separated list of file or directory name patterns to skip.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes checking files. (Default: %(default)s)",
+    )
+    parser.add_argument(
+        "--skip-agnostic",
+        action="store_true",
+        help="See the --pandas-vet-skip-agnostic flake8 option.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=default_directory(),
+        help="Directory of the result cache. (Default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the result cache.",
+    )
+    parser.add_argument(
+        "--loop-only",
+        type=_codes,
+        default=[],
+        help="See the --pandas-vet-loop-only flake8 option.",
+    )
+    parser.add_argument(
+        "--escalate",
+        type=_codes,
+        default=[],
+        help="See the --pandas-vet-escalate flake8 option.",
+    )
+    parser.add_argument(
+        "--diff",
+        metavar="REF",
+        help="Only check the files changed since the git revision REF, and only "
+        "report errors on changed lines.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="-",
+        default=os.environ.get("PANDAS_VET_PROFILE"),
+        metavar="PATH",
+        help="See the --pandas-vet-profile flake8 option.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Run the command line interface, returning the exit status."""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv[:1] == ["serve"]:
+        from . import server
+
+        return server.main(argv[1:])
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    ignore = list(args.ignore)
+    if not args.annoy:
+        ignore.extend(disabled_by_default)
+    configuration = dict(
+        skip_agnostic=args.skip_agnostic,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        cache_size=DEFAULT_MAX_ENTRIES,
+        profile=args.profile,
+        select=partial(is_selected, select=args.select, ignore=ignore),
+        loop_only=args.loop_only,
+        escalate=args.escalate,
+    )
+    VetPlugin.configure(**configuration)
+
+    if args.diff is None:
+        hunks = None
+        paths = list(find_files(args.paths, args.exclude))
+    else:
+        try:
+            hunks = diff.changed_lines(args.diff, args.paths)
+        except (OSError, subprocess.CalledProcessError) as e:
+            parser.error(f"git diff failed: {getattr(e, 'stderr', None) or e}")
+        paths = [path for path in sorted(hunks) if not _excluded(path, args.exclude)]
+    results = dict(check_files(paths, args.jobs, hunks, **configuration))
+    found = 0
+    for path in paths:
+        for *position, message in sorted(results[path]):
+            code = message.split(" ", 1)[0]
+            if not code.startswith("E9") and not is_selected(code, args.select, ignore):
+                continue
+            found += 1
+            print(f"{path}:{_location(*position)}: {message}")
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
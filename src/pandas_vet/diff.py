@@ -0,0 +1,94 @@
+"""Changed files and lines of a git working tree, for `pandas-vet --diff`.
+
+`changed_lines` runs plain `git diff` against a ref and returns the line
+ranges added or modified in every Python file. The command line interface
+then only checks those files, only walks the top-level statements touching
+a changed range, and only reports the errors found on changed lines.
+"""
+import ast
+import bisect
+import re
+import subprocess
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+# A range of changed lines, first and last included.
+Hunk = Tuple[int, int]
+
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@")
+
+
+def changed_lines(ref: str, paths: Sequence[str] = ()) -> Dict[str, List[Hunk]]:
+    """Return the changed line ranges of the Python files under `paths`.
+
+    The working tree is compared with `ref`, so committed, staged and
+    unstaged changes are all included; untracked files are not. Deleted
+    files and lines are ignored, since they cannot hold new errors.
+
+    Args:
+        ref (str): Any git revision, e.g. "origin/main" or "HEAD~3"
+        paths (Sequence[str]): Files or directories to restrict the diff to
+
+    Returns:
+        hunks (Dict): The sorted `(first, last)` line ranges of every changed
+            file, keyed by its path relative to the current directory
+    """
+    command = [
+        "git",
+        "diff",
+        "--no-color",
+        "--no-ext-diff",
+        # `parse_diff` expects the default prefixes, whatever diff.noprefix
+        # or diff.mnemonicPrefix say.
+        "--src-prefix=a/",
+        "--dst-prefix=b/",
+        "--relative",
+        "--unified=0",
+        "--diff-filter=d",
+        ref,
+        "--",
+        *paths,
+    ]
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return parse_diff(output.splitlines())
+
+
+def parse_diff(lines: Iterable[str]) -> Dict[str, List[Hunk]]:
+    """Parse the output of `git diff --unified=0`, see `changed_lines`."""
+    hunks = {}
+    current = None
+    for line in lines:
+        if line.startswith("+++ "):
+            name = line[4:]
+            current = None
+            if name.startswith("b/") and name.endswith(".py"):
+                current = hunks.setdefault(name[2:], [])
+            continue
+        match = HUNK_HEADER.match(line)
+        if match and current is not None:
+            start, count = int(match[1]), int(match[2] or 1)
+            if count:
+                current.append((start, start + count - 1))
+    return {path: sorted(ranges) for path, ranges in hunks.items() if ranges}
+
+
+def touches(hunks: List[Hunk], first: int, last: int) -> bool:
+    """Whether lines `first` to `last` overlap one of the sorted `hunks`."""
+    i = bisect.bisect_right(hunks, (last, float("inf")))
+    return i > 0 and hunks[i - 1][1] >= first
+
+
+def prune(tree: ast.Module, hunks: List[Hunk]) -> ast.Module:
+    """A module of the top-level statements of `tree` touching `hunks`.
+
+    `tree` is left whole, so that checks can still find the symbols of the
+    module and the statements following the kept ones, see `Visitor.check`.
+    """
+    body = []
+    for statement in tree.body:
+        first = min(
+            [statement.lineno]
+            + [d.lineno for d in getattr(statement, "decorator_list", ())]
+        )
+        if touches(hunks, first, statement.end_lineno):
+            body.append(statement)
+    return ast.Module(body=body, type_ignores=tree.type_ignores)
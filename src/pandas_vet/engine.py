@@ -0,0 +1,1022 @@
+"""The rule engine: registry, dispatch table, tree walk and findings.
+
+This module and `checks` are only imported when the first file is checked
+(see `VetPlugin.load`), so loading the flake8 plugin stays cheap.
+"""
+import ast
+import functools
+import operator
+import re
+import warnings
+from array import array
+from collections import namedtuple
+from functools import partial
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+)
+
+from . import VetPlugin
+from .cache import DEFAULT_MAX_ENTRIES, ResultCache
+from .symbols import Symbols
+
+
+class Visitor:
+    """
+    Walks a syntax tree and runs the `check` functions registered for its nodes.
+
+    The tree is walked with an explicit stack instead of recursion, so deeply
+    nested code (long method chains, big literals) cannot exceed the
+    interpreter's recursion limit. Nodes are checked after their children,
+    in the order `ast.NodeVisitor` would visit them. Only the node types
+    present in `dispatch` are checked: their dispatch key (usually the
+    attribute name involved) selects the checks to run. See `register`.
+
+    Every finding is recorded with its loop `depth`, when the ancestors are
+    tracked. The codes in `loop_only` are only reported at a depth of 1 or
+    more, and the messages of the codes in `escalate` mention their depth,
+    see `Findings`. Both hold `Code.index` values.
+    """
+
+    def __init__(
+        self,
+        dispatch: Dict = None,
+        track_ancestors: bool = None,
+        loop_only: FrozenSet[int] = frozenset(),
+        escalate: FrozenSet[int] = frozenset(),
+    ):
+        self.errors = Findings()
+        self.ancestors = []
+        # The `(depth, loops)` of every ancestor, see `depth` and `loops`.
+        self.nesting = []
+        self.tree = None
+        self.module = None
+        self.used_module = False
+        self._symbols = None
+        self.dispatch = DISPATCH if dispatch is None else dispatch
+        if track_ancestors is None:
+            track_ancestors = any(rule.context for rule in RULES)
+        self.track_ancestors = track_ancestors or bool(loop_only or escalate)
+        self.loop_only = loop_only
+        self.escalate = escalate
+
+    @property
+    def parent(self):
+        """The parent of the node currently being checked, if any."""
+        return self.ancestors[-1] if self.ancestors else None
+
+    def loops(self, node: ast.AST) -> List[ast.AST]:
+        """The loops running `node` on each of their iterations, outermost first.
+
+        A node is repeated by a loop when it is in the body of the loop, or
+        in the condition of a `while` loop, but not in the iterable or the
+        target of a `for` loop or in the `else` clause. Only the loops of the
+        innermost function or class count. Like `parent`, this needs the
+        ancestors, so only checks registered with `context=True` can call it,
+        and only for the node being checked.
+        """
+        if not self.ancestors:
+            return []
+        depth, loops = self.nesting[-1]
+        parent = self.parent
+        if type(parent) in NESTING:
+            depth, loops = _nest(parent, node, depth, loops)
+        return list(loops)
+
+    def depth(self, node: ast.AST) -> int:
+        """How many times `node` is repeated: its loop depth.
+
+        Every loop of `loops` counts, as well as the generators of the
+        comprehensions running it (`[x for a in b for x in a]` repeats `x`
+        twice) and lambdas, usually called once per element or row, like
+        in `.apply(lambda row: ...)`. Function and class definitions start
+        again from 0. The depth of every ancestor is kept in `nesting`, so
+        this costs the same at any depth of the tree.
+        """
+        if not self.ancestors:
+            return 0
+        depth, loops = self.nesting[-1]
+        parent = self.parent
+        if type(parent) in NESTING:
+            depth, loops = _nest(parent, node, depth, loops)
+        return depth
+
+    @property
+    def symbols(self) -> Symbols:
+        """The pandas names of the module being checked, see `symbols.Symbols`.
+
+        The table is built on first use, once per module, so modules where no
+        check needs it do not pay for the scan.
+        """
+        self.used_module = True
+        if self._symbols is None:
+            self._symbols = Symbols(self.module)
+        return self._symbols
+
+    def next_statement(self, node: ast.stmt) -> Optional[ast.stmt]:
+        """The statement following `node` in the same block, if any.
+
+        The statements following the top-level statements of the tree are
+        looked up in the `module`, which the tree can be a part of.
+        """
+        parent = self.parent
+        if parent is self.tree and self.module is not self.tree:
+            self.used_module = True
+            parent = self.module
+        for field in ("body", "orelse", "finalbody"):
+            block = getattr(parent, field, None)
+            if type(block) is list:
+                for position, statement in enumerate(block):
+                    if statement is node:
+                        following = position + 1
+                        return block[following] if following < len(block) else None
+        return None
+
+    def check(self, tree, module: ast.Module = None):
+        """Check every node of `tree` and return the errors found.
+
+        While the children of a node are walked, the node sits on top of the
+        `ancestors` stack, so checks registered with `context=True` can look
+        up the syntax tree to decide whether or not to raise. The stack is
+        only maintained when such a check is registered, and nothing is
+        stored on the nodes themselves.
+
+        Checks can also read `symbols` to learn which names are bound to
+        pandas or to DataFrames. They are found in the whole `module` when
+        `tree` only holds some of its statements, as with `--diff` or the
+        server, which can check the same module in several calls: the
+        symbols are only scanned again for another module. Afterwards,
+        `used_module` tells whether the errors depend on the module beyond
+        `tree`.
+
+        .. seealso:: `check_for_values`, `check_for_merge`.
+        """
+        if module is None:
+            module = tree
+        if module is not self.module:
+            self.module = module
+            self._symbols = None
+        self.errors = Findings(self.escalate)
+        self.ancestors = ancestors = []
+        self.nesting = nesting = []
+        self.tree = tree
+        self.used_module = False
+        track_ancestors = self.track_ancestors
+        dispatch = self.dispatch
+        run_checks = self.run_checks
+        stack = [tree]
+        pop, push = stack.pop, stack.append
+        while stack:
+            node = pop()
+            if type(node) is tuple:
+                # All the children of the node have been checked.
+                (node,) = node
+                if track_ancestors:
+                    ancestors.pop()
+                    nesting.pop()
+                table = dispatch.get(type(node))
+                if table is not None:
+                    run_checks(node, table)
+                continue
+
+            size = len(stack)
+            push((node,))
+            for field in _child_fields(type(node)):
+                value = getattr(node, field, None)
+                if isinstance(value, list):
+                    for item in reversed(value):
+                        if isinstance(item, ast.AST):
+                            push(item)
+                elif isinstance(value, ast.AST):
+                    push(value)
+            if len(stack) == size + 1:
+                # A leaf, check it right away.
+                pop()
+                table = dispatch.get(type(node))
+                if table is not None:
+                    run_checks(node, table)
+            elif track_ancestors:
+                if not ancestors:
+                    nesting.append((0, ()))
+                elif type(ancestors[-1]) in NESTING:
+                    nesting.append(_nest(ancestors[-1], node, *nesting[-1]))
+                else:
+                    nesting.append(nesting[-1])
+                ancestors.append(node)
+        return self.errors
+
+    def run_checks(self, node, table):
+        """Run the checks registered for `node`.
+
+        Args:
+            node (ast.AST): The node being checked
+            table (Tuple): The `(key, keyed, unkeyed)` entry of `dispatch`
+                for the type of the node
+        """
+        key, keyed, unkeyed = table
+        rules = keyed.get(key(node), unkeyed) if key is not None else unkeyed
+        for rule in rules:
+            found = rule.check(node, self) if rule.context else rule.check(node)
+            if found is None:
+                continue
+            if type(found) is Code:
+                self.report(found, node)
+            else:
+                for code in found:
+                    self.report(code, node)
+
+    def report(self, code: "Code", node: ast.AST):
+        """Record `code` at the position and loop depth of `node`."""
+        depth = self.depth(node) if self.track_ancestors else 0
+        if depth == 0 and code.index in self.loop_only:
+            return
+        self.errors.append(code, node.lineno, node.col_offset, depth)
+
+
+# Fields never holding nodes that a rule can be registered for: expression
+# contexts, operators and plain strings.
+_SKIPPED_FIELDS = frozenset(
+    ["ctx", "op", "ops", "id", "attr", "arg", "name", "asname", "module", "kind"]
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _child_fields(node_type: type) -> Tuple[str, ...]:
+    """The fields of `node_type` to walk, in reverse order for the stack."""
+    return tuple(
+        field for field in reversed(node_type._fields) if field not in _SKIPPED_FIELDS
+    )
+
+
+# Statements running their body repeatedly.
+LOOPS = frozenset([ast.For, ast.AsyncFor, ast.While])
+
+# Definitions whose body does not run where it is defined.
+SCOPES = frozenset([ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef])
+
+# Expressions evaluating an element once per item of their generators.
+COMPREHENSIONS = frozenset([ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp])
+
+# The nodes changing the loop depth or the loops of some of their children.
+NESTING = LOOPS | SCOPES | COMPREHENSIONS | {ast.comprehension, ast.Lambda}
+
+
+def _nest(
+    parent: ast.AST, child: ast.AST, depth: int, loops: Tuple[ast.AST, ...]
+) -> Tuple[int, Tuple[ast.AST, ...]]:
+    """The `(depth, loops)` of `child`, from those of its `parent`.
+
+    See `Visitor.depth` and `Visitor.loops`.
+    """
+    kind = type(parent)
+    if kind in SCOPES:
+        return 0, ()
+    if kind in LOOPS:
+        if _repeats(parent, child):
+            return depth + 1, loops + (parent,)
+    elif kind in COMPREHENSIONS:
+        generators = parent.generators
+        if child in generators:
+            depth += generators.index(child)
+        else:
+            depth += len(generators)
+    elif kind is ast.comprehension:
+        depth += child is not parent.iter
+    elif kind is ast.Lambda:
+        depth += child is parent.body
+    return depth, loops
+
+
+def _repeats(loop: ast.AST, child: ast.AST) -> bool:
+    """Whether the `child` node of `loop` runs on every iteration."""
+    if any(child is statement for statement in loop.orelse):
+        return False
+    return type(loop) is ast.While or (
+        child is not loop.iter and child is not loop.target
+    )
+
+
+def _attribute_name(node: ast.AST) -> Optional[str]:
+    return node.attr if isinstance(node, ast.Attribute) else None
+
+
+def _called_name(node: ast.AST) -> Optional[str]:
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return node.id if isinstance(node, ast.Name) else None
+
+
+# How the dispatch key of each node type is computed. Rules for other node
+# types cannot have triggers and run on every node of their type.
+DISPATCH_KEYS = {
+    ast.Call: lambda node: _called_name(node.func),
+    ast.Assign: lambda node: _called_name(getattr(node.value, "func", None)),
+    ast.Subscript: lambda node: _attribute_name(node.value),
+    ast.Attribute: operator.attrgetter("attr"),
+    ast.Name: operator.attrgetter("id"),
+}
+
+
+error = namedtuple("Error", ["lineno", "col", "message", "type"])
+
+# Every `Code`, indexed by `Code.index`.
+CODES: List["Code"] = []
+
+
+class Code:
+    """An error code and its message, e.g. `PD003`.
+
+    Checks return the `Code` they found, and the `Visitor` records it at the
+    position of the node. Calling a code builds the error flake8 expects,
+    so `PD003(1, 9)` equals the error reported on line 1, column 9.
+    """
+
+    __slots__ = ("index", "message")
+
+    def __init__(self, message: str):
+        self.message = message
+        self.index = len(CODES)
+        CODES.append(self)
+
+    @property
+    def code(self) -> str:
+        """The error code, e.g. "PD003"."""
+        return self.message.split(" ", 1)[0]
+
+    def __call__(self, lineno: int, col: int) -> error:
+        return error(lineno, col, self.message, VetPlugin)
+
+    def __repr__(self):
+        return f"<Code {self.code}>"
+
+
+class Findings:
+    """The errors found in a tree, stored as `(code index, line, col, depth)` integers.
+
+    Iterating yields the `(lineno, col, message, type)` errors of flake8,
+    built one at a time from the `CODES` table, so a file with thousands of
+    findings holds one array rather than thousands of tuples. The messages
+    of the codes whose index is in `escalate` end with their loop depth
+    when it is not 0, e.g. "PD008 ... (in 2 nested loops)".
+    """
+
+    __slots__ = ("_records", "escalate")
+
+    def __init__(self, escalate: FrozenSet[int] = frozenset()):
+        self._records = array("l")
+        self.escalate = escalate
+
+    def append(self, code: Code, lineno: int, col: int, depth: int = 0):
+        """Record `code` at `lineno`, `col` and loop `depth`."""
+        self._records.extend((code.index, lineno, col, depth))
+
+    def __len__(self):
+        return len(self._records) // 4
+
+    def __iter__(self) -> Iterator[error]:
+        for found, _ in self.with_depth():
+            yield found
+
+    def with_depth(self) -> Iterator[Tuple[error, int]]:
+        """Yield the errors together with their loop depth."""
+        records = self._records
+        escalate = self.escalate
+        for i in range(0, len(records), 4):
+            index, lineno, col, depth = records[i : i + 4]
+            found = CODES[index](lineno, col)
+            if depth and index in escalate:
+                loops = "a loop" if depth == 1 else f"{depth} nested loops"
+                found = found._replace(message=f"{found.message} (in {loops})")
+            yield found, depth
+
+    def __eq__(self, other):
+        if isinstance(other, Findings):
+            return self._records == other._records
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Findings({list(self)!r})"
+
+
+class Rule(NamedTuple):
+    """A `check` function together with the nodes that can trigger it.
+
+    Attributes:
+        code (str): The error code reported by the check, e.g. "PD003"
+        check (Callable): Function taking a node and returning the `Code` it
+            found, a list of codes or None
+        node_type (type): The `ast` node class the check inspects
+        triggers (frozenset): Dispatch keys (attribute or variable names) that
+            can make the check fire. An empty set means the check runs on
+            every node of `node_type`.
+        context (bool): Whether the check also receives the `Visitor`, e.g.
+            to look at `Visitor.parent` or `Visitor.symbols`.
+        keywords (frozenset): Words that appear in any source the check can
+            fire on. Defaults to `triggers`.
+        agnostic (bool): Whether the check applies to code that does not
+            use pandas at all, e.g. `inplace=True` of another library.
+        pattern (NodePattern): The pattern the check matches, for rules
+            declared with `pattern`
+        pack (str): The namespace of the rule pack defining the rule, for
+            rules not built into pandas-vet. See `load_packs`.
+    """
+
+    code: str
+    check: Callable
+    node_type: type
+    triggers: FrozenSet[str] = frozenset()
+    context: bool = False
+    keywords: FrozenSet[str] = frozenset()
+    agnostic: bool = False
+    pattern: Optional["NodePattern"] = None
+    pack: Optional[str] = None
+
+
+RULES: List[Rule] = []
+
+
+def register(
+    code: str,
+    node_type: type,
+    *triggers: str,
+    context: bool = False,
+    keywords: Tuple[str, ...] = (),
+    agnostic: bool = False,
+) -> Callable:
+    """Decorator adding a `check` function to the rule registry.
+
+    Args:
+        code (str): The error code reported by the check
+        node_type (type): The `ast` node class the check inspects
+        *triggers (str): Dispatch keys that can make the check fire. For
+            `ast.Call` and `ast.Subscript` nodes this is the accessed
+            attribute (`df.isnull()` -> "isnull", `df.ix[]` -> "ix") or, for
+            calls, the function name (`merge(a, b)` -> "merge"), for
+            `ast.Attribute` nodes the attribute itself, for `ast.Name`
+            nodes the variable name and for `ast.Assign` nodes the method
+            or function called by the assigned value (`df = pd.concat(...)`
+            -> "concat"). Without triggers the check runs on every node of
+            `node_type`. Other node types cannot have triggers, and
+            expression contexts and operators (`ast.Load`, `ast.Add`, ...)
+            are not checked at all.
+        context (bool): Whether the check needs the `Visitor` as second
+            argument to look at the ancestors of the node or at the
+            `Visitor.symbols` of the module. Defaults to False.
+        keywords (Tuple[str, ...]): Words that must appear in the source for
+            the check to fire, used by the source pre-filter. Defaults to the
+            triggers. A check without triggers or keywords disables the
+            pre-filter.
+        agnostic (bool): Whether the check is not specific to pandas, like
+            PD002 `inplace=True`. See `--pandas-vet-skip-agnostic`.
+
+    Returns:
+        decorator (Callable): Registers the check and returns it unchanged
+    """
+
+    if triggers and node_type not in DISPATCH_KEYS:
+        raise ValueError(f"{node_type.__name__} nodes have no dispatch key")
+
+    def decorator(check):
+        RULES.append(
+            Rule(
+                code,
+                check,
+                node_type,
+                frozenset(triggers),
+                context,
+                frozenset(keywords or triggers),
+                agnostic,
+            )
+        )
+        return check
+
+    return decorator
+
+
+class NodePattern(NamedTuple):
+    """The nodes a rule reports, described by constraints instead of code.
+
+    A node matches when it is of `node_type`, its dispatch key is in `names`
+    (see `register`) and it meets every other constraint given. Patterns
+    are compiled into a `Matcher`.
+
+    Attributes:
+        code (str): The error code reported on matching nodes
+        node_type (type): The `ast` node class to match
+        names (frozenset): Dispatch keys to match. For `ast.Call` and
+            `ast.Subscript` nodes, the name must be an attribute, as in
+            `df.isnull()`, unless `function` is given.
+        keyword (Tuple[str, object, ...]): A keyword argument the call passes
+            with one of the given constant values, e.g. `("inplace", True)`
+            or `("axis", 1, "columns")`
+        min_args (int): Minimum number of positional arguments of the call
+        function (str): The pandas function the call runs, through
+            `Visitor.symbols`, e.g. "merge" for `pd.merge(...)`
+        called (bool): Whether the node must (True) or must not (False) be
+            the function of a call, as `values` is in `d.values()`
+        store (bool): Whether the name must be assigned to
+        imports (Tuple[str, str]): A module imported under another name than
+            the given one, e.g. `("pandas", "pd")`. Reported once per such
+            module of the import statement.
+    """
+
+    code: str
+    node_type: type
+    names: FrozenSet[str] = frozenset()
+    keyword: Optional[Tuple] = None
+    min_args: int = 0
+    function: Optional[str] = None
+    called: Optional[bool] = None
+    store: bool = False
+    imports: Optional[Tuple[str, str]] = None
+
+    @property
+    def context(self) -> bool:
+        """Whether matching needs the `Visitor`."""
+        return self.function is not None or self.called is not None
+
+    def predicates(self) -> Tuple[Tuple, ...]:
+        """The tests of the pattern beyond its dispatch, as `PREDICATES` entries.
+
+        Every test is a tuple of its name in `PREDICATES` and arguments, so
+        patterns sharing a test share the tuple. They are sorted in the
+        order of `PREDICATES`, cheapest first.
+        """
+        tests = []
+        if self.names and self.function is None and self.node_type in _METHODS:
+            tests.append(("method",))
+        if self.store:
+            tests.append(("store",))
+        if self.called is not None:
+            tests.append(("called", self.called))
+        if self.min_args:
+            tests.append(("min_args", self.min_args))
+        if self.keyword is not None:
+            tests.append(("keyword", *self.keyword))
+        if self.imports is not None:
+            tests.append(("imports", *self.imports))
+        if self.function is not None:
+            tests.append(("function", self.function))
+        return tuple(sorted(tests, key=lambda test: _RANKS[test[0]]))
+
+
+# The node types whose dispatch key can be an attribute or a plain name.
+_METHODS = {ast.Call: "func", ast.Subscript: "value"}
+
+
+def _names(node, context, names) -> bool:
+    return DISPATCH_KEYS[type(node)](node) in names
+
+
+def _method(node, context) -> bool:
+    return type(getattr(node, _METHODS[type(node)])) is ast.Attribute
+
+
+def _store(node, context) -> bool:
+    return type(node.ctx) is ast.Store
+
+
+def _called(node, context, called) -> bool:
+    parent = context.parent if context is not None else None
+    return (type(parent) is ast.Call and parent.func is node) is called
+
+
+def _min_args(node, context, count) -> bool:
+    return len(node.args) >= count
+
+
+def _keyword(node, context, name, *values) -> bool:
+    for kw in node.keywords:
+        if kw.arg == name and type(kw.value) is ast.Constant:
+            found = kw.value.value
+            return any(
+                type(found) is type(value) and found == value for value in values
+            )
+    return False
+
+
+def _imports(node, context, module, name) -> int:
+    return sum(alias.name == module and alias.asname != name for alias in node.names)
+
+
+def _function(node, context, function) -> bool:
+    symbols = context.symbols if context is not None else Symbols()
+    return symbols.pandas_function(node) == function
+
+
+# The tests of `NodePattern.predicates`, taking the node, the `Visitor` (or
+# None) and the arguments of the test. A test returns how many times the
+# node matches it: 0 or 1, except for "imports".
+PREDICATES: Dict[str, Callable[..., int]] = {
+    "names": _names,
+    "method": _method,
+    "store": _store,
+    "called": _called,
+    "min_args": _min_args,
+    "keyword": _keyword,
+    "imports": _imports,
+    "function": _function,
+}
+
+_RANKS = {name: rank for rank, name in enumerate(PREDICATES)}
+
+
+class Matcher:
+    """A check reporting the codes of several patterns on a node.
+
+    The patterns are merged into a decision tree whose edges are the tests
+    of `NodePattern.predicates`: patterns starting with the same tests share
+    a branch, so each of those tests runs once per node however many
+    patterns use it. The tree is compiled into nested closures on the first
+    call, once the `Code` of every pattern exists.
+
+    A `dispatched` matcher only runs on the nodes `compile_rules` dispatched
+    to it, so it does not test the names of the patterns again.
+
+    Calling a matcher returns None, the `Code` of the only matching pattern
+    or the codes of all the matching patterns in declaration order, like
+    any other check.
+    """
+
+    def __init__(self, patterns: Tuple[NodePattern, ...], dispatched: bool = False):
+        self.patterns = tuple(patterns)
+        self.dispatched = dispatched
+        self._match = None
+        # Replaced by the name of the decorated function, see `pattern`.
+        self.__name__ = self.__qualname__ = "match"
+
+    def __call__(self, node: ast.AST, context: "Visitor" = None):
+        if self._match is None:
+            self._match = self.compile()
+        found = []
+        self._match(node, context, found, 1)
+        if not found:
+            return None
+        if len(found) == 1:
+            return found[0][1]
+        found.sort(key=operator.itemgetter(0))
+        return [code for _, code in found]
+
+    def __repr__(self):
+        return f"Matcher({', '.join(p.code for p in self.patterns)})"
+
+    def compile(self) -> Callable:
+        """Compile the patterns into a function appending `(order, code)` pairs."""
+        codes = {code.code: code for code in CODES}
+        tree = ([], {})  # (codes reported, {test: subtree})
+        for order, node_pattern in enumerate(self.patterns):
+            branch = tree
+            tests = node_pattern.predicates()
+            if node_pattern.names and not self.dispatched:
+                tests = (("names", node_pattern.names), *tests)
+            for test in tests:
+                branch = branch[1].setdefault(test, ([], {}))
+            branch[0].append((order, codes[node_pattern.code]))
+        return _compile_branch(tree)
+
+
+def _compile_branch(tree: Tuple[List, Dict]) -> Callable:
+    reported = tuple(tree[0])
+    branches = tuple(
+        (PREDICATES[test[0]], test[1:], _compile_branch(subtree))
+        for test, subtree in tree[1].items()
+    )
+
+    def match(node, context, found, count):
+        if reported:
+            found.extend(reported * count)
+        for predicate, arguments, subtree in branches:
+            matched = predicate(node, context, *arguments)
+            if matched:
+                subtree(node, context, found, count * matched)
+
+    return match
+
+
+def pattern(
+    code: str,
+    node_type: type,
+    *names: str,
+    keywords: Tuple[str, ...] = (),
+    agnostic: bool = False,
+    **constraints,
+) -> Callable:
+    """Decorator declaring a rule by a `NodePattern` instead of a check function.
+
+    The decorated function only holds the name and documentation of the
+    rule: it is replaced by the `Matcher` of the pattern, and its body is
+    never run::
+
+        @pattern("PD003", ast.Call, "isnull")
+        def check_for_isnull(node: ast.Call) -> Optional[Code]:
+            ...  # the docstring of the rule
+
+    Rules declared this way are merged into one `Matcher` per dispatch key
+    by `compile_rules`.
+
+    Args:
+        code (str): The error code reported on matching nodes
+        node_type (type): The `ast` node class to match
+        *names (str): The dispatch keys to match, see `register`
+        keywords (Tuple[str, ...]): Words for the source pre-filter. Defaults
+            to the names, the keyword argument or the imported module.
+        agnostic (bool): See `register`
+        **constraints: The other fields of `NodePattern`
+
+    Returns:
+        decorator (Callable): Registers the rule and returns its matcher
+    """
+    node_pattern = NodePattern(code, node_type, frozenset(names), **constraints)
+    if not keywords:
+        if node_pattern.keyword is not None:
+            keywords = node_pattern.keyword[:1]
+        elif node_pattern.imports is not None:
+            keywords = node_pattern.imports[:1]
+
+    def decorator(stub):
+        matcher = Matcher((node_pattern,))
+        functools.update_wrapper(matcher, stub, updated=())
+        register(
+            code,
+            node_type,
+            *names,
+            context=node_pattern.context,
+            keywords=keywords,
+            agnostic=agnostic,
+        )(matcher)
+        RULES[-1] = RULES[-1]._replace(pattern=node_pattern)
+        return matcher
+
+    return decorator
+
+
+def _combine(rules: Tuple[Rule, ...], combined: Dict) -> Tuple[Rule, ...]:
+    """Replace the pattern rules among `rules` by one rule running a `Matcher`.
+
+    A rule with a single pattern is replaced too, by a dispatched matcher.
+
+    The matcher takes the place of the first pattern rule. `combined` holds
+    the rules already built, so equal groups share a matcher.
+    """
+    patterns = tuple(rule for rule in rules if rule.pattern is not None)
+    if not patterns:
+        return rules
+    if patterns not in combined:
+        combined[patterns] = Rule(
+            ",".join(dict.fromkeys(rule.code for rule in patterns)),
+            Matcher(tuple(rule.pattern for rule in patterns), dispatched=True),
+            patterns[0].node_type,
+            frozenset().union(*(rule.triggers for rule in patterns)),
+            any(rule.context for rule in patterns),
+            frozenset().union(*(rule.keywords for rule in patterns)),
+            all(rule.agnostic for rule in patterns),
+        )
+    merged = []
+    for rule in rules:
+        if rule.pattern is None:
+            merged.append(rule)
+        elif rule is patterns[0]:
+            merged.append(combined[patterns])
+    return tuple(merged)
+
+
+def compile_rules(
+    rules: List[Rule], combine: bool = True
+) -> Dict[type, Tuple[Callable, Dict, Tuple]]:
+    """Build the dispatch table used by `Visitor.run_checks`.
+
+    Each node type maps to a `(key, keyed, unkeyed)` triple. `key` computes
+    the dispatch key of a node (see `DISPATCH_KEYS`), `unkeyed` holds the
+    rules that run on every node of that type and `keyed` maps a dispatch
+    key to all the rules to run for it, unkeyed ones included, in
+    registration order. Looking up a node is therefore a single dict access
+    no matter how many rules exist. The rules declared with `pattern` in
+    each of these groups are merged into a single `Matcher`, so the tests
+    they share run once per node.
+
+    Args:
+        rules (List[Rule]): The rules to compile
+        combine (bool): Whether to merge pattern rules. Profiling keeps them
+            apart to time every rule on its own.
+
+    Returns:
+        dispatch (Dict): The dispatch table
+    """
+    dispatch = {}
+    combined = {}
+    for node_type in {rule.node_type for rule in rules}:
+        typed = [rule for rule in rules if rule.node_type is node_type]
+        unkeyed = tuple(rule for rule in typed if not rule.triggers)
+        keys = set().union(*(rule.triggers for rule in typed))
+        keyed = {
+            key: tuple(
+                rule for rule in typed if not rule.triggers or key in rule.triggers
+            )
+            for key in keys
+        }
+        if combine:
+            unkeyed = _combine(unkeyed, combined)
+            keyed = {key: _combine(group, combined) for key, group in keyed.items()}
+        dispatch[node_type] = (DISPATCH_KEYS.get(node_type), keyed, unkeyed)
+    return dispatch
+
+
+def compile_prefilter(rules: List[Rule], agnostic: bool = True) -> Optional[Pattern]:
+    """Build a regular expression finding sources that can trigger `rules`.
+
+    A source without a match for any rule keyword cannot produce an error,
+    so `VetPlugin.run` returns right away instead of walking its tree.
+
+    Args:
+        rules (List[Rule]): The rules to compile
+        agnostic (bool): Whether the keywords of rules that are not specific
+            to pandas (see `register`) should force a walk too
+
+    Returns:
+        prefilter (Pattern): The compiled expression, or None when a rule
+            without keywords makes filtering impossible
+    """
+    keywords = set()
+    for rule in rules:
+        if rule.agnostic and not agnostic:
+            continue
+        if not rule.keywords:
+            return None
+        keywords.update(rule.keywords)
+    if not keywords:
+        return re.compile(r"(?!)")  # nothing to check, never walk
+    alternatives = "|".join(sorted(map(re.escape, keywords)))
+    return re.compile(rf"\b(?:{alternatives})\b")
+
+
+def build(
+    skip_agnostic: bool = False,
+    cache_dir: str = None,
+    cache_size: int = DEFAULT_MAX_ENTRIES,
+    profile: str = None,
+    select: Callable[[str], bool] = None,
+    loop_only: Sequence[str] = (),
+    escalate: Sequence[str] = (),
+) -> Tuple[Optional[Pattern], Optional[ResultCache], Callable]:
+    """Build the pre-filter, result cache and visitor factory of `VetPlugin`.
+
+    Only the rules whose code is selected are compiled into the pre-filter
+    and the dispatch table, so disabled rules are never run and node types
+    without enabled rules are never dispatched. See `VetPlugin.configure`
+    for the arguments.
+    """
+    rules = RULES if select is None else [rule for rule in RULES if select(rule.code)]
+    prefilter = compile_prefilter(rules, agnostic=not skip_agnostic)
+    loop_only = code_indices(loop_only)
+    escalate = code_indices(escalate)
+    cache = None
+    if cache_dir is not None:
+        cache = ResultCache(
+            cache_dir,
+            salt=",".join(
+                [f"{r.code}:{r.check.__qualname__}" for r in rules]
+                + [f"{name}=={version}" for name, version in PACKS.items()]
+                + [f"loop_only:{i}" for i in sorted(loop_only)]
+                + [f"escalate:{i}" for i in sorted(escalate)]
+            ),
+            max_entries=cache_size,
+        )
+    if profile is None:
+        visitor = partial(
+            Visitor,
+            dispatch=compile_rules(rules),
+            track_ancestors=any(rule.context for rule in rules),
+            loop_only=loop_only,
+            escalate=escalate,
+        )
+    else:
+        from . import profile as profiling
+
+        visitor = profiling.visitor(rules, loop_only=loop_only, escalate=escalate)
+    return prefilter, cache, visitor
+
+
+def code_indices(prefixes: Sequence[str]) -> FrozenSet[int]:
+    """The `Code.index` of every code starting with one of `prefixes`.
+
+    Prefixes select codes like flake8 does: "PD00" stands for PD001 to PD009.
+    """
+    prefixes = tuple(prefixes)
+    if not prefixes:
+        return frozenset()
+    return frozenset(code.index for code in CODES if code.code.startswith(prefixes))
+
+
+# Entry point group of the rule packs.
+PACK_GROUP = "pandas_vet.rules"
+
+# Namespaces of rule packs: the entry point names, and the prefixes of their codes.
+PACK_NAMESPACE = re.compile(r"PD[A-Z]+")
+
+# The version of every loaded rule pack, by namespace.
+PACKS: Dict[str, str] = {}
+
+
+def load_packs(entry_points: Iterable = None):
+    """Register the rules of the installed rule packs.
+
+    A rule pack is a package declaring an entry point in the
+    `pandas_vet.rules` group, e.g. in its `pyproject.toml`::
+
+        [project.entry-points."pandas_vet.rules"]
+        PDACME = "acme_pandas_rules"
+
+    The entry point names a module declaring its rules with `pattern` or
+    `register` when imported, or a function doing so when called. The name
+    of the entry point is the namespace of the pack: "PD" followed by
+    capital letters, which every code of the pack starts with, followed by
+    digits ("PDACME001"). The rules of all packs are compiled into the same
+    dispatch table as the built-in rules, so they add no tree walk.
+
+    Packs are loaded with the rule engine, on the first check, so a
+    broken or slow pack does not affect starting flake8. A pack that fails
+    to load, or declares codes outside of its namespace, is skipped with a
+    warning, so it does not stop the built-in checks either.
+
+    Args:
+        entry_points (Iterable): The entry points to load. Defaults to the
+            installed ones.
+    """
+    if entry_points is None:
+        entry_points = installed_packs()
+    for entry_point in entry_points:
+        namespace = entry_point.name
+        if namespace in PACKS:
+            continue
+        rules, codes = len(RULES), len(CODES)
+        try:
+            _load_pack(entry_point)
+        except Exception as e:
+            del RULES[rules:]
+            del CODES[codes:]
+            warnings.warn(f"pandas-vet: skipping rule pack {namespace!r}: {e}")
+            continue
+        PACKS[namespace] = _pack_version(entry_point)
+
+
+def installed_packs() -> Iterable:
+    """The entry points of the installed rule packs."""
+    from importlib.metadata import entry_points
+
+    installed = entry_points()
+    if hasattr(installed, "select"):
+        return installed.select(group=PACK_GROUP)
+    return installed.get(PACK_GROUP, [])  # Python < 3.10
+
+
+def _pack_version(entry_point) -> str:
+    """The version of the distribution declaring `entry_point`, or ""."""
+    dist = getattr(entry_point, "dist", None)
+    if dist is None:  # Python < 3.10
+        from importlib.metadata import distributions
+
+        dist = next((d for d in distributions() if entry_point in d.entry_points), None)
+    return dist.version if dist is not None else ""
+
+
+def _load_pack(entry_point):
+    """Register the rules of `entry_point`, tagged with its namespace.
+
+    Raises:
+        ValueError: If the namespace or a code of the pack is not valid
+    """
+    namespace = entry_point.name
+    if not PACK_NAMESPACE.fullmatch(namespace):
+        raise ValueError(
+            f"namespace {namespace!r} of {entry_point.value!r} is not "
+            "'PD' followed by capital letters"
+        )
+    start = len(RULES)
+    loaded = entry_point.load()
+    if callable(loaded):
+        loaded()
+    codes = re.compile(rf"{namespace}\d+")
+    for i in range(start, len(RULES)):
+        if not codes.fullmatch(RULES[i].code):
+            raise ValueError(
+                f"code {RULES[i].code!r} is not {namespace!r} followed by digits"
+            )
+        RULES[i] = RULES[i]._replace(pack=namespace)
+
+
+from . import checks, performance  # noqa: E402, F401  (registers the rules)
+
+load_packs()
+
+DISPATCH = compile_rules(RULES)
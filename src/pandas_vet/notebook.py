@@ -0,0 +1,132 @@
+"""Checking of Jupyter notebooks, cell by cell.
+
+The code cells of a notebook are checked as separate modules with the same
+rules as Python files, so each cell goes through the pre-filter and the
+result cache on its own: editing one cell of a large notebook only checks
+that cell again. IPython syntax is blanked out before parsing, keeping the
+line numbers of the cell. Errors are reported as `(cell, lineno, col,
+message)`, `cell` being the 1-based position of the cell in the notebook.
+"""
+import json
+import re
+from concurrent.futures import Executor, Future
+from typing import List, Optional, Tuple
+
+from . import PandasVetException, VetPlugin
+
+# Logical lines that are IPython rather than Python: magics, shell escapes,
+# help requests and assignments of their output.
+MAGIC = re.compile(r"\s*(?:[%!?](?!=)|[\w.]+\s*=\s*[%!](?!=)|[\w.]+\?{1,2}\s*$)")
+
+# The cell magics running their body as Python, in the kernel or not.
+PYTHON_CELL_MAGICS = frozenset(
+    ["capture", "debug", "prun", "python", "python3", "time", "timeit"]
+)
+
+
+def read_cells(path: str) -> List[Tuple[int, str]]:
+    """Return the `(cell, source)` pairs of the code cells of a notebook."""
+    with open(path, encoding="utf-8") as f:
+        notebook = json.load(f)
+    cells = []
+    for index, cell in enumerate(notebook.get("cells", ()), 1):
+        if cell.get("cell_type") != "code":
+            continue
+        source = cell.get("source", "")
+        cells.append((index, "".join(source) if isinstance(source, list) else source))
+    return cells
+
+
+def strip_magics(source: str) -> Optional[str]:
+    """Replace the IPython lines of a cell with `pass`.
+
+    Returns:
+        source (str): The Python source, or None for cells run by a cell
+            magic such as `%%bash`, which are not Python at all. The line of
+            a Python cell magic such as `%%time` is replaced like the others.
+    """
+    cell_magic = re.match(r"\s*%%(\w*)", source)
+    if cell_magic and cell_magic[1] not in PYTHON_CELL_MAGICS:
+        return None
+    lines = source.splitlines(keepends=True)
+    depth, quote, continued = 0, None, False
+    for i, line in enumerate(lines):
+        if not (depth or quote or continued) and MAGIC.match(line):
+            indent = line[: len(line) - len(line.lstrip())]
+            lines[i] = f"{indent}pass\n"
+        else:
+            depth, quote, continued = _scan(line, depth, quote)
+    return "".join(lines)
+
+
+def _scan(
+    line: str, depth: int, quote: Optional[str]
+) -> Tuple[int, Optional[str], bool]:
+    """Follow the brackets and strings of a line, to find where logical lines start.
+
+    Args:
+        line (str): A physical line of Python source
+        depth (int): The number of brackets open before the line
+        quote (str): The quote of the string open before the line, if any
+
+    Returns:
+        state (Tuple): The `depth` and `quote` after the line, and whether the
+            line ends with a backslash continuation
+    """
+    i, end = 0, len(line)
+    while i < end:
+        char = line[i]
+        if quote:
+            if char == "\\":
+                i += 2
+                continue
+            if line.startswith(quote, i):
+                i += len(quote)
+                quote = None
+                continue
+        elif char == "#":
+            return depth, None, False
+        elif char in "([{":
+            depth += 1
+        elif char in ")]}":
+            depth = max(depth - 1, 0)
+        elif char in "\"'":
+            quote = char * 3 if line.startswith(char * 3, i) else char
+            i += len(quote)
+            continue
+        i += 1
+    continued = line.rstrip("\r\n").endswith("\\")
+    if quote and len(quote) == 1 and not continued:
+        # An unterminated string, which the parser will report.
+        quote = None
+    return depth, quote, continued and not quote
+
+
+def check_cell(path: str, cell: int, source: str) -> List[Tuple[int, int, int, str]]:
+    """Check the source of one cell, returning its `(cell, lineno, col, message)` errors."""
+    source = strip_magics(source)
+    if source is None:
+        return []
+    lines = source.splitlines(keepends=True)
+    try:
+        errors = VetPlugin(None, lines, f"{path}:cell_{cell}").run()
+    except PandasVetException as e:
+        cause = e.args[0]
+        if not isinstance(cause, SyntaxError):
+            raise
+        return [(cell, cause.lineno or 1, 0, f"E999 SyntaxError: {cause.msg}")]
+    return [(cell, *e[:3]) for e in errors]
+
+
+def check_notebook(path: str) -> List[Tuple[int, int, int, str]]:
+    """Check every code cell of a notebook, see `check_cell`."""
+    return [error for cell in read_cells(path) for error in check_cell(path, *cell)]
+
+
+def submit(executor: Executor, path: str) -> List[Future]:
+    """Check the cells of a notebook in parallel, one task per cell.
+
+    Returns:
+        futures (List[Future]): The futures of the `check_cell` results
+    """
+    return [executor.submit(check_cell, path, *cell) for cell in read_cells(path)]
@@ -0,0 +1,977 @@
+"""The PD1xx checks, flagging pandas code that is slow rather than unidiomatic.
+
+They are declared like the checks of `checks`, and can be selected or
+ignored as a family, e.g. `--select PD1` or `--extend-ignore PD1`.
+"""
+import ast
+import sys
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from .engine import Code, Visitor, pattern, register
+from .symbols import path_key
+
+# The wrapper of simple subscript indexes, removed from the syntax tree in Python 3.9.
+INDEX = ast.Index if sys.version_info < (3, 9) else None
+
+# Accessors of single values, or rows, by label or position.
+SCALAR_ACCESSORS = frozenset(["loc", "iloc", "at", "iat"])
+
+# The pandas functions reading a file, or another source, into a data frame.
+READERS = frozenset(
+    [
+        "read_clipboard",
+        "read_csv",
+        "read_excel",
+        "read_feather",
+        "read_fwf",
+        "read_hdf",
+        "read_html",
+        "read_json",
+        "read_orc",
+        "read_parquet",
+        "read_pickle",
+        "read_sas",
+        "read_spss",
+        "read_sql",
+        "read_sql_query",
+        "read_sql_table",
+        "read_stata",
+        "read_table",
+        "read_xml",
+    ]
+)
+
+# The readers of delimited text files.
+TEXT_READERS = frozenset(["read_csv", "read_table"])
+
+# The calls keeping the frames read in a loop for a single `pd.concat`.
+COLLECTORS = frozenset(["append", "extend", "concat"])
+
+# The methods writing a data frame to a file or a database, with the
+# keywords of their destination, which is also their first parameter.
+WRITERS = {
+    "to_csv": ("path_or_buf",),
+    "to_excel": ("excel_writer",),
+    "to_feather": ("path",),
+    "to_hdf": ("path_or_buf",),
+    "to_html": ("buf",),
+    "to_json": ("path_or_buf",),
+    "to_orc": ("path",),
+    "to_parquet": ("path",),
+    "to_pickle": ("path",),
+    "to_sql": ("name", "con"),
+    "to_stata": ("path",),
+    "to_xml": ("path_or_buffer",),
+}
+
+# The dtypes storing every value as a Python object, by name.
+OBJECT_DTYPES = frozenset(["str", "object", "O", "string"])
+
+# The 64-bit numeric dtypes, and the builtin types that stand for them.
+WIDE_DTYPES = frozenset(["float64", "int64", "float", "int"])
+
+# How many times a literal column repeats its values, on average, to be a category.
+REPEATS = 2
+
+# The readers of intermediate files, by the name of their path argument.
+INTERMEDIATE_READERS = {
+    "read_csv": "filepath_or_buffer",
+    "read_table": "filepath_or_buffer",
+    "read_pickle": "filepath_or_buffer",
+}
+
+
+@pattern("PD101", ast.Call, "iterrows")
+def check_for_iterrows(node: ast.Call) -> Optional[Code]:
+    """
+    Check for iteration over the rows of a data frame with `.iterrows()`.
+
+    Disapproved:
+        for index, row in df.iterrows():
+            total += row["price"] * row["quantity"]
+
+    Approved:
+        total = (df["price"] * df["quantity"]).sum()
+
+    Error/warning message to recommend vectorized operations over a Python
+    loop building a Series for every row. Every call is reported, whether it
+    is iterated by a `for` loop, a comprehension or another function.
+    """
+
+
+@pattern("PD102", ast.Call, "itertuples")
+def check_for_itertuples(node: ast.Call) -> Optional[Code]:
+    """
+    Check for iteration over the rows of a data frame with `.itertuples()`.
+
+    Error/warning message to recommend vectorized operations. `.itertuples()`
+    is faster than `.iterrows()`, but still runs Python code for every row.
+    """
+
+
+@pattern("PD103", ast.Call, "apply", keyword=("axis", 1, "columns"))
+def check_for_apply_axis_1(node: ast.Call) -> Optional[Code]:
+    """
+    Check for `.apply()` calling a function on every row of a data frame.
+
+    Disapproved:
+        df.apply(lambda row: row["price"] * row["quantity"], axis=1)
+
+    Approved:
+        df["price"] * df["quantity"]
+
+    Error/warning message to recommend vectorized operations over a Python
+    function called on every row.
+    """
+
+
+@register("PD104", ast.For, keywords=tuple(SCALAR_ACCESSORS))
+def check_for_index_loop(node: ast.For) -> Optional[Code]:
+    """
+    Check for loops over the positions or labels of a data frame accessing its values one by one.
+
+    Disapproved:
+        for i in range(len(df)):
+            df.loc[i, "total"] = df.loc[i, "price"] * df.loc[i, "quantity"]
+
+        for label in df.index:
+            df.at[label, "total"] = ...
+
+    Approved:
+        df["total"] = df["price"] * df["quantity"]
+
+    The loop iterates `range(len(...))`, `range(....shape[0])` or `....index`,
+    and its body indexes `.loc`, `.iloc`, `.at` or `.iat` with the loop
+    variable.
+    """
+    target = node.target
+    if type(target) is not ast.Name or not _iterates_positions(node.iter):
+        return None
+    for statement in node.body:
+        for child in ast.walk(statement):
+            if (
+                type(child) is ast.Subscript
+                and type(child.value) is ast.Attribute
+                and child.value.attr in SCALAR_ACCESSORS
+                and _uses_name(_slice(child), target.id)
+            ):
+                return PD104
+    return None
+
+
+@register("PD110", ast.Assign, "concat", "append", "_append", context=True)
+def check_for_growth(node: ast.Assign, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for a data frame growing by one piece on every iteration of a loop.
+
+    Disapproved:
+        for path in paths:
+            sales = pd.concat([sales, pd.read_csv(path)])
+
+        while rows:
+            sales = sales.append(rows.pop())
+
+    Approved:
+        sales = pd.concat([pd.read_csv(path) for path in paths])
+
+    Error/warning message to recommend collecting the pieces in a list and
+    concatenating them once: `pd.concat` and `.append` copy the whole data
+    frame, so growing it in a loop takes quadratic time. The variable
+    assigned must be the one that grows, and the assignment must run on
+    every iteration of a loop, see `Visitor.loops`.
+    """
+    if len(node.targets) != 1 or context is None:
+        return None
+    target = node.targets[0]
+    value = node.value
+    if type(value.func) is ast.Attribute and value.func.attr in ("append", "_append"):
+        grows = _same_reference(value.func.value, target)
+    else:
+        grows = (
+            context.symbols.pandas_function(value) == "concat"
+            and bool(value.args)
+            and type(value.args[0]) in (ast.List, ast.Tuple)
+            and any(_same_reference(e, target) for e in value.args[0].elts)
+        )
+    if grows and context.loops(node):
+        return PD110
+    return None
+
+
+@register("PD110", ast.Subscript, "loc", context=True)
+def check_for_loc_enlargement(
+    node: ast.Subscript, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for rows added one at a time past the end of a data frame in a loop.
+
+    Disapproved:
+        for row in rows:
+            sales.loc[len(sales)] = row
+
+    Approved:
+        sales = pd.concat([sales, pd.DataFrame(rows)])
+
+    Setting `.loc` at the length of the data frame (`len(df)`,
+    `len(df.index)` or `df.shape[0]`) enlarges it, copying every column.
+    """
+    if type(node.ctx) is not ast.Store or context is None:
+        return None
+    frame = node.value.value
+    index = _slice(node)
+    if type(index) is ast.Tuple and index.elts:
+        index = index.elts[0]
+    if _is_length(index, frame) and context.loops(node):
+        return PD110
+    return None
+
+
+@register("PD120", ast.Subscript, context=True, keywords=("pd", "pandas"))
+def check_for_chained_assignment(
+    node: ast.Subscript, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for values set through a chain of indexing operations on a data frame.
+
+    Disapproved:
+        sales[sales["price"] > 0]["discount"] = 0.1
+        sales["price"][label] = 9.99
+        sales.loc[mask]["price"] = 9.99
+
+    Approved:
+        sales.loc[sales["price"] > 0, "discount"] = 0.1
+
+    The first selection may return a copy, which the assignment then
+    modifies instead of the data frame (`SettingWithCopyWarning`), after
+    copying the selected data for nothing. The object indexed last must be
+    a selection of a data frame known to `Visitor.symbols`, so nested
+    dictionaries or lists are not reported.
+    """
+    if type(node.ctx) is not ast.Store or context is None:
+        return None
+    selection = node.value
+    if type(selection) is ast.Attribute and selection.attr in SCALAR_ACCESSORS:
+        selection = selection.value
+    if type(selection) is ast.Subscript and context.symbols.is_frame(selection):
+        return PD120
+    return None
+
+
+@register("PD121", ast.Call, "copy", context=True)
+def check_for_sliced_copy(node: ast.Call, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for a copy that is immediately indexed.
+
+    Disapproved:
+        recent = sales.copy()[sales["year"] > 2020]
+        price = sales.copy().loc[label, "price"]
+
+    Approved:
+        recent = sales[sales["year"] > 2020].copy()
+
+    Indexing returns a new object, or a value, so copying the whole data
+    frame first only costs memory. Copy the selection instead, if it is
+    modified afterwards. The copied object must be a data frame known to
+    `Visitor.symbols`, so copies of dictionaries or lists are not reported.
+    """
+    if context is None or type(node.func) is not ast.Attribute:
+        return None
+    if not context.symbols.is_frame(node.func.value):
+        return None
+    parent = context.parent
+    if type(parent) is ast.Attribute and parent.attr in SCALAR_ACCESSORS:
+        if len(context.ancestors) < 2:
+            return None
+        node, parent = parent, context.ancestors[-2]
+    if type(parent) is ast.Subscript and parent.value is node:
+        return PD121
+    return None
+
+
+@register("PD121", ast.Assign, "copy", context=True)
+def check_for_overwritten_copy(
+    node: ast.Assign, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for a copy assigned to a variable that the next statement overwrites.
+
+    Disapproved:
+        recent = sales.copy()
+        recent = recent[recent["year"] > 2020]
+
+    Approved:
+        recent = sales[sales["year"] > 2020].copy()
+
+    The next statement assigns the variable a selection of the copy, which
+    is another new object, or a value not using the copy at all. As for
+    `check_for_sliced_copy`, only the copies of data frames are reported.
+    """
+    if context is None or len(node.targets) != 1:
+        return None
+    target = node.targets[0]
+    if type(target) is not ast.Name or type(node.value.func) is not ast.Attribute:
+        return None
+    if not context.symbols.is_frame(node.value.func.value):
+        return None
+    following = context.next_statement(node)
+    if not (
+        type(following) is ast.Assign
+        and len(following.targets) == 1
+        and type(following.targets[0]) is ast.Name
+        and following.targets[0].id == target.id
+    ):
+        return None
+    value = following.value
+    if not _uses_name(value, target.id) or _selection_of(value, target.id):
+        return PD121
+    return None
+
+
+@register("PD130", ast.Call, *TEXT_READERS, context=True)
+def check_for_read_all_columns(
+    node: ast.Call, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for large text files read without `usecols` or `dtype`.
+
+    Disapproved:
+        sales = pd.read_csv("sales.csv", low_memory=False)
+        prices = pd.read_csv("sales.csv")[["date", "price"]]
+
+    Approved:
+        sales = pd.read_csv(
+            "sales.csv",
+            usecols=["date", "price"],
+            dtype={"price": "float32"},
+        )
+
+    Without `usecols`, every column is parsed, and without `dtype`, pandas
+    infers the type of every column from its values, keeping 64-bit numbers
+    and Python strings. The size of the file is unknown to a linter, so only
+    the reads known to be large (see `_large_read`), and the reads selecting
+    some columns right away, are reported.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or not _reads(node, context, TEXT_READERS):
+        return None
+    if "usecols" in keywords or "dtype" in keywords:
+        return None
+    parent = context.parent
+    selects = type(parent) is ast.Subscript and parent.value is node
+    if selects or _large_read(keywords, streamed=True):
+        return PD130
+    return None
+
+
+@register("PD131", ast.Call, *TEXT_READERS, context=True)
+def check_for_read_engine(node: ast.Call, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for large text files read without the pyarrow engine.
+
+    Disapproved:
+        sales = pd.read_csv("sales.csv", low_memory=False)
+
+    Approved:
+        sales = pd.read_csv("sales.csv", engine="pyarrow")
+
+    The pyarrow parser reads with several threads, and is usually several
+    times faster than the default C parser on large files. Only the reads
+    known to be large without being streamed (see `_large_read`) are
+    reported, since pyarrow reads whole files, and so are not the reads
+    choosing an `engine`.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or not _reads(node, context, TEXT_READERS):
+        return None
+    if "engine" not in keywords and _large_read(keywords, streamed=False):
+        return PD131
+    return None
+
+
+@register("PD132", ast.Call, *TEXT_READERS, keywords=("parse_dates",), context=True)
+def check_for_parse_dates_format(
+    node: ast.Call, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for dates parsed while reading a text file without their format.
+
+    Disapproved:
+        sales = pd.read_csv("sales.csv", parse_dates=["date"])
+
+    Approved:
+        sales = pd.read_csv("sales.csv", parse_dates=["date"], date_format="%Y-%m-%d")
+
+    Without a format, pandas guesses it from the first value and may fall
+    back to parsing every value on its own.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or not _reads(node, context, TEXT_READERS):
+        return None
+    parse_dates = keywords.get("parse_dates")
+    if parse_dates is None or "date_format" in keywords:
+        return None
+    if type(parse_dates) is ast.Constant and not parse_dates.value:
+        return None
+    return PD132
+
+
+@register("PD133", ast.Call, *READERS, context=True)
+def check_for_read_in_loop(node: ast.Call, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for data frames read one at a time in a loop, and not collected.
+
+    Disapproved:
+        for path in paths:
+            sales = pd.read_csv(path)
+            total += sales["price"].sum()
+
+    Approved:
+        sales = pd.concat([pd.read_csv(path) for path in paths])
+        total = sales["price"].sum()
+
+        for chunk in pd.read_csv("sales.csv", chunksize=100_000):
+            total += chunk["price"].sum()
+
+    A reader in the body of a `for` or `while` loop is reported, unless it
+    reads in chunks (`chunksize` or `iterator`), its result is yielded or
+    collected for a single `pd.concat` (passed to `.append`, `.extend` or
+    `pd.concat`, or stored in a container), or it is assigned to a variable
+    that the loop collects.
+    Comprehensions are the approved way to read many files, so they are not
+    loops here, see `Visitor.loops`.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or not _reads(node, context, READERS):
+        return None
+    if "chunksize" in keywords or "iterator" in keywords:
+        return None
+    loops = context.loops(node)
+    if not loops:
+        return None
+    parent = context.parent
+    if type(parent) in (ast.Yield, ast.YieldFrom) or _collects(parent):
+        return None
+    if type(parent) in (ast.List, ast.Tuple) and len(context.ancestors) > 1:
+        if _collects(context.ancestors[-2]):
+            return None
+    if type(parent) is ast.Assign and len(parent.targets) == 1:
+        target = parent.targets[0]
+        if type(target) is ast.Subscript:  # frames[path] = pd.read_csv(path)
+            return None
+        if type(target) is ast.Name and _collected(loops[-1], target.id):
+            return None
+    return PD133
+
+
+@register("PD134", ast.Call, "to_datetime", context=True)
+def check_for_to_datetime_format(
+    node: ast.Call, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for columns converted with `pd.to_datetime` without their format.
+
+    Disapproved:
+        sales["date"] = pd.to_datetime(sales["date"])
+
+    Approved:
+        sales["date"] = pd.to_datetime(sales["date"], format="%Y-%m-%d")
+
+    Without a format, pandas guesses it from the first value and may fall
+    back to parsing every value on its own. Only whole columns are reported:
+    the first argument is a subscript, an attribute or a variable, not a
+    literal. Numbers converted with `unit` need no format.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or context is None or not node.args:
+        return None
+    if context.symbols.pandas_function(node) != "to_datetime":
+        return None
+    if "format" in keywords or "unit" in keywords:
+        return None
+    if type(node.args[0]) in (ast.Subscript, ast.Attribute, ast.Name):
+        return PD134
+    return None
+
+
+@register("PD140", ast.Call, *WRITERS, context=True)
+def check_for_write_in_loop(node: ast.Call, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for a data frame written on every iteration of a loop.
+
+    Disapproved:
+        for region, sales in by_region:
+            sales.to_csv(f"sales-{region}.csv")
+
+    Approved:
+        sales.to_parquet("sales", partition_cols=["region"])
+
+        with pd.ExcelWriter("sales.xlsx") as writer:
+            for region, sales in by_region:
+                sales.to_excel(writer, sheet_name=region)
+
+    Every write opens, formats and closes a file, or a database
+    transaction, on its own. Writing the sheets of an `ExcelWriter` opened
+    around the loop is not reported, nor are calls without a destination,
+    such as `df.to_csv(index=False)` returning a string.
+    """
+    if context is None or type(node.func) is not ast.Attribute:
+        return None
+    if not _writes(node, WRITERS[node.func.attr]):
+        return None
+    if not context.loops(node):
+        return None
+    if node.func.attr == "to_excel" and _opened_writer(node, context):
+        return None
+    return PD140
+
+
+@register("PD141", ast.Call, *INTERMEDIATE_READERS, context=True)
+def check_for_intermediate_csv(
+    node: ast.Call, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for CSV or pickle files that the module writes and reads back.
+
+    Disapproved:
+        sales.to_csv("cleaned.csv")
+        ...
+        cleaned = pd.read_csv("cleaned.csv")
+
+    Approved:
+        sales.to_parquet("cleaned.parquet")
+        ...
+        cleaned = pd.read_parquet("cleaned.parquet")
+
+    CSV drops the types of the columns, which must be parsed and inferred
+    again, and pickle is slow and tied to the pandas version. The read is
+    reported when its path, a string literal or a variable, is the path of
+    a `to_csv` or `to_pickle` call of the module, see `Symbols.written`.
+    """
+    if context is None:
+        return None
+    function = context.symbols.pandas_function(node)
+    if function not in INTERMEDIATE_READERS:
+        return None
+    key = path_key(node, INTERMEDIATE_READERS[function])
+    if key is not None and key in context.symbols.written:
+        return PD141
+    return None
+
+
+@register("PD142", ast.Call, "to_sql")
+def check_for_to_sql_chunks(node: ast.Call) -> Optional[Code]:
+    """
+    Check for data frames written to a database without `chunksize` or `method`.
+
+    Disapproved:
+        sales.to_sql("sales", engine)
+
+    Approved:
+        sales.to_sql("sales", engine, chunksize=10_000, method="multi")
+
+    By default, every row is inserted by its own statement, and all rows
+    are sent at once.
+    """
+    keywords = _keyword_names(node)
+    if keywords is None or "chunksize" in keywords or "method" in keywords:
+        return None
+    return PD142
+
+
+@register("PD150", ast.Assign, "astype", context=True)
+def check_for_object_group_keys(
+    node: ast.Assign, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for columns converted to strings that are only used as group keys.
+
+    Disapproved:
+        sales["region"] = sales["region"].astype(str)
+        totals = sales.groupby("region")["price"].sum()
+
+    Approved:
+        sales["region"] = sales["region"].astype("category")
+        totals = sales.groupby("region", observed=True)["price"].sum()
+
+    Strings are stored as one Python object per row, where a category
+    stores each distinct value once, and groups by integer codes. The
+    column must be a string literal subscript of a data frame known to
+    `Visitor.symbols`, and its name must appear elsewhere in the module
+    only in the arguments of `.groupby` calls, see `Symbols.group_keys`.
+    """
+    if context is None or len(node.targets) != 1:
+        return None
+    column = _column(node.targets[0], context)
+    if column is None or _dtype_name(node.value) not in OBJECT_DTYPES:
+        return None
+    if type(node.value.func) is not ast.Attribute:
+        return None
+    converted = node.value.func.value
+    own = 1  # the assigned column, and the converted one
+    if type(converted) is ast.Subscript:
+        index = _slice(converted)
+        own += type(index) is ast.Constant and index.value == column
+    grouped = context.symbols.group_keys[column]
+    if grouped and context.symbols.strings[column] - own == grouped:
+        return PD150
+    return None
+
+
+@register("PD151", ast.Call, "astype", context=True)
+def check_for_wide_astype(node: ast.Call, context: Visitor = None) -> Optional[Code]:
+    """
+    Check for data frames or columns converted to 64-bit numbers.
+
+    Disapproved:
+        sales["quantity"] = sales["quantity"].astype("int64")
+
+    Approved:
+        sales["quantity"] = pd.to_numeric(sales["quantity"], downcast="integer")
+        sales["quantity"] = sales["quantity"].astype("int32")
+
+    `int`, `float`, "int64" and "float64" take 8 bytes per value, which
+    few columns need. The converted object must be a data frame known to
+    `Visitor.symbols`, or one of its columns.
+    """
+    if context is None or type(node.func) is not ast.Attribute:
+        return None
+    if _dtype_name(node) in WIDE_DTYPES and context.symbols.is_frame(node.func.value):
+        return PD151
+    return None
+
+
+@register("PD152", ast.Assign, "astype", context=True)
+def check_for_category_after_read(
+    node: ast.Assign, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for columns converted to categories after reading without a dtype.
+
+    Disapproved:
+        sales = pd.read_csv("sales.csv")
+        sales["region"] = sales["region"].astype("category")
+
+    Approved:
+        sales = pd.read_csv("sales.csv", dtype={"region": "category"})
+
+    The reader builds the column of strings first, one Python object per
+    row, then the conversion builds the categories. The data frame must be
+    assigned the result of a `pd.read_*` call without `dtype`, see
+    `Symbols.reads`.
+    """
+    if context is None or len(node.targets) != 1:
+        return None
+    column = _column(node.targets[0], context)
+    if column is None or _dtype_name(node.value) != "category":
+        return None
+    read = context.symbols.reads.get(node.targets[0].value.id)
+    if read is None:
+        return None
+    keywords = _keyword_names(read)
+    if keywords is None or "dtype" in keywords:
+        return None
+    return PD152
+
+
+@register("PD152", ast.Call, "DataFrame", "Series", context=True)
+def check_for_literal_categories(
+    node: ast.Call, context: Visitor = None
+) -> Optional[Code]:
+    """
+    Check for data frames or series built from repeated strings without a dtype.
+
+    Disapproved:
+        sales = pd.DataFrame({"region": ["north", "south", "north", "north"]})
+
+    Approved:
+        sales = pd.DataFrame(
+            {"region": pd.Categorical(["north", "south", "north", "north"])}
+        )
+
+    A column is reported when it is a list or tuple of string literals
+    repeating each value at least twice on average, or such a list
+    multiplied, like `["north", "south"] * 1000`.
+    """
+    keywords = _keyword_names(node)
+    if context is None or keywords is None or "dtype" in keywords or not node.args:
+        return None
+    function = context.symbols.pandas_function(node)
+    data = node.args[0]
+    if function == "Series":
+        columns = [data]
+    elif function == "DataFrame" and type(data) is ast.Dict:
+        columns = data.values  # noqa: PD011  (the values of an ast.Dict)
+    else:
+        return None
+    if any(_repeats_strings(column) for column in columns):
+        return PD152
+    return None
+
+
+def _column(target: ast.AST, context: Visitor) -> Optional[str]:
+    """The name of the column `target` assigns, e.g. "region" for `sales["region"]`."""
+    if (
+        type(target) is ast.Subscript
+        and type(target.value) is ast.Name
+        and type(_slice(target)) is ast.Constant
+        and type(_slice(target).value) is str
+        and context.symbols.is_frame(target.value)
+    ):
+        return _slice(target).value
+    return None
+
+
+def _dtype_name(node: ast.Call) -> Optional[str]:
+    """The name of the dtype passed to an `astype` call, e.g. "int64" for `astype(np.int64)`."""
+    if type(node) is not ast.Call:
+        return None
+    if node.args:
+        dtype = node.args[0]
+    else:
+        dtype = next((k.value for k in node.keywords if k.arg == "dtype"), None)
+    if type(dtype) is ast.Constant and type(dtype.value) is str:
+        return dtype.value
+    if type(dtype) is ast.Name:
+        return dtype.id
+    if type(dtype) is ast.Attribute:
+        return dtype.attr
+    return None
+
+
+def _repeats_strings(node: ast.AST) -> bool:
+    """Whether `node` is a literal column of strings repeating its values."""
+    if type(node) is ast.BinOp and type(node.op) is ast.Mult:
+        return _strings(node.left) is not None or _strings(node.right) is not None
+    values = _strings(node)
+    return values is not None and len(values) >= REPEATS * len(set(values))
+
+
+def _strings(node: ast.AST) -> Optional[List[str]]:
+    """The values of a list or tuple of string literals, or None."""
+    if type(node) not in (ast.List, ast.Tuple) or not node.elts:
+        return None
+    values = [getattr(e, "value", None) for e in node.elts]
+    if all(
+        type(e) is ast.Constant and type(v) is str for e, v in zip(node.elts, values)
+    ):
+        return values
+    return None
+
+
+def _opened_writer(node: ast.Call, context: Visitor) -> bool:
+    """Whether `node` writes to a variable bound by an enclosing `with ... as` statement."""
+    if not node.args or type(node.args[0]) is not ast.Name:
+        return False
+    name = node.args[0].id
+    for ancestor in context.ancestors:
+        if type(ancestor) in (ast.With, ast.AsyncWith):
+            for item in ancestor.items:
+                variable = item.optional_vars
+                if type(variable) is ast.Name and variable.id == name:
+                    return True
+    return False
+
+
+def _keyword_names(node: ast.Call) -> Optional[Dict[str, ast.AST]]:
+    """The keyword arguments of `node` by name, or None if some are unknown (`**kwargs`)."""
+    keywords = {}
+    for keyword in node.keywords:
+        if keyword.arg is None:
+            return None
+        keywords[keyword.arg] = keyword.value
+    return keywords
+
+
+def _writes(node: ast.Call, destinations: Tuple[str, ...]) -> bool:
+    """Whether the write `node` has a destination other than None.
+
+    The destination is the first argument, or one of the keywords of
+    `destinations`. Calls passing `**kwargs` without a destination are
+    given the benefit of the doubt.
+    """
+    if node.args:
+        destination = node.args[0]
+    else:
+        keywords = _keyword_names(node) or {}
+        destination = next(
+            (keywords[name] for name in destinations if name in keywords), None
+        )
+        if destination is None:
+            return False
+    return not (type(destination) is ast.Constant and destination.value is None)
+
+
+def _large_read(keywords: Dict[str, ast.AST], streamed: bool) -> bool:
+    """Whether the keyword arguments of a read tell that the file is large.
+
+    `low_memory=False` and `memory_map=True` are set for large files, and,
+    when `streamed`, so are `chunksize` and `iterator`.
+    """
+    low_memory = keywords.get("low_memory")
+    if type(low_memory) is ast.Constant and low_memory.value is False:
+        return True
+    memory_map = keywords.get("memory_map")
+    if type(memory_map) is ast.Constant and memory_map.value is True:
+        return True
+    if not streamed:
+        return False
+    for name in ("chunksize", "iterator"):
+        value = keywords.get(name)
+        if value is not None and not (
+            type(value) is ast.Constant and value.value in (None, False)
+        ):
+            return True
+    return False
+
+
+def _reads(node: ast.Call, context: Optional[Visitor], readers: FrozenSet[str]) -> bool:
+    """Whether `node` calls one of the pandas `readers`."""
+    return context is not None and context.symbols.pandas_function(node) in readers
+
+
+def _collects(node: ast.AST) -> bool:
+    """Whether `node` calls `.append`, `.extend` or `concat`."""
+    if type(node) is not ast.Call:
+        return False
+    func = node.func
+    if type(func) is ast.Attribute:
+        return func.attr in COLLECTORS
+    return type(func) is ast.Name and func.id in COLLECTORS
+
+
+def _collected(loop: ast.AST, name: str) -> bool:
+    """Whether the body of `loop` collects or yields the variable `name`."""
+    for statement in loop.body:
+        for child in ast.walk(statement):
+            if (_collects(child) or type(child) is ast.Yield) and any(
+                _uses_name(argument, name) for argument in _arguments(child)
+            ):
+                return True
+    return False
+
+
+def _arguments(node: ast.AST) -> List[ast.AST]:
+    if type(node) is ast.Call:
+        return node.args
+    return [node.value] if node.value is not None else []
+
+
+def _selection_of(node: ast.AST, name: str) -> bool:
+    """Whether `node` indexes the variable `name`, e.g. `name.loc[rows, cols]`."""
+    if type(node) is not ast.Subscript:
+        return False
+    while type(node) is ast.Subscript or (
+        type(node) is ast.Attribute and node.attr in SCALAR_ACCESSORS
+    ):
+        node = node.value
+    return type(node) is ast.Name and node.id == name
+
+
+def _iterates_positions(node: ast.AST) -> bool:
+    """Whether `node` is `x.index` or `range(...)` up to the length of a frame."""
+    if type(node) is ast.Attribute:
+        return node.attr == "index"
+    if not (
+        type(node) is ast.Call
+        and type(node.func) is ast.Name
+        and node.func.id == "range"
+        and node.args
+    ):
+        return False
+    stop = node.args[1] if len(node.args) > 1 else node.args[0]
+    if type(stop) is ast.Call:  # len(df)
+        return type(stop.func) is ast.Name and stop.func.id == "len"
+    return (  # df.shape[0]
+        type(stop) is ast.Subscript
+        and type(stop.value) is ast.Attribute
+        and stop.value.attr == "shape"
+    )
+
+
+def _is_length(node: ast.AST, frame: ast.AST) -> bool:
+    """Whether `node` is the number of rows of `frame`."""
+    if type(node) is ast.Call:  # len(df), len(df.index)
+        if not (type(node.func) is ast.Name and node.func.id == "len" and node.args):
+            return False
+        counted = node.args[0]
+        if type(counted) is ast.Attribute and counted.attr == "index":
+            counted = counted.value
+        return _same_reference(counted, frame)
+    return (  # df.shape[0]
+        type(node) is ast.Subscript
+        and type(node.value) is ast.Attribute
+        and node.value.attr == "shape"
+        and _same_reference(node.value.value, frame)
+    )
+
+
+def _same_reference(node: ast.AST, other: ast.AST) -> bool:
+    """Whether `node` and `other` are the same variable or attribute, e.g. `self.df`."""
+    while type(node) is ast.Attribute and type(other) is ast.Attribute:
+        if node.attr != other.attr:
+            return False
+        node, other = node.value, other.value
+    return type(node) is ast.Name and type(other) is ast.Name and node.id == other.id
+
+
+def _slice(node: ast.Subscript) -> ast.AST:
+    """The index of `node`, which Python 3.8 wraps in an `ast.Index` node."""
+    index = node.slice
+    return index.value if type(index) is INDEX else index
+
+
+def _uses_name(node: ast.AST, name: str) -> bool:
+    return any(type(n) is ast.Name and n.id == name for n in ast.walk(node))
+
+
+PD101 = Code("PD101 '.iterrows' loops over rows in Python; use vectorized operations")
+PD102 = Code("PD102 '.itertuples' loops over rows in Python; use vectorized operations")
+PD103 = Code(
+    "PD103 '.apply' with 'axis=1' calls a function for every row; "
+    "use vectorized operations"
+)
+PD104 = Code(
+    "PD104 Loop accessing values one index at a time with '.loc', '.iloc', "
+    "'.at' or '.iat'; use vectorized operations"
+)
+PD110 = Code(
+    "PD110 Growing a DataFrame in a loop copies it on every iteration; "
+    "collect the pieces in a list and call 'pd.concat' once"
+)
+PD120 = Code(
+    "PD120 Chained indexing assignment may modify a copy; "
+    "use a single '.loc[rows, cols]' instead"
+)
+PD121 = Code("PD121 Needless '.copy()'; the copy is indexed or overwritten right away")
+PD130 = Code(
+    "PD130 Large text file read without 'usecols' or 'dtype'; "
+    "every column is parsed and its type inferred"
+)
+PD131 = Code("PD131 Large text file read without engine='pyarrow', which is faster")
+PD132 = Code("PD132 'parse_dates' without 'date_format' guesses the date format")
+PD133 = Code(
+    "PD133 Reading one data frame per loop iteration; read them in a "
+    "comprehension passed to 'pd.concat', or in chunks"
+)
+PD134 = Code("PD134 'pd.to_datetime' of a column without 'format' guesses the format")
+PD140 = Code(
+    "PD140 Writing a file on every loop iteration; write once, "
+    "e.g. with 'partition_cols' or a single 'pd.ExcelWriter'"
+)
+PD141 = Code(
+    "PD141 CSV or pickle file written and read back by the same module; "
+    "use Parquet or Feather for intermediate data"
+)
+PD142 = Code("PD142 'to_sql' without 'chunksize' or 'method' inserts one row at a time")
+PD150 = Code(
+    "PD150 Column converted to strings is only used as a group key; "
+    "use astype('category')"
+)
+PD151 = Code(
+    "PD151 'astype' to a 64-bit type; downcast with 'pd.to_numeric' "
+    "or a narrower dtype"
+)
+PD152 = Code(
+    "PD152 Low-cardinality string column built without a dtype; "
+    "use the 'category' dtype when building or reading it"
+)
@@ -0,0 +1,155 @@
+"""Opt-in timing of the registered rules.
+
+Profiling is enabled with `--pandas-vet-profile` or the `PANDAS_VET_PROFILE`
+environment variable. `VetPlugin` then walks trees with a
+`ProfilingVisitor`, which counts the visited nodes of each type and runs
+checks wrapped by `timed`. The numbers go through `stats`, so they are
+aggregated across the worker processes of `flake8 --jobs`, and are
+reported at exit as a table on stderr or as a JSON file.
+
+None of this module is imported while profiling is off.
+"""
+import ast
+import json
+import sys
+import time
+from functools import partial
+from typing import Callable, Dict, List
+
+from . import stats
+from .engine import RULES, Code, Rule, Visitor, compile_rules
+
+# Node types `Visitor` does not walk.
+UNVISITED = (ast.expr_context, ast.boolop, ast.operator, ast.unaryop, ast.cmpop)
+
+# Values of `--pandas-vet-profile` and `PANDAS_VET_PROFILE` printing a table.
+TABLE = ("-", "1")
+
+
+def rule_name(rule: Rule) -> str:
+    """The name of `rule` in the profile, e.g. "PD003 check_for_isnull".
+
+    The rules of rule packs are followed by their pack, e.g. "PDACME001
+    check_for_loc [PDACME]".
+    """
+    name = f"{rule.code} {rule.check.__name__}"
+    return name if rule.pack is None else f"{name} [{rule.pack}]"
+
+
+def timed(rule: Rule) -> Rule:
+    """Return a copy of `rule` whose check records calls, hits and time."""
+    check = rule.check
+    name = rule_name(rule)
+    counters = stats.COUNTERS
+    clock = time.perf_counter
+
+    def wrapper(*args):
+        start = clock()
+        found = check(*args)
+        counters[f"rule:{name}:seconds"] += clock() - start
+        counters[f"rule:{name}:calls"] += 1
+        if found is not None:
+            counters[f"rule:{name}:hits"] += 1 if type(found) is Code else len(found)
+        return found
+
+    wrapper.__name__ = check.__name__
+    return rule._replace(check=wrapper)
+
+
+def instrument(dispatch: Dict) -> Dict:
+    """Return a copy of a dispatch table whose rules are `timed`."""
+    wrapped = {}
+
+    def wrap(rule):
+        if rule not in wrapped:
+            wrapped[rule] = timed(rule)
+        return wrapped[rule]
+
+    return {
+        node_type: (
+            key,
+            {value: tuple(map(wrap, rules)) for value, rules in keyed.items()},
+            tuple(map(wrap, unkeyed)),
+        )
+        for node_type, (key, keyed, unkeyed) in dispatch.items()
+    }
+
+
+class ProfilingVisitor(Visitor):
+    """A `Visitor` counting the visited nodes of each type."""
+
+    def check(self, tree, module=None):
+        counters = stats.COUNTERS
+        for node in ast.walk(tree):
+            if not isinstance(node, UNVISITED):
+                counters[f"node:{type(node).__name__}"] += 1
+        return super().check(tree, module)
+
+
+def enable(destination: str = "-"):
+    """Report the profile at exit.
+
+    Called in the process starting the run, before any worker is forked.
+
+    Args:
+        destination (str): Path of the JSON report, or "-" (or "1") for a
+            table on stderr
+    """
+    stats.enable(partial(report, destination=destination))
+
+
+def visitor(rules: List[Rule] = RULES, **options) -> Callable:
+    """Return a factory of `ProfilingVisitor` timing `rules`.
+
+    The `options`, such as `loop_only`, are passed on to the visitor.
+    """
+    return partial(
+        ProfilingVisitor,
+        dispatch=instrument(compile_rules(rules, combine=False)),
+        track_ancestors=any(rule.context for rule in rules),
+        **options,
+    )
+
+
+def summarize(counters: Dict) -> Dict:
+    """Arrange the `rule:` and `node:` counters of a run by rule and node type."""
+    rules, nodes = {}, {}
+    for key, value in counters.items():
+        kind, _, rest = key.partition(":")
+        if kind == "rule":
+            name, _, field = rest.rpartition(":")
+            rules.setdefault(name, {"calls": 0, "hits": 0, "seconds": 0.0})
+            rules[name][field] = value
+        elif kind == "node":
+            nodes[rest] = value
+    return {
+        "files": counters.get("files", 0),
+        "rules": dict(sorted(rules.items())),
+        "nodes": dict(sorted(nodes.items(), key=lambda item: -item[1])),
+    }
+
+
+def report(counters: Dict, destination: str = "-"):
+    """Write the profile of a run as JSON to `destination`, or as a table."""
+    profile = summarize(counters)
+    if destination not in TABLE:
+        with open(destination, "w") as f:
+            json.dump(profile, f, indent=2)
+        return
+
+    stream = sys.stderr
+    print(f"pandas-vet profile of {profile['files']} files", file=stream)
+    print(
+        f"{'rule':<40} {'calls':>10} {'hits':>8} {'total ms':>10} {'us/call':>8}",
+        file=stream,
+    )
+    for name, rule in profile["rules"].items():
+        per_call = rule["seconds"] / rule["calls"] * 1e6 if rule["calls"] else 0.0
+        print(
+            f"{name:<40} {rule['calls']:>10} {rule['hits']:>8} "
+            f"{rule['seconds'] * 1e3:>10.2f} {per_call:>8.2f}",
+            file=stream,
+        )
+    print(f"{'node type':<40} {'visited':>10}", file=stream)
+    for node_type, count in profile["nodes"].items():
+        print(f"{node_type:<40} {count:>10}", file=stream)
@@ -0,0 +1,339 @@
+"""Long-running lint server for editors, started with `pandas-vet serve`.
+
+The server listens on a Unix socket and answers newline-delimited JSON
+requests. It keeps the enabled rules compiled and, for every open file,
+the syntax tree and errors of each top-level statement keyed by the
+statement's source. When a new version of a buffer arrives, only the
+statements whose source changed are parsed and walked again, along with
+the statements whose errors depend on the rest of the module.
+
+Requests and responses are JSON objects, one per line::
+
+    {"id": 1, "path": "analysis.py", "source": "import pandas\\n..."}
+    {"id": 1, "path": "analysis.py", "elapsed_ms": 1.2, "diagnostics": [
+        {"line": 1, "column": 1, "code": "PD001", "message": "PD001 ..."}]}
+
+`{"method": "close", "path": ...}` forgets a file. Invalid requests get an
+`{"error": ...}` response.
+"""
+import argparse
+import ast
+import json
+import os
+import re
+import socketserver
+import tempfile
+import threading
+import time
+from functools import partial
+from typing import Any, Dict, List, Sequence, Set, Tuple
+
+from . import VetPlugin, disabled_by_default
+from .cli import _codes, is_selected
+
+# Line breaks followed by a line that can start a top-level statement: not
+# indented, not blank and not continuing the statement above it.
+STATEMENT_START = re.compile(r"\n(?![\s#)\]}]|(?:else|elif|except|finally)\b)(?=.)")
+
+TRIPLE_QUOTES = re.compile(r"\"\"\"|\'\'\'")
+
+Errors = Tuple[Tuple[int, int, str], ...]
+
+
+def split_statements(source: str) -> List[Tuple[int, str]]:
+    """Split `source` into the `(first line, source)` of its top-level statements.
+
+    The split only looks at the first character of every line, plus triple
+    quotes, so it is much faster than parsing. It is not exact: a
+    multi-line construct can be split in pieces that are not valid on
+    their own, which `Linter.check` detects and repairs.
+    """
+    strings = []  # (start, end) offsets of triple-quoted strings
+    opened = None
+    for match in TRIPLE_QUOTES.finditer(source):
+        if opened is None:
+            opened = match
+        elif match[0] == opened[0]:
+            strings.append((opened.start(), match.end()))
+            opened = None
+    if opened is not None:
+        strings.append((opened.start(), len(source)))
+
+    offsets = [0]
+    string = 0
+    decorating = source.startswith("@")
+    for match in STATEMENT_START.finditer(source):
+        offset = match.end()
+        while string < len(strings) and strings[string][1] <= offset:
+            string += 1
+        if string < len(strings) and strings[string][0] < offset:
+            continue  # inside a string
+        if not decorating:
+            offsets.append(offset)
+        decorating = source[offset] == "@"
+    offsets.append(len(source))
+
+    statements = []
+    lineno = 1
+    for start, end in zip(offsets, offsets[1:]):
+        text = source[start:end]
+        statements.append((lineno, text))
+        lineno += text.count("\n")
+    return statements
+
+
+class _Statement:
+    """A parsed top-level statement, and its errors relative to its first line."""
+
+    __slots__ = ("tree", "errors", "used_module")
+
+    def __init__(self, tree: ast.Module):
+        self.tree = tree
+        self.errors: Errors = None
+        # Whether the errors depend on the other statements of the module.
+        self.used_module = False
+
+
+class Linter:
+    """The errors of the open files, checked incrementally.
+
+    Only the statements whose source changed are parsed again. The
+    statements are walked as parts of the module made of all of them, so
+    that checks find the same symbols (`Visitor.symbols`) and following
+    statements as in a full check. The statements whose errors depended on
+    the rest of the module are walked again on every check.
+
+    Args:
+        cache_size (int): Maximum number of open files
+    """
+
+    def __init__(self, cache_size: int = 100):
+        # The statements of every file, and the pieces of statements found
+        # in it, which `split_statements` will split again.
+        self.documents: Dict[str, Tuple[Dict[str, _Statement], Set[str]]] = {}
+        self.cache_size = cache_size
+        self.lock = threading.Lock()
+
+    def check(self, path: str, source: str) -> List[Tuple[int, int, str]]:
+        """Return the `(lineno, col, message)` errors of a version of `path`.
+
+        Like flake8, sources the pre-filter rules out are not checked at all.
+        """
+        VetPlugin.load()
+        if (
+            VetPlugin.prefilter is not None
+            and VetPlugin.prefilter.search(source) is None
+        ):
+            return []
+        with self.lock:
+            previous, pieces = self.documents.pop(path, ({}, set()))
+            current, broken = {}, []
+            parsed = []  # (first line, statement)
+            syntax_errors = []
+            statements = split_statements(source)
+            i = 0
+            while i < len(statements):
+                start, text = statements[i]
+                if text in pieces:
+                    # Try to join the pieces of a statement seen before.
+                    j = i + 1
+                    while text not in previous and j < min(len(statements), i + 100):
+                        text += statements[j][1]
+                        j += 1
+                    if text in previous:
+                        statements[i:j] = [(start, text)]
+                    else:
+                        text = statements[i][1]
+                statement = previous.get(text)
+                if statement is None:
+                    statement = current.get(text)
+                if statement is None:
+                    try:
+                        statement = _Statement(self.parse_statement(text))
+                    except SyntaxError:
+                        # Split in the middle of a statement: split the rest of
+                        # the source again, from a full parse.
+                        broken.append(text)
+                        rest = "".join(piece for _, piece in statements[i:])
+                        try:
+                            statements[i:] = self.resplit(start, rest)
+                        except SyntaxError as e:
+                            lineno = start + (e.lineno or 1) - 1
+                            syntax_errors.append(
+                                (lineno, 0, f"E999 SyntaxError: {e.msg}")
+                            )
+                            break
+                        continue
+                current[text] = statement
+                parsed.append((start, statement))
+                i += 1
+            errors = self.walk(parsed)
+            errors.extend(syntax_errors)
+            self.documents[path] = (current, set(broken))
+            while len(self.documents) > self.cache_size:
+                del self.documents[next(iter(self.documents))]
+            return errors
+
+    @staticmethod
+    def walk(parsed: List[Tuple[int, _Statement]]) -> List[Tuple[int, int, str]]:
+        """Check the statements without errors yet, or depending on the module."""
+        module = ast.Module(
+            body=[node for _, statement in parsed for node in statement.tree.body],
+            type_ignores=[],
+        )
+        visitor = VetPlugin.visitor()
+        errors = []
+        for start, statement in parsed:
+            if statement.errors is None or statement.used_module:
+                found = visitor.check(statement.tree, module)
+                statement.errors = tuple(e[:3] for e in found)
+                statement.used_module = visitor.used_module
+            errors.extend(
+                (start + line - 1, col, msg) for line, col, msg in statement.errors
+            )
+        return errors
+
+    def close(self, path: str):
+        """Forget the statements of `path`."""
+        with self.lock:
+            self.documents.pop(path, None)
+
+    @staticmethod
+    def parse_statement(text: str) -> ast.Module:
+        """Parse a top-level statement, with line numbers relative to it.
+
+        The statement is always parsed, even when the pre-filter would skip
+        it, since a statement that does not parse reveals a wrong split.
+        """
+        return ast.parse(text)
+
+    @staticmethod
+    def resplit(start: int, source: str) -> List[Tuple[int, str]]:
+        """Split `source`, starting at line `start`, at its real statements."""
+        tree = ast.parse(source)
+        lines = source.splitlines(keepends=True)
+        firsts = [
+            min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", ())])
+            for node in tree.body
+        ]
+        bounds = [1] + firsts[1:] + [len(lines) + 1]
+        return [
+            (start + first - 1, "".join(lines[first - 1 : last - 1]))
+            for first, last in zip(bounds, bounds[1:])
+        ]
+
+    def handle(self, request: Any) -> dict:
+        """Answer one request of the protocol, see the module documentation."""
+        if not isinstance(request, dict):
+            return {"error": "TypeError: a request must be a JSON object"}
+        started = time.perf_counter()
+        response = {"id": request.get("id"), "path": request.get("path")}
+        method = request.get("method", "check")
+        if method == "close":
+            self.close(request["path"])
+        elif method == "check":
+            errors = self.check(request["path"], request["source"])
+            response["diagnostics"] = [
+                {
+                    "line": lineno,
+                    "column": col + 1,
+                    "code": message.split(" ", 1)[0],
+                    "message": message,
+                }
+                for lineno, col, message in sorted(errors)
+            ]
+        else:
+            raise ValueError(f"unknown method {method!r}")
+        response["elapsed_ms"] = (time.perf_counter() - started) * 1e3
+        return response
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                response = self.server.linter.handle(json.loads(line))
+            except (KeyError, TypeError, ValueError) as e:
+                response = {"error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingUnixStreamServer):
+    """Serves a `Linter` on the Unix socket `address`, one thread per client."""
+
+    daemon_threads = True
+
+    def __init__(self, address: str, linter: Linter = None):
+        if os.path.exists(address):
+            os.unlink(address)
+        super().__init__(address, _Handler)
+        self.linter = linter or Linter()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def default_socket() -> str:
+    """The socket the server listens on when none is given."""
+    directory = os.environ.get("XDG_RUNTIME_DIR") or tempfile.gettempdir()
+    return os.path.join(directory, f"pandas-vet-{os.getuid()}.sock")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the parser of the `pandas-vet serve` command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="pandas-vet serve",
+        description="Serve pandas-vet checks to editors on a Unix socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=default_socket(),
+        help="Path of the Unix socket. (Default: %(default)s)",
+    )
+    parser.add_argument(
+        "--annoy",
+        action="store_true",
+        help="Activate the checks that are off by default (PD9xx).",
+    )
+    parser.add_argument(
+        "--select",
+        type=_codes,
+        default=["PD"],
+        help="Comma-separated list of error codes to enable. (Default: PD)",
+    )
+    parser.add_argument(
+        "--ignore",
+        type=_codes,
+        default=[],
+        help="Comma-separated list of error codes to ignore.",
+    )
+    parser.add_argument(
+        "--skip-agnostic",
+        action="store_true",
+        help="See the --pandas-vet-skip-agnostic flake8 option.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] = None) -> int:
+    """Run the server until interrupted."""
+    args = build_parser().parse_args(argv)
+    ignore = list(args.ignore)
+    if not args.annoy:
+        ignore.extend(disabled_by_default)
+    VetPlugin.configure(
+        skip_agnostic=args.skip_agnostic,
+        select=partial(is_selected, select=args.select, ignore=ignore),
+    )
+    with Server(args.socket) as server:
+        print(f"pandas-vet serving on {args.socket}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    return 0
@@ -0,0 +1,95 @@
+"""Counters describing a pandas-vet run.
+
+flake8 checks files in several worker processes when `--jobs` is used, so
+each process keeps its own `COUNTERS` and, when statistics are enabled,
+writes them to a spool directory after every file. The process that
+enabled the statistics merges the spooled counters and reports them at
+exit.
+"""
+import atexit
+import collections
+import json
+import os
+import shutil
+import sys
+import tempfile
+from typing import Callable, List, TextIO
+
+_ENV = "PANDAS_VET_STATS_DIR"
+
+COUNTERS = collections.Counter()
+
+# Inherited from the process that called `enable`, if any.
+DIRECTORY = os.environ.get(_ENV)
+
+_REPORTERS: List[Callable] = []
+
+
+def enable(reporter: Callable = None):
+    """Collect counters across processes and report them at exit.
+
+    Worker processes inherit the spool directory through the environment,
+    so calling this again from a worker that re-parses the options only
+    adds the reporter.
+
+    Args:
+        reporter (Callable): Called at exit with the counters of the whole
+            run. Defaults to `summary`.
+    """
+    global DIRECTORY
+    _REPORTERS.append(reporter or summary)
+    if DIRECTORY:
+        return
+    DIRECTORY = tempfile.mkdtemp(prefix="pandas-vet-stats-")
+    os.environ[_ENV] = DIRECTORY
+    atexit.register(report)
+
+
+def flush():
+    """Write the counters of this process to the spool directory."""
+    if not DIRECTORY:
+        return
+    path = os.path.join(DIRECTORY, f"{os.getpid()}.json")
+    with open(path + ".tmp", "w") as f:
+        json.dump(COUNTERS, f)
+    os.replace(path + ".tmp", path)
+
+
+def collect() -> collections.Counter:
+    """Merge the counters spooled by every process.
+
+    Returns:
+        counters (collections.Counter): The counters of the whole run
+    """
+    flush()
+    total = collections.Counter()
+    for name in os.listdir(DIRECTORY):
+        if name.endswith(".json"):
+            with open(os.path.join(DIRECTORY, name)) as f:
+                total.update(json.load(f))
+    return total
+
+
+def report():
+    """Pass the counters of the whole run to the reporters and clean up."""
+    global DIRECTORY
+    if not DIRECTORY:
+        return
+    counters = collect()
+    shutil.rmtree(DIRECTORY, ignore_errors=True)
+    os.environ.pop(_ENV, None)
+    DIRECTORY = None
+    for reporter in _REPORTERS:
+        reporter(counters)
+    _REPORTERS.clear()
+
+
+def summary(counters: collections.Counter, stream: TextIO = None):
+    """Print how many files were checked, skipped and found in the cache."""
+    print(
+        f"pandas-vet: {counters['files']} files, "
+        f"{counters['files_skipped']} skipped by the source pre-filter, "
+        f"{counters['cache_hits']} cache hits, "
+        f"{counters['cache_misses']} cache misses",
+        file=stream or sys.stderr,
+    )
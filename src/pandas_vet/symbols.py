@@ -0,0 +1,264 @@
+"""What the names of a module are bound to, as far as pandas is concerned.
+
+The syntax tree does not know that `pd` is pandas or that `sales` holds a
+DataFrame. `Symbols` finds out once per module, from its import and
+assignment statements, so that checks can answer such questions with a
+set lookup instead of each scanning the tree again. See `Visitor.symbols`.
+
+The table is flow-insensitive: a name bound to pandas or to a DataFrame
+anywhere in the module, in any scope, counts everywhere.
+"""
+import ast
+import functools
+from collections import Counter
+from typing import Dict, Optional, Set, Tuple
+
+# The pandas functions returning a DataFrame or a Series. Every `read_*`
+# function counts too.
+FRAME_FUNCTIONS = frozenset(
+    [
+        "DataFrame",
+        "Series",
+        "concat",
+        "crosstab",
+        "get_dummies",
+        "json_normalize",
+        "melt",
+        "merge",
+        "merge_asof",
+        "merge_ordered",
+        "pivot",
+        "pivot_table",
+    ]
+)
+
+# The pandas classes whose annotations make a name a DataFrame or a Series.
+FRAME_TYPES = frozenset(["DataFrame", "Series"])
+
+# The methods writing intermediate files, by the name of their path argument.
+INTERMEDIATE_WRITERS = {"to_csv": "path_or_buf", "to_pickle": "path"}
+
+# The fields of compound statements holding other statements.
+_BODIES = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+@functools.lru_cache(maxsize=None)
+def _body_fields(node_type: type) -> Tuple[str, ...]:
+    return tuple(field for field in _BODIES if field in node_type._fields)
+
+
+class Symbols:
+    """The pandas names and the DataFrame-like names of a module.
+
+    Attributes:
+        modules (Set[str]): Names bound to the pandas module. `pd` is
+            assumed to be pandas unless the module binds it to something else.
+        functions (Dict[str, str]): Names bound to pandas functions or
+            classes by `from pandas import ...`, mapped to their pandas name
+        frames (Set[str]): Names assigned a DataFrame or a Series: the result
+            of a pandas function in `FRAME_FUNCTIONS` or `read_*`, of an
+            expression on another such name (`df.dropna()`, `df[mask]`), or
+            annotated with `pd.DataFrame` or `pd.Series`
+        reads (Dict[str, ast.Call]): Names assigned the result of a pandas
+            `read_*` function, mapped to the call
+        written (Dict[str, str]): Files written by an expression statement
+            calling a method of `INTERMEDIATE_WRITERS`, mapped to the method.
+            See `path_key` for the keys.
+
+    The string literals of the module, such as column names, are counted by
+    `strings` and `group_keys` on first use, in a single walk of the module.
+    """
+
+    __slots__ = (
+        "modules",
+        "functions",
+        "frames",
+        "reads",
+        "written",
+        "_tree",
+        "_strings",
+        "_group_keys",
+    )
+
+    def __init__(self, tree: ast.AST = None):
+        self.modules: Set[str] = {"pd"}
+        self.functions: Dict[str, str] = {}
+        self.frames: Set[str] = set()
+        self.reads: Dict[str, ast.Call] = {}
+        self.written: Dict[str, str] = {}
+        self._tree = None
+        self._strings: Optional[Counter] = None
+        self._group_keys: Optional[Counter] = None
+        if tree is not None:
+            self.scan(tree)
+
+    def scan(self, tree: ast.AST):
+        """Record the bindings made by the statements of `tree`.
+
+        Only statements are visited, not the expressions inside them, so the
+        scan costs a fraction of a full walk.
+        """
+        self._tree = tree
+        self._strings = self._group_keys = None
+        stack = [tree]
+        while stack:
+            node = stack.pop()
+            kind = type(node)
+            if kind is ast.Import:
+                self._import(node)
+            elif kind is ast.ImportFrom:
+                self._import_from(node)
+            elif kind is ast.Assign:
+                if self.is_frame(node.value):
+                    for target in node.targets:
+                        self._bind_frame(target)
+                        self._bind_read(target, node.value)
+            elif kind is ast.AnnAssign:
+                if self.is_frame_type(node.annotation) or (
+                    node.value is not None and self.is_frame(node.value)
+                ):
+                    self._bind_frame(node.target)
+            elif kind is ast.FunctionDef or kind is ast.AsyncFunctionDef:
+                arguments = node.args
+                for arg in (
+                    arguments.posonlyargs + arguments.args + arguments.kwonlyargs
+                ):
+                    if arg.annotation is not None and self.is_frame_type(
+                        arg.annotation
+                    ):
+                        self.frames.update([arg.arg])
+            elif kind is ast.Expr:
+                self._write(node.value)
+            for field in _body_fields(kind):
+                stack.extend(reversed(getattr(node, field)))
+
+    @property
+    def strings(self) -> Counter:
+        """How many times each string literal appears in the module."""
+        if self._strings is None:
+            self._count_strings()
+        return self._strings
+
+    @property
+    def group_keys(self) -> Counter:
+        """How many times each string literal appears in the arguments of a `.groupby` call.
+
+        For example, `df.groupby(["region", df["year"]])` counts "region"
+        and "year".
+        """
+        if self._group_keys is None:
+            self._count_strings()
+        return self._group_keys
+
+    def _count_strings(self):
+        self._strings = strings = Counter()
+        self._group_keys = group_keys = Counter()
+        if self._tree is None:
+            return
+        for node in ast.walk(self._tree):
+            kind = type(node)
+            if kind is ast.Constant and type(node.value) is str:
+                strings[node.value] += 1
+            elif (
+                kind is ast.Call
+                and type(node.func) is ast.Attribute
+                and node.func.attr == "groupby"
+            ):
+                for argument in node.args + [k.value for k in node.keywords]:
+                    for child in ast.walk(argument):
+                        if type(child) is ast.Constant and type(child.value) is str:
+                            group_keys[child.value] += 1
+
+    def _import(self, node: ast.Import):
+        for alias in node.names:
+            bound = alias.asname or alias.name.split(".", 1)[0]
+            if alias.name == "pandas" or (
+                alias.asname is None and alias.name.startswith("pandas.")
+            ):
+                self.modules.update([bound])
+            else:
+                self.modules.discard(bound)
+
+    def _import_from(self, node: ast.ImportFrom):
+        if node.module != "pandas" or node.level:
+            return
+        for alias in node.names:
+            self.functions[alias.asname or alias.name] = alias.name
+
+    def _write(self, node: ast.AST):
+        if type(node) is not ast.Call or type(node.func) is not ast.Attribute:
+            return
+        method = node.func.attr
+        if method in INTERMEDIATE_WRITERS:
+            key = path_key(node, INTERMEDIATE_WRITERS[method])
+            if key is not None:
+                self.written[key] = method
+
+    def _bind_frame(self, target: ast.AST):
+        if isinstance(target, ast.Name):
+            self.frames.update([target.id])
+
+    def _bind_read(self, target: ast.AST, value: ast.AST):
+        if isinstance(target, ast.Name) and type(value) is ast.Call:
+            function = self.pandas_function(value)
+            if function is not None and function.startswith("read_"):
+                self.reads[target.id] = value
+
+    def is_pandas(self, node: ast.AST) -> bool:
+        """Whether `node` is a name bound to the pandas module."""
+        return isinstance(node, ast.Name) and node.id in self.modules
+
+    def pandas_function(self, node: ast.Call) -> Optional[str]:
+        """The pandas function called by `node`, e.g. "merge" for `pd.merge(...)`."""
+        func = node.func
+        if isinstance(func, ast.Attribute) and self.is_pandas(func.value):
+            return func.attr
+        if isinstance(func, ast.Name):
+            return self.functions.get(func.id)
+        return None
+
+    def is_frame_type(self, node: ast.AST) -> bool:
+        """Whether the annotation `node` is `pd.DataFrame` or `pd.Series`."""
+        if isinstance(node, ast.Attribute) and self.is_pandas(node.value):
+            return node.attr in FRAME_TYPES
+        if isinstance(node, ast.Name):
+            return self.functions.get(node.id) in FRAME_TYPES
+        return False
+
+    def is_frame(self, node: ast.AST) -> bool:
+        """Whether the expression `node` plausibly evaluates to a DataFrame or Series.
+
+        That is a name in `frames`, a call to a pandas function returning
+        one, or a method call, attribute or subscript on such an expression.
+        """
+        while True:
+            kind = type(node)
+            if kind is ast.Name:
+                return node.id in self.frames
+            if kind is ast.Call:
+                function = self.pandas_function(node)
+                if function is not None:
+                    return function in FRAME_FUNCTIONS or function.startswith("read_")
+                node = node.func
+            elif kind is ast.Attribute or kind is ast.Subscript:
+                node = node.value
+            else:
+                return False
+
+
+def path_key(node: ast.Call, keyword: str) -> Optional[str]:
+    """Identify the file a call reads or writes, from its first argument or `keyword`.
+
+    A string literal is its own key, and a variable is "name:" followed by
+    its name, so that the same variable is the same file. Other expressions
+    give None.
+    """
+    if node.args:
+        path = node.args[0]
+    else:
+        path = next((k.value for k in node.keywords if k.arg == keyword), None)
+    if type(path) is ast.Constant and type(path.value) is str:
+        return path.value
+    if type(path) is ast.Name:
+        return f"name:{path.id}"
+    return None
@@ -0,0 +1,60 @@
+import ast
+from argparse import Namespace
+
+import pytest
+
+from pandas_vet import VetPlugin, cache, disabled_by_default
+
+
+@pytest.fixture
+def errors_of():
+    """Return a function listing the errors of one code found in a source."""
+
+    def check(source, code):
+        errors = VetPlugin(ast.parse(source)).run()
+        return [e for e in errors if e[2].split(" ", 1)[0] == code.code]
+
+    return check
+
+
+@pytest.fixture
+def restore_plugin():
+    """Restore the configuration of `VetPlugin` after a test changed it."""
+    defaults = dict(vars(VetPlugin))
+    yield
+    for name in ("settings", "loaded", "prefilter", "cache", "visitor"):
+        setattr(VetPlugin, name, defaults[name])
+
+
+@pytest.fixture
+def parse_options(tmp_path, restore_plugin):
+    """Configure `VetPlugin` as flake8 would, restoring the defaults afterwards.
+
+    Returns a function taking option values that override the defaults of
+    `VetPlugin.add_options`. The result cache is disabled unless
+    `pandas_vet_no_cache=False` is passed, in which case it lives in `tmp_path`.
+    """
+
+    def configure(**overrides):
+        options = Namespace(
+            select=None,
+            extend_select=None,
+            ignore=None,
+            extend_ignore=None,
+            extended_default_select=["PD"],
+            extended_default_ignore=list(disabled_by_default),
+            annoy=False,
+            pandas_vet_skip_agnostic=False,
+            pandas_vet_stats=False,
+            pandas_vet_cache_dir=str(tmp_path / "cache"),
+            pandas_vet_cache_size=cache.DEFAULT_MAX_ENTRIES,
+            pandas_vet_no_cache=True,
+            pandas_vet_profile=None,
+            pandas_vet_loop_only=[],
+            pandas_vet_escalate=[],
+        )
+        vars(options).update(overrides)
+        VetPlugin.parse_options(None, options, [])
+        return options
+
+    return configure
@@ -49,3 +49,14 @@ def test_PD011_pass_node_Name():
     actual = list(VetPlugin(tree).run())
     expected = []
     assert actual == expected
+
+
+def test_PD011_leaves_tree_untouched():
+    """
+    Test that checking a tree does not leave anything on its nodes.
+    """
+    statement = "result = df.values + {}.values()"
+    tree = ast.parse(statement)
+    list(VetPlugin(tree).run())
+    for node in ast.walk(tree):
+        assert set(vars(node)) <= set(node._fields) | set(node._attributes)
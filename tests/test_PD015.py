@@ -57,3 +57,29 @@ def test_PD015_pass_merge_no_id_func_value():
     expected = []
     actual = list(VetPlugin(tree).run())
     assert actual == expected
+
+
+def test_PD015_fail_merge_on_pandas_aliases():
+    """
+    Test that pd.merge is recognized under any name bound to pandas.
+    """
+    for statement in [
+        "import pandas\npandas.merge(df1, df2)",
+        "import pandas as pds\npds.merge(df1, df2)",
+        "from pandas import merge\nmerge(df1, df2)",
+    ]:
+        tree = ast.parse(statement)
+        actual = [e[:3] for e in VetPlugin(tree).run() if e[2].startswith("PD015")]
+        assert actual == [PD015(2, 0)[:3]], statement
+
+
+def test_PD015_pass_merge_on_other_objects():
+    """
+    Test that merge functions of other modules do not generate an error.
+    """
+    for statement in [
+        "import numpy as pd\npd.merge(df1, df2)",
+        "from heapq import merge\nmerge(a, b)",
+    ]:
+        tree = ast.parse(statement)
+        assert list(VetPlugin(tree).run()) == [], statement
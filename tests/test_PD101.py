@@ -0,0 +1,30 @@
+import ast
+
+from pandas_vet import PD101, VetPlugin
+
+
+def test_PD101_pass_vectorized():
+    """
+    Test that vectorized operations do not result in an error.
+    """
+    statement = "total = (sales['price'] * sales['quantity']).sum()"
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == []
+
+
+def test_PD101_fail_loop():
+    """
+    Test that looping over .iterrows() results in an error.
+    """
+    statement = "for index, row in sales.iterrows():\n    print(row)\n"
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == [PD101(1, 18)]
+
+
+def test_PD101_fail_comprehension():
+    """
+    Test that iterating .iterrows() in a comprehension results in an error.
+    """
+    statement = "rows = [row for _, row in enumerate(sales.iterrows())]"
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == [PD101(1, 36)]
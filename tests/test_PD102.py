@@ -0,0 +1,21 @@
+import ast
+
+from pandas_vet import PD102, VetPlugin
+
+
+def test_PD102_pass_to_numpy():
+    """
+    Test that converting rows to arrays does not result in an error.
+    """
+    statement = "rows = sales.to_numpy()"
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == []
+
+
+def test_PD102_fail_loop():
+    """
+    Test that looping over .itertuples() results in an error.
+    """
+    statement = "for row in sales.itertuples(index=False):\n    print(row.price)\n"
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == [PD102(1, 11)]
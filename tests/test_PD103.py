@@ -0,0 +1,34 @@
+import ast
+
+import pytest
+
+from pandas_vet import PD103, VetPlugin
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "totals = sales['price'].apply(round)",
+        "totals = sales.apply(sum, axis=0)",
+        "totals = sales.apply(sum, axis=True)",
+        "totals = sales.apply(sum, axis=axis)",
+    ],
+)
+def test_PD103_pass(statement):
+    """
+    Test that .apply() on columns does not result in an error.
+    """
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == []
+
+
+@pytest.mark.parametrize("axis", ["1", "'columns'"])
+def test_PD103_fail(axis):
+    """
+    Test that .apply() on every row results in an error.
+    """
+    statement = (
+        f"totals = sales.apply(lambda row: row.price * row.quantity, axis={axis})"
+    )
+    tree = ast.parse(statement)
+    assert list(VetPlugin(tree).run()) == [PD103(1, 9)]
@@ -0,0 +1,35 @@
+import pytest
+
+from pandas_vet import PD104
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "for i in range(len(sales)):\n    print(i)\n",
+        "for i in range(10):\n    sales.loc[i, 'total'] = 0\n",
+        "for i in range(len(sales)):\n    sales.loc[0, 'total'] = i\n",
+        "for name in sales.columns:\n    sales.loc[name] = 0\n",
+        "for i, label in enumerate(sales.index):\n    sales.at[label, 'a'] = i\n",
+    ],
+)
+def test_PD104_pass(statement, errors_of):
+    """
+    Test that loops not accessing values by their loop index do not result in an error.
+    """
+    assert errors_of(statement, PD104) == []
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "for i in range(len(sales)):\n    sales.loc[i, 'total'] = sales.loc[i, 'a']\n",
+        "for i in range(0, sales.shape[0]):\n    print(sales.iat[i, 0])\n",
+        "for label in sales.index:\n    if True:\n        sales.at[label, 'a'] += 1\n",
+    ],
+)
+def test_PD104_fail(statement, errors_of):
+    """
+    Test that loops accessing values one index at a time result in an error.
+    """
+    assert errors_of(statement, PD104) == [PD104(1, 0)]
@@ -0,0 +1,53 @@
+import pytest
+
+from pandas_vet import PD110
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.concat([sales, extra])",
+        "for path in paths:\n    pieces.append(pd.read_csv(path))\n"
+        "sales = pd.concat(pieces)\n",
+        "for path in paths:\n    sales = pd.concat([other, extra])\n",
+        "for path in paths:\n    sales = np.concat([sales, extra])\n",
+        "for path in paths:\n    sales = other.append(row)\n",
+        "for row in rows:\n    sales.loc[len(other)] = row\n",
+        "for row in rows:\n    sales.loc[0] = row\n",
+        "for row in rows:\n    print(sales.loc[len(sales)])\n",
+        "for path in paths:\n    def load(sales):\n"
+        "        sales = pd.concat([sales, extra])\n",
+        "for sales in pd.concat([sales, extra]):\n    pass\n",
+        "for path in paths:\n    pass\nelse:\n    sales = pd.concat([sales, extra])\n",
+    ],
+)
+def test_PD110_pass(statement, errors_of):
+    """
+    Test that growing a data frame once, or other data frames, does not result in an error.
+    """
+    assert errors_of(statement, PD110) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("for path in paths:\n    sales = pd.concat([sales, extra])\n", 2, 4),
+        ("for path in paths:\n    sales = pd.concat((extra, sales), axis=0)\n", 2, 4),
+        (
+            "import pandas as pds\nwhile True:\n"
+            "    self.sales = pds.concat([self.sales, extra])\n",
+            3,
+            4,
+        ),
+        ("for path in paths:\n    if path:\n        sales = sales.append(row)\n", 3, 8),
+        ("for row in rows:\n    sales.loc[len(sales)] = row\n", 2, 4),
+        ("for row in rows:\n    sales.loc[len(sales.index), 'a'] = row\n", 2, 4),
+        ("while rows:\n    sales.loc[sales.shape[0]] = rows.pop()\n", 2, 4),
+        ("def load():\n    for path in paths:\n        s = pd.concat([s, x])\n", 3, 8),
+    ],
+)
+def test_PD110_fail(statement, lineno, col, errors_of):
+    """
+    Test that growing a data frame on every iteration of a loop results in an error.
+    """
+    assert errors_of(statement, PD110) == [PD110(lineno, col)]
@@ -0,0 +1,43 @@
+import pytest
+
+from pandas_vet import PD120
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)\nsales.loc[mask, 'discount'] = 0.1\n",
+        "sales = pd.read_csv(path)\nsales['discount'] = 0.1\n",
+        "sales = pd.read_csv(path)\nsales.at[label, 'price'] = 9.99\n",
+        "sales = pd.read_csv(path)\nprice = sales['price'][label]\n",
+        "config['section']['key'] = 1\n",
+        "matrix[i][j] = 0\n",
+    ],
+)
+def test_PD120_pass(statement, errors_of):
+    """
+    Test that single indexing assignments, reads and other containers do not result in an error.
+    """
+    assert errors_of(statement, PD120) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        (
+            "sales = pd.read_csv(path)\nsales[sales['price'] > 0]['discount'] = 0.1\n",
+            2,
+            0,
+        ),
+        ("sales = pd.read_csv(path)\nsales['price'][label] = 9.99\n", 2, 0),
+        ("sales = pd.read_csv(path)\nsales.loc[mask]['price'] = 9.99\n", 2, 0),
+        ("sales = pd.read_csv(path)\nsales['price'].iloc[0] = 9.99\n", 2, 0),
+        ("sales = pd.read_csv(path)\nsales['price'][label] += 1\n", 2, 0),
+        ("def scale(sales: pd.DataFrame):\n    sales['price'][label] = 0\n", 2, 4),
+    ],
+)
+def test_PD120_fail(statement, lineno, col, errors_of):
+    """
+    Test that assigning through chained indexing of a data frame results in an error.
+    """
+    assert errors_of(statement, PD120) == [PD120(lineno, col)]
@@ -0,0 +1,51 @@
+import pytest
+
+from pandas_vet import PD121
+
+READ = "sales = pd.read_csv(path)\n"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        READ + "recent = sales[sales['year'] > 2020].copy()\n",
+        READ + "backup = sales.copy()\nbackup['price'] = 0\n",
+        READ + "recent = sales.copy()\nrecent = recent.dropna()\n",
+        READ + "recent = sales.copy()\nother = recent[mask]\n",
+        READ + "recent = copy(sales)\nrecent = recent[mask]\n",
+        READ + "recent = sales.copy()\n",
+        READ + "values = sales.copy().values\n",
+        "recent = sales.copy()[sales['year'] > 2020]\n",
+        "x = cfg.copy()[0]\n",
+        "items = base.copy()\nitems = []\n",
+    ],
+)
+def test_PD121_pass(statement, errors_of):
+    """
+    Test that copies that are kept or modified, or that are not data frames,
+    do not result in an error.
+    """
+    assert errors_of(statement, PD121) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        (READ + "recent = sales.copy()[sales['year'] > 2020]\n", 2, 9),
+        (READ + "price = sales.copy().loc[label, 'price']\n", 2, 8),
+        (
+            READ + "recent = sales.copy()\nrecent = recent[recent['year'] > 2020]\n",
+            2,
+            0,
+        ),
+        (READ + "recent = sales.copy()\nrecent = recent.iloc[:10]\n", 2, 0),
+        (READ + "if x:\n    recent = sales.copy()\n    recent = load()\n", 3, 4),
+        ("def f(sales: pd.DataFrame):\n    return sales.copy()[mask]\n", 2, 11),
+    ],
+)
+def test_PD121_fail(statement, lineno, col, errors_of):
+    """
+    Test that copies of data frames indexed or overwritten right away result
+    in an error.
+    """
+    assert errors_of(statement, PD121) == [PD121(lineno, col)]
@@ -0,0 +1,45 @@
+import pytest
+
+from pandas_vet import PD130
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)",
+        "sales = pd.read_csv(path, low_memory=False, usecols=['date', 'price'])",
+        "sales = pd.read_csv(path, chunksize=1000, dtype={'price': 'float32'})",
+        "sales = pd.read_table(path, memory_map=True, usecols=[0, 1], dtype=str)",
+        "sales = pd.read_csv(path, chunksize=None)",
+        "sales = pd.read_csv(path, low_memory=True)",
+        "sales = pd.read_csv(path, usecols=['date'])['date']",
+        "sales = pd.read_csv(path, low_memory=False, **options)",
+        "sales = pd.read_parquet(path)[['date', 'price']]",
+        "import csv as pd\nrows = pd.read_csv(path, low_memory=False)",
+    ],
+)
+def test_PD130_pass(statement, errors_of):
+    """
+    Test that reads not known to be large, or choosing their columns or types,
+    do not result in an error.
+    """
+    assert errors_of(statement, PD130) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales = pd.read_csv(path, low_memory=False)", 1, 8),
+        ("sales = pd.read_table(path, sep=',', memory_map=True)", 1, 8),
+        ("for chunk in pd.read_csv(path, chunksize=10_000):\n    pass\n", 1, 13),
+        ("reader = pd.read_csv(path, iterator=True)", 1, 9),
+        ("prices = pd.read_csv(path)[['date', 'price']]", 1, 9),
+        ("from pandas import read_csv\nsales = read_csv(path, low_memory=False)", 2, 8),
+    ],
+)
+def test_PD130_fail(statement, lineno, col, errors_of):
+    """
+    Test that reading every column of a large file with inferred types
+    results in an error.
+    """
+    assert errors_of(statement, PD130) == [PD130(lineno, col)]
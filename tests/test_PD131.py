@@ -0,0 +1,38 @@
+import pytest
+
+from pandas_vet import PD131
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)",
+        "sales = pd.read_csv(path, engine='pyarrow')",
+        "sales = pd.read_csv(path, low_memory=False, engine='c')",
+        "sales = pd.read_table(path, memory_map=True, engine='python')",
+        "sales = pd.read_csv(path, low_memory=False, engine=engine)",
+        "sales = pd.read_csv(path, chunksize=1000)",
+        "sales = pd.read_csv(path, low_memory=False, **options)",
+        "sales = pd.read_json(path, low_memory=False)",
+    ],
+)
+def test_PD131_pass(statement, errors_of):
+    """
+    Test that reads not known to be large, streamed or choosing their engine
+    do not result in an error.
+    """
+    assert errors_of(statement, PD131) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales = pd.read_csv(path, low_memory=False)", 1, 8),
+        ("sales = pd.read_table(path, memory_map=True)", 1, 8),
+    ],
+)
+def test_PD131_fail(statement, lineno, col, errors_of):
+    """
+    Test that large reads with the default engine result in an error.
+    """
+    assert errors_of(statement, PD131) == [PD131(lineno, col)]
@@ -0,0 +1,33 @@
+import pytest
+
+from pandas_vet import PD132
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)",
+        "sales = pd.read_csv(path, parse_dates=['date'], date_format='%Y-%m-%d')",
+        "sales = pd.read_csv(path, parse_dates=False)",
+        "sales = pd.read_csv(path, parse_dates=['date'], **options)",
+    ],
+)
+def test_PD132_pass(statement, errors_of):
+    """
+    Test that reads without dates, or with their format, do not result in an error.
+    """
+    assert errors_of(statement, PD132) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales = pd.read_csv(path, parse_dates=['date'])", 1, 8),
+        ("sales = pd.read_table(path, parse_dates=True)", 1, 8),
+    ],
+)
+def test_PD132_fail(statement, lineno, col, errors_of):
+    """
+    Test that parsing dates without their format results in an error.
+    """
+    assert errors_of(statement, PD132) == [PD132(lineno, col)]
@@ -0,0 +1,47 @@
+import pytest
+
+from pandas_vet import PD133
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)",
+        "sales = pd.concat([pd.read_csv(path) for path in paths])",
+        "for path in paths:\n    pieces.append(pd.read_csv(path))",
+        "for path in paths:\n    frame = pd.read_parquet(path)\n"
+        "    frame['source'] = path\n    pieces.append(frame)",
+        "for path in paths:\n    frames[path] = pd.read_csv(path)",
+        "for path in paths:\n    sales = pd.concat([sales, pd.read_csv(path)])",
+        "for path in paths:\n    yield pd.read_csv(path)",
+        "for path in paths:\n    for chunk in pd.read_csv(path, chunksize=1000):\n"
+        "        total += chunk['price'].sum()",
+        "for sales in pd.read_csv(path, iterator=True):\n    pass",
+        "for path in paths:\n    def load():\n        return pd.read_csv(path)",
+    ],
+)
+def test_PD133_pass(statement, errors_of):
+    """
+    Test that reads outside of loops, chunked or collected do not result in an error.
+    """
+    assert errors_of(statement, PD133) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        (
+            "for path in paths:\n    sales = pd.read_csv(path)\n"
+            "    total += sales['price'].sum()",
+            2,
+            12,
+        ),
+        ("while paths:\n    sales = pd.read_excel(paths.pop())", 2, 12),
+        ("for path in paths:\n    print(pd.read_json(path).shape)", 2, 10),
+    ],
+)
+def test_PD133_fail(statement, lineno, col, errors_of):
+    """
+    Test that reading a data frame on every iteration of a loop results in an error.
+    """
+    assert errors_of(statement, PD133) == [PD133(lineno, col)]
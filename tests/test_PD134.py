@@ -0,0 +1,35 @@
+import pytest
+
+from pandas_vet import PD134
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales['date'] = pd.to_datetime(sales['date'], format='%Y-%m-%d')",
+        "sales['date'] = pd.to_datetime(sales['timestamp'], unit='s')",
+        "start = pd.to_datetime('2020-01-01')",
+        "sales['date'] = pd.to_datetime(sales['date'], **options)",
+        "sales['date'] = arrow.to_datetime(sales['date'])",
+    ],
+)
+def test_PD134_pass(statement, errors_of):
+    """
+    Test that conversions with a format, or of literals, do not result in an error.
+    """
+    assert errors_of(statement, PD134) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales['date'] = pd.to_datetime(sales['date'])", 1, 16),
+        ("dates = pd.to_datetime(sales.date, errors='coerce')", 1, 8),
+        ("from pandas import to_datetime\ndates = to_datetime(column)", 2, 8),
+    ],
+)
+def test_PD134_fail(statement, lineno, col, errors_of):
+    """
+    Test that converting a column without a format results in an error.
+    """
+    assert errors_of(statement, PD134) == [PD134(lineno, col)]
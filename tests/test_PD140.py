@@ -0,0 +1,52 @@
+import pytest
+
+from pandas_vet import PD140
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales.to_csv('sales.csv')",
+        "sales.to_parquet('sales', partition_cols=['region'])",
+        "with pd.ExcelWriter('sales.xlsx') as writer:\n"
+        "    for region, sales in by_region:\n"
+        "        sales.to_excel(writer, sheet_name=region)",
+        "for region, sales in by_region:\n    print(sales.to_csv())",
+        "for g, s in groups:\n    out.append(s.to_csv(index=False))",
+        "for g, s in groups:\n    out.append(s.to_json(orient='records'))",
+        "for g, s in groups:\n    out.append(s.to_html(buf=None, index=False))",
+        "for g, s in groups:\n    out.append(s.to_parquet(None, index=False))",
+        "for g, s in groups:\n    s.to_csv(**options)",
+        "for region in regions:\n    def save(sales):\n"
+        "        sales.to_csv(f'{region}.csv')",
+    ],
+)
+def test_PD140_pass(statement, errors_of):
+    """
+    Test that single writes, or sheets of one Excel writer, do not result in an error.
+    """
+    assert errors_of(statement, PD140) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("for region, sales in by_region:\n    sales.to_csv(f'{region}.csv')", 2, 4),
+        ("for region, sales in by_region:\n    sales.to_excel(f'{region}.xlsx')", 2, 4),
+        (
+            "for region, sales in by_region:\n"
+            "    with open(f'{region}.json', 'w') as out:\n"
+            "        sales.to_json(path_or_buf=out)",
+            3,
+            8,
+        ),
+        ("while batches:\n    batches.pop().to_sql('sales', engine)", 2, 4),
+        ("while batches:\n    batches.pop().to_sql(name='sales', con=engine)", 2, 4),
+        ("for g, s in groups:\n    s.to_excel(excel_writer=f'{g}.xlsx')", 2, 4),
+    ],
+)
+def test_PD140_fail(statement, lineno, col, errors_of):
+    """
+    Test that writing a data frame on every iteration of a loop results in an error.
+    """
+    assert errors_of(statement, PD140) == [PD140(lineno, col)]
@@ -0,0 +1,45 @@
+import pytest
+
+from pandas_vet import PD141
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales.to_parquet('cleaned.parquet')\n"
+        "cleaned = pd.read_parquet('cleaned.parquet')",
+        "sales.to_csv('report.csv')\nraw = pd.read_csv('raw.csv')",
+        "sales.to_csv(path)\nraw = pd.read_csv(other)",
+        "sales.to_csv(path)\nraw = csv.read_csv(path)",
+    ],
+)
+def test_PD141_pass(statement, errors_of):
+    """
+    Test that reading other files, or Parquet files, does not result in an error.
+    """
+    assert errors_of(statement, PD141) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales.to_csv('cleaned.csv')\ncleaned = pd.read_csv('cleaned.csv')", 2, 10),
+        (
+            "def clean(sales):\n    sales.to_pickle(path=TEMP)\n"
+            "def load():\n    return pd.read_pickle(TEMP)",
+            4,
+            11,
+        ),
+        (
+            "cleaned = pd.read_csv(filepath_or_buffer=path)\n"
+            "with open(path, 'w') as out:\n    sales.to_csv(path, index=False)",
+            1,
+            10,
+        ),
+    ],
+)
+def test_PD141_fail(statement, lineno, col, errors_of):
+    """
+    Test that reading back a CSV or pickle file written by the module results in an error.
+    """
+    assert errors_of(statement, PD141) == [PD141(lineno, col)]
@@ -0,0 +1,27 @@
+import pytest
+
+from pandas_vet import PD142
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales.to_sql('sales', engine, chunksize=10_000)",
+        "sales.to_sql('sales', engine, method='multi')",
+        "sales.to_sql('sales', engine, **options)",
+    ],
+)
+def test_PD142_pass(statement, errors_of):
+    """
+    Test that batched database writes do not result in an error.
+    """
+    assert errors_of(statement, PD142) == []
+
+
+def test_PD142_fail(errors_of):
+    """
+    Test that writing a data frame one row at a time results in an error.
+    """
+    assert errors_of("sales.to_sql('sales', engine, if_exists='append')", PD142) == [
+        PD142(1, 0)
+    ]
@@ -0,0 +1,53 @@
+import pytest
+
+from pandas_vet import PD150
+
+READ = "sales = pd.read_csv(path)\n"
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        READ + "sales['region'] = sales['region'].astype('category')\n"
+        "totals = sales.groupby('region').sum()",
+        READ + "sales['region'] = sales['region'].astype(str)\n"
+        "totals = sales.groupby('region').sum()\n"
+        "north = sales[sales['region'].str.startswith('N')]",
+        READ + "sales['region'] = sales['region'].astype(str)",
+        "sales['region'] = sales['region'].astype(str)\n"
+        "totals = sales.groupby('region').sum()",
+        READ + "sales['region'] = sales['region'].astype(str)\n"
+        "print(sales.sort_values('region'))\n"
+        "totals = sales.groupby('region').sum()",
+    ],
+)
+def test_PD150_pass(statement, errors_of):
+    """
+    Test that string columns used for more than grouping do not result in an error.
+    """
+    assert errors_of(statement, PD150) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        (
+            READ + "sales['region'] = sales['region'].astype(str)\n"
+            "totals = sales.groupby('region')['price'].sum()",
+            2,
+            0,
+        ),
+        (
+            READ + "sales['region'] = sales['region'].astype(object)\n"
+            "totals = sales.groupby(by=['region', 'year']).sum()\n"
+            "means = sales.groupby(sales['region']).mean()",
+            2,
+            0,
+        ),
+    ],
+)
+def test_PD150_fail(statement, lineno, col, errors_of):
+    """
+    Test that converting group keys to strings results in an error.
+    """
+    assert errors_of(statement, PD150) == [PD150(lineno, col)]
@@ -0,0 +1,35 @@
+import pytest
+
+from pandas_vet import PD151
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path)\nsales['n'] = sales['n'].astype('int32')",
+        "sales = pd.read_csv(path)\nsales['n'] = sales['n'].astype('category')",
+        "sales = pd.read_csv(path)\nsales['n'] = sales['n'].astype(dtypes)",
+        "array = array.astype('float64')",
+    ],
+)
+def test_PD151_pass(statement, errors_of):
+    """
+    Test that narrow types, and other objects than data frames, do not result in an error.
+    """
+    assert errors_of(statement, PD151) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        ("sales = pd.read_csv(path)\nsales['n'] = sales['n'].astype('int64')", 2, 13),
+        ("sales = pd.read_csv(path)\nsales['n'] = sales['n'].astype(float)", 2, 13),
+        ("sales = pd.read_csv(path)\nsales = sales.astype(dtype=np.int64)", 2, 8),
+        ("def f(sales: pd.DataFrame):\n    return sales.astype(int)", 2, 11),
+    ],
+)
+def test_PD151_fail(statement, lineno, col, errors_of):
+    """
+    Test that converting data frames or columns to 64-bit numbers results in an error.
+    """
+    assert errors_of(statement, PD151) == [PD151(lineno, col)]
@@ -0,0 +1,48 @@
+import pytest
+
+from pandas_vet import PD152
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "sales = pd.read_csv(path, dtype={'region': 'category'})\n"
+        "sales['region'] = sales['region'].astype('category')",
+        "sales = load(path)\nsales['region'] = sales['region'].astype('category')",
+        "sales = pd.read_csv(path)\nsales['region'] = sales['region'].astype(str)",
+        "sales = pd.DataFrame({'region': ['north', 'south', 'east']})",
+        "sales = pd.DataFrame({'region': ['north', 'south', 'north']}, dtype='category')",
+        "sales = pd.DataFrame({'quantity': [1, 1, 1, 1]})",
+        "sales = pd.Series(['north', 'north'], dtype='category')",
+    ],
+)
+def test_PD152_pass(statement, errors_of):
+    """
+    Test that columns with a dtype, or unique values, do not result in an error.
+    """
+    assert errors_of(statement, PD152) == []
+
+
+@pytest.mark.parametrize(
+    "statement, lineno, col",
+    [
+        (
+            "sales = pd.read_csv(path)\n"
+            "sales['region'] = sales['region'].astype('category')",
+            2,
+            0,
+        ),
+        (
+            "sales = pd.DataFrame({'region': ['north', 'south', 'north', 'north']})",
+            1,
+            8,
+        ),
+        ("sales = pd.DataFrame({'region': ['north', 'south'] * 1000})", 1, 8),
+        ("regions = pd.Series(('north', 'north'))", 1, 10),
+    ],
+)
+def test_PD152_fail(statement, lineno, col, errors_of):
+    """
+    Test that low-cardinality string columns built without a dtype result in an error.
+    """
+    assert errors_of(statement, PD152) == [PD152(lineno, col)]
@@ -0,0 +1,64 @@
+import pytest
+
+from pandas_vet import Summary, check_paths
+
+
+@pytest.fixture
+def paths(tmp_path):
+    sources = {
+        "clean.py": "import os\n",
+        "frames.py": "import pandas\nresult = df.isnull()\n",
+        "broken.py": "result = df.isnull(\n",
+    }
+    for name, source in sources.items():
+        (tmp_path / name).write_text(source)
+    return [str(tmp_path / name) for name in sorted(sources)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_paths_yields_every_file(paths, jobs):
+    """
+    Test that check_paths yields the errors of every file once.
+    """
+    results = dict(check_paths(iter(paths), jobs=jobs, window=1))
+    assert sorted(results) == paths
+    assert results[paths[0]] == [(1, 0, "E999 SyntaxError: '(' was never closed")]
+    assert results[paths[1]] == []
+    assert [e[:2] for e in results[paths[2]]] == [(1, 0), (2, 9)]
+
+
+def test_check_paths_applies_configuration(paths):
+    """
+    Test that the configuration is applied to the worker processes.
+    """
+    results = dict(check_paths(paths, jobs=2, select=lambda code: code != "PD001"))
+    assert [e[2][:5] for e in results[paths[2]]] == ["PD003"]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_paths_skips_checks_off_by_default(tmp_path, jobs, restore_plugin):
+    """
+    Test that the PD9xx checks only run when asked for, as with flake8.
+    """
+    path = tmp_path / "a.py"
+    path.write_text("df = pd.DataFrame()\n")
+    assert dict(check_paths([str(path)], jobs=jobs)) == {str(path): []}
+    results = dict(check_paths([str(path)], jobs=jobs, annoy=True))
+    assert [e[2][:5] for e in results[str(path)]] == ["PD901"]
+
+
+def test_summary_columns(paths):
+    """
+    Test that Summary collects the errors as one array per field.
+    """
+    summary = Summary()
+    results = list(summary.collect(check_paths(paths)))
+    assert [path for path, _ in results] == summary.paths == paths
+    assert len(summary) == 3
+    assert summary.codes == ["E999", "PD001", "PD003"]
+    assert list(summary.code) == [0, 1, 2]
+    assert list(summary.path) == [0, 2, 2]
+    assert list(summary.cell) == [0, 0, 0]
+    assert list(summary.line) == [1, 1, 2]
+    assert list(summary.col) == [0, 0, 9]
+    assert summary.counts() == {"E999": 1, "PD001": 1, "PD003": 1}
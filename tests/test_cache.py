@@ -0,0 +1,74 @@
+import ast
+import sys
+
+from pandas_vet import PD003, VetPlugin, stats
+from pandas_vet.cache import ResultCache
+
+
+def run(source):
+    lines = source.splitlines(keepends=True)
+    return list(VetPlugin(ast.parse(source), lines, "example.py").run())
+
+
+def test_cache_returns_stored_errors(parse_options):
+    """
+    Test that a second run over the same source is answered by the cache.
+    """
+    parse_options(pandas_vet_no_cache=False)
+    source = "result = employees.isnull()\n"
+    hits, misses = stats.COUNTERS["cache_hits"], stats.COUNTERS["cache_misses"]
+    assert run(source) == [PD003(1, 9)]
+    assert run(source) == [PD003(1, 9)]
+    assert stats.COUNTERS["cache_misses"] == misses + 1
+    assert stats.COUNTERS["cache_hits"] == hits + 1
+
+
+def test_cache_misses_on_changed_source(parse_options):
+    """
+    Test that editing a source invalidates its cached errors.
+    """
+    parse_options(pandas_vet_no_cache=False)
+    assert run("result = employees.isnull()\n") == [PD003(1, 9)]
+    assert run("result = employees.isna()\n") == []
+
+
+def test_cache_disabled(parse_options):
+    """
+    Test that --pandas-vet-no-cache does not touch the cache.
+    """
+    parse_options(pandas_vet_no_cache=True)
+    assert VetPlugin.cache is None
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    """
+    Test that the cache keeps at most `max_entries` entries.
+    """
+    results = ResultCache(str(tmp_path), max_entries=2)
+    for source in ("a", "b", "c"):
+        results.put(results.key(source), [(1, 0, source)])
+    assert results.get(results.key("a")) is None
+    assert results.get(results.key("c")) == [(1, 0, "c")]
+
+
+def test_cache_key_depends_on_rule_set(tmp_path):
+    """
+    Test that the same source checked with other rules gets another key.
+    """
+    source = "result = employees.isnull()\n"
+    assert ResultCache(str(tmp_path), "PD003").key(source) != ResultCache(
+        str(tmp_path), "PD004"
+    ).key(source)
+
+
+def test_cache_key_depends_on_python(tmp_path, monkeypatch):
+    """
+    Test that the same source checked by another Python gets another key.
+    """
+    source = "result = employees.isnull()\n"
+    key = ResultCache(str(tmp_path)).key(source)
+    monkeypatch.setattr(sys, "version_info", (3, 7, 0))
+    assert ResultCache(str(tmp_path)).key(source) != key
+    monkeypatch.undo()
+    monkeypatch.setattr(sys.implementation, "name", "pypy")
+    assert ResultCache(str(tmp_path)).key(source) != key
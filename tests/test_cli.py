@@ -0,0 +1,66 @@
+import pytest
+
+from pandas_vet.cli import find_files, is_selected, main
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "clean.py").write_text("import os\n")
+    (tmp_path / "frames.py").write_text("import pandas\nresult = df.isnull()\n")
+    (tmp_path / "broken.py").write_text("result = df.isnull(\n")
+    (tmp_path / "notes.txt").write_text("df.isnull()\n")
+    (tmp_path / ".venv").mkdir()
+    (tmp_path / ".venv" / "lib.py").write_text("import pandas\n")
+    return tmp_path
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_reports_flake8_compatible_errors(project, capsys, jobs):
+    """
+    Test that the CLI prints the errors of every file like flake8 does.
+    """
+    status = main([str(project), "--no-cache", "--jobs", jobs])
+    assert status == 1
+    assert capsys.readouterr().out.splitlines() == [
+        f"{project / 'broken.py'}:1:1: E999 SyntaxError: '(' was never closed",
+        f"{project / 'frames.py'}:1:1: PD001 pandas should always be imported as "
+        "'import pandas as pd'",
+        f"{project / 'frames.py'}:2:10: PD003 '.isna' is preferred to '.isnull'; "
+        "functionality is equivalent",
+    ]
+
+
+def test_cli_select_and_ignore(project, capsys):
+    """
+    Test that --select, --ignore and --annoy choose the reported codes.
+    """
+    path = str(project / "frames.py")
+    assert main([path, "--no-cache", "--ignore", "PD001"]) == 1
+    assert "PD001" not in capsys.readouterr().out
+    assert main([path, "--no-cache", "--select", "PD0", "--ignore", "PD001,PD003"]) == 0
+    assert capsys.readouterr().out == ""
+    (project / "named.py").write_text("df = 1\n")
+    assert main([str(project / "named.py"), "--no-cache"]) == 0
+    assert main([str(project / "named.py"), "--no-cache", "--annoy"]) == 1
+
+
+def test_find_files_skips_excluded_directories(project):
+    """
+    Test that only Python files outside of excluded directories are found.
+    """
+    assert sorted(find_files([str(project)], [".venv"])) == [
+        str(project / name) for name in ("broken.py", "clean.py", "frames.py")
+    ]
+
+
+@pytest.mark.parametrize(
+    "code, select, ignore, expected",
+    [
+        ("PD001", ["PD"], [], True),
+        ("PD901", ["PD"], ["PD9"], False),
+        ("PD901", ["PD901"], ["PD9"], True),
+        ("E501", ["PD"], [], False),
+    ],
+)
+def test_is_selected_longest_prefix_wins(code, select, ignore, expected):
+    assert is_selected(code, select, ignore) is expected
@@ -0,0 +1,137 @@
+import ast
+import subprocess
+
+import pytest
+
+from pandas_vet.cli import main
+from pandas_vet.diff import parse_diff, prune, touches
+
+DIFF = """\
+diff --git a/frames.py b/frames.py
+--- a/frames.py
++++ b/frames.py
+@@ -2,0 +3,2 @@ import pandas as pd
++a = df.isnull()
++b = df.notnull()
+@@ -9 +11 @@ def f():
+-    old = 1
++    new = df.values
+@@ -20,3 +21,0 @@ def g():
+diff --git a/notes.txt b/notes.txt
+--- a/notes.txt
++++ b/notes.txt
+@@ -1 +1 @@
+-x
++df.isnull()
+"""
+
+
+def test_parse_diff_keeps_added_lines_of_python_files():
+    """
+    Test that only added or modified line ranges of Python files are kept.
+    """
+    assert parse_diff(DIFF.splitlines()) == {"frames.py": [(3, 4), (11, 11)]}
+
+
+@pytest.mark.parametrize(
+    "first, last, expected",
+    [(1, 2, False), (1, 3, True), (4, 10, True), (5, 10, False), (12, 30, False)],
+)
+def test_touches(first, last, expected):
+    assert touches([(3, 4), (11, 11)], first, last) is expected
+
+
+def test_prune_keeps_statements_touching_hunks():
+    """
+    Test that top-level statements outside of the hunks are dropped.
+    """
+    source = "a = 1\n\n@decorate\ndef f():\n    pass\n\nb = 2\n"
+    tree = prune(ast.parse(source), [(3, 3)])
+    assert [type(statement) for statement in tree.body] == [ast.FunctionDef]
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch, restore_plugin):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "test@example.com")
+    git("config", "user.name", "test")
+    (tmp_path / "old.py").write_text("result = df.isnull()\n")
+    (tmp_path / "frames.py").write_text("import pandas as pd\nresult = df.isnull()\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "initial")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_cli_diff_reports_changed_lines_only(repository, capsys):
+    """
+    Test that --diff only reports the errors on lines changed since a ref.
+    """
+    (repository / "frames.py").write_text(
+        "import pandas as pd\nresult = df.isnull()\nother = df.notnull()\n"
+    )
+    assert main(["--diff", "HEAD", "--no-cache"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "frames.py:3:9: PD004 '.notna' is preferred to '.notnull'; "
+        "functionality is equivalent"
+    ]
+
+
+def test_cli_diff_checks_changes_within_their_module(repository, capsys):
+    """
+    Test that changed lines are reported as in a full check of their module.
+    """
+    source = (
+        "import pandas as pd\n"
+        "from pandas import merge\n"
+        'frame = pd.read_csv("data.csv", usecols=["a"], engine="pyarrow")\n'
+        "subset = frame.copy()\n"
+        'subset = subset[subset["a"] > 0]\n'
+        "frame['a'][mask] = merge(frame, frame)\n"
+    )
+    (repository / "frames.py").write_text(source)
+    subprocess.run(["git", "commit", "-qam", "frames"], check=True)
+    edited = source.replace("subset = frame", "subset  = frame")
+    (repository / "frames.py").write_text(edited.replace("] = merge", "]  = merge"))
+    assert main(["frames.py", "--no-cache"]) == 1
+    full = capsys.readouterr().out.splitlines()
+    assert main(["--diff", "HEAD", "--no-cache"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        line for line in full if line.startswith(("frames.py:4:", "frames.py:6:"))
+    ]
+
+
+@pytest.mark.parametrize("option", ["diff.noprefix", "diff.mnemonicPrefix"])
+def test_cli_diff_ignores_prefix_settings(repository, capsys, option):
+    """
+    Test that git settings changing the file prefixes of diffs are ignored.
+    """
+    subprocess.run(["git", "config", option, "true"], check=True)
+    (repository / "frames.py").write_text("import pandas as pd\nresult = df.isna()\n")
+    (repository / "old.py").write_text("result = df.isnull()\nother = df.notnull()\n")
+    assert main(["--diff", "HEAD", "--no-cache"]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        "old.py:2:9: PD004 '.notna' is preferred to '.notnull'; "
+        "functionality is equivalent"
+    ]
+
+
+def test_cli_diff_without_changes(repository, capsys):
+    """
+    Test that nothing is checked when no file changed.
+    """
+    assert main(["--diff", "HEAD", "--no-cache"]) == 0
+    assert capsys.readouterr().out == ""
+
+
+def test_cli_diff_unknown_ref(repository, capsys):
+    """
+    Test that a failing git diff is reported as a usage error.
+    """
+    with pytest.raises(SystemExit) as exit:
+        main(["--diff", "not-a-ref", "--no-cache"])
+    assert exit.value.code == 2
+    assert "git diff failed" in capsys.readouterr().err
@@ -0,0 +1,95 @@
+import ast
+
+from pandas_vet import (
+    DISPATCH,
+    PD002,
+    PD003,
+    RULES,
+    Matcher,
+    check_for_isnull,
+    check_inplace_false,
+    compile_rules,
+)
+
+
+def dispatched_checks(rules):
+    """The checks run by `rules`, looking into the matchers of merged patterns."""
+    checks = []
+    for rule in rules:
+        if rule.pattern is None and isinstance(rule.check, Matcher):
+            checks.extend(p for p in rule.check.patterns)
+        else:
+            checks.append(rule.pattern or rule.check)
+    return checks
+
+
+def test_every_rule_is_dispatched():
+    """
+    Test that every registered check is reachable from the dispatch table.
+    """
+    dispatched = []
+    for _, keyed, unkeyed in DISPATCH.values():
+        dispatched.extend(dispatched_checks(unkeyed))
+        for rules in keyed.values():
+            dispatched.extend(dispatched_checks(rules))
+    assert set(dispatched) == {rule.pattern or rule.check for rule in RULES}
+
+
+def test_keyed_checks_include_unkeyed_checks():
+    """
+    Test that looking up a key also runs the checks registered without triggers.
+    """
+    _, keyed, unkeyed = compile_rules(RULES, combine=False)[ast.Call]
+    assert [rule.check for rule in keyed["isnull"]] == [
+        check_inplace_false,
+        check_for_isnull,
+    ]
+    assert [rule.check for rule in keyed.get("not_a_trigger", unkeyed)] == [
+        check_inplace_false
+    ]
+
+
+def test_patterns_are_merged_per_key():
+    """
+    Test that the patterns of a dispatch key run as one matcher, in order.
+    """
+    _, keyed, unkeyed = compile_rules(RULES)[ast.Call]
+    (rule,) = keyed["isnull"]
+    assert rule.code == "PD002,PD003"
+    assert dispatched_checks(keyed["isnull"]) == [
+        check_inplace_false.patterns[0],
+        check_for_isnull.patterns[0],
+    ]
+    call = ast.parse("employees.isnull(inplace=True)").body[0].value
+    assert rule.check(call) == [PD002, PD003]
+    assert dispatched_checks(unkeyed) == [check_inplace_false.patterns[0]]
+
+
+def test_matcher_shares_tests():
+    """
+    Test that a test shared by several patterns runs once per node.
+    """
+    from pandas_vet.engine import PREDICATES, NodePattern
+
+    calls = []
+    method = PREDICATES["method"]
+
+    def counted(*args):
+        calls.append(args)
+        return method(*args)
+
+    PREDICATES["method"] = counted
+    try:
+        matcher = Matcher(
+            (
+                NodePattern("PD003", ast.Call, frozenset(["isnull"])),
+                NodePattern(
+                    "PD002", ast.Call, frozenset(["isnull"]), keyword=("inplace", True)
+                ),
+            )
+        )
+        call = ast.parse("employees.isnull(inplace=True)").body[0].value
+        assert matcher(call) == [PD003, PD002]
+    finally:
+        PREDICATES["method"] = method
+    assert len(calls) == 1
@@ -0,0 +1,37 @@
+import ast
+
+from pandas_vet import CODES, PD003, PD011, Code, Findings, VetPlugin, check_for_isnull
+
+
+def test_code_builds_flake8_errors():
+    """
+    Test that calling a code gives the (line, col, message, type) error of flake8.
+    """
+    lineno, col, message, type_ = PD003(1, 9)
+    assert (lineno, col, type_) == (1, 9, VetPlugin)
+    assert message.startswith("PD003 ")
+    assert PD003.code == "PD003"
+    assert CODES[PD003.index] is PD003
+
+
+def test_findings_yield_errors_in_order():
+    """
+    Test that findings are stored compactly and yielded as flake8 errors.
+    """
+    findings = Findings()
+    findings.append(PD011, 3, 4)
+    findings.append(PD003, 1, 0)
+    assert len(findings) == 2
+    assert list(findings) == [PD011(3, 4), PD003(1, 0)]
+    assert findings == [PD011(3, 4), PD003(1, 0)]
+
+
+def test_checks_return_codes():
+    """
+    Test that checks return the code they found, or None without allocating.
+    """
+    call = ast.parse("employees.isnull()").body[0].value
+    assert check_for_isnull(call) is PD003
+    other = ast.parse("employees.isna()").body[0].value
+    assert check_for_isnull(other) is None
+    assert isinstance(PD003, Code)
@@ -0,0 +1,88 @@
+import re
+import subprocess
+import sys
+
+# Cumulative import time of the plugin, in microseconds, on top of flake8.
+# It is about 5 ms; the margin absorbs slow CI machines.
+BUDGET = 20_000
+
+
+def import_plugin(code=""):
+    """Import the plugin after flake8, as flake8 does, and run `code`."""
+    return subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import flake8.main.application, pandas_vet\n{code}",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_import_time_within_budget():
+    """
+    Test that loading the plugin stays below the import time budget.
+    """
+    stderr = import_plugin().stderr
+    cumulative = re.search(r"\|\s*(\d+) \| pandas_vet$", stderr, re.MULTILINE)[1]
+    assert int(cumulative) < BUDGET
+
+
+def test_import_does_not_load_the_engine():
+    """
+    Test that the rule engine is only imported on the first check.
+    """
+    code = (
+        "import ast, sys\n"
+        "from pandas_vet import VetPlugin\n"
+        "assert 'pandas_vet.engine' not in sys.modules\n"
+        "assert 'attr' not in sys.modules\n"
+        "VetPlugin.configure()\n"
+        "assert 'pandas_vet.engine' not in sys.modules\n"
+        "VetPlugin(ast.parse('df.isnull()')).run()\n"
+        "assert 'pandas_vet.engine' in sys.modules\n"
+    )
+    import_plugin(code)
+
+
+def test_engine_names_available_from_the_package():
+    """
+    Test that names of the rule engine can still be imported from the package.
+    """
+    from pandas_vet import PD002, RULES, Visitor, check_for_isnull, engine
+
+    assert PD002 is engine.CODES[PD002.index]
+    assert Visitor is engine.Visitor
+    assert check_for_isnull in [rule.check for rule in RULES]
+
+
+def test_submodules_import_before_the_engine():
+    """
+    Test that importing a submodule first does not go through the engine names.
+    """
+    code = (
+        "import sys\n"
+        "from pandas_vet import cli, diff\n"
+        "assert diff.__name__ == 'pandas_vet.diff'\n"
+        "assert 'pandas_vet.engine' not in sys.modules\n"
+    )
+    import_plugin(code)
+
+
+def test_flake8_passes_every_parameter(tmp_path):
+    """
+    Test that flake8 has every parameter the plugin asks for.
+    """
+    path = tmp_path / "frames.py"
+    path.write_text("result = df.isnull()\n")
+    run = subprocess.run(
+        [sys.executable, "-m", "flake8", "-v", "--select", "PD", str(path)],
+        capture_output=True,
+        text=True,
+    )
+    assert "PD003" in run.stdout
+    assert "not an available parameter" not in run.stderr
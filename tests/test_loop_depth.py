@@ -0,0 +1,87 @@
+import ast
+
+import pytest
+
+from pandas_vet import PD003, PD008, PD009, VetPlugin, Visitor, code_indices
+
+
+def depths(source, **options):
+    errors = Visitor(track_ancestors=True, **options).check(ast.parse(source))
+    return [depth for _, depth in errors.with_depth()]
+
+
+def run(source):
+    lines = source.splitlines(keepends=True)
+    return list(VetPlugin(ast.parse(source), lines, "example.py").run())
+
+
+@pytest.mark.parametrize(
+    "source, expected",
+    [
+        ("x.isnull()", 0),
+        ("for row in rows:\n    row.isnull()", 1),
+        ("for row in rows:\n    for cell in row:\n        cell.isnull()", 2),
+        ("while True:\n    x.isnull()", 1),
+        ("for row in rows.isnull():\n    pass", 0),
+        ("for row in rows:\n    pass\nelse:\n    x.isnull()", 0),
+        ("[x.isnull() for x in xs]", 1),
+        ("[x.isnull() for xs in xss for x in xs]", 2),
+        ("[x for x in xs.isnull()]", 0),
+        ("[x for xs in xss for x in xs.isnull()]", 1),
+        ("[x for x in xs if x.isnull()]", 1),
+        ("{k: v.isnull() for k, v in items}", 1),
+        ("frame.apply(lambda row: row.isnull())", 1),
+        ("for row in rows:\n    def f():\n        x.isnull()", 0),
+    ],
+)
+def test_findings_have_loop_depth(source, expected):
+    """
+    Test that every finding is recorded with the number of loops repeating it.
+    """
+    assert depths(source) == [expected]
+
+
+def test_loop_only_codes_need_a_loop():
+    """
+    Test that loop-only codes are not reported outside of loops.
+    """
+    source = "x = frame.at[1, 'a']\nfor i in rows:\n    y = frame.iat[i, 0]\n"
+    loop_only = code_indices(["PD008", "PD009"])
+    errors = Visitor(loop_only=loop_only).check(ast.parse(source))
+    assert errors == [PD009(3, 8)]
+
+
+def test_escalated_codes_mention_their_depth():
+    """
+    Test that the messages of escalated codes tell how deep they are nested.
+    """
+    source = "x.isnull()\nfor a in b:\n    for c in a:\n        c.isnull()\n"
+    errors = list(Visitor(escalate=code_indices(["PD003"])).check(ast.parse(source)))
+    assert errors[0] == PD003(1, 0)
+    assert errors[1].message == PD003.message + " (in 2 nested loops)"
+    errors = list(
+        Visitor(escalate=code_indices(["PD0"])).check(
+            ast.parse("[x.isnull() for x in y]")
+        )
+    )
+    assert errors[0].message == PD003.message + " (in a loop)"
+
+
+def test_code_indices_match_prefixes():
+    """
+    Test that codes are selected by prefix, like flake8 does.
+    """
+    assert code_indices(["PD00"]) >= {PD003.index, PD008.index, PD009.index}
+    assert code_indices(["PD008"]) == {PD008.index}
+    assert code_indices([]) == set()
+
+
+def test_loop_only_option(parse_options):
+    """
+    Test the --pandas-vet-loop-only and --pandas-vet-escalate options.
+    """
+    source = "x = frame.at[1, 'a']\nfor i in rows:\n    y = frame.at[i, 'a']\n"
+    parse_options(pandas_vet_loop_only=["PD008"], pandas_vet_escalate=["PD008"])
+    errors = run(source)
+    assert [e[:2] for e in errors] == [(3, 8)]
+    assert errors[0][2] == PD008.message + " (in a loop)"
@@ -0,0 +1,124 @@
+import json
+
+import pytest
+
+from pandas_vet import stats
+from pandas_vet.cli import main
+from pandas_vet.notebook import check_notebook, read_cells, strip_magics
+
+
+def write_notebook(path, *cells):
+    notebook = {
+        "cells": [
+            {"cell_type": kind, "metadata": {}, "source": source}
+            for kind, source in cells
+        ],
+        "metadata": {},
+        "nbformat": 4,
+        "nbformat_minor": 5,
+    }
+    path.write_text(json.dumps(notebook))
+    return str(path)
+
+
+@pytest.fixture
+def notebook(tmp_path):
+    return write_notebook(
+        tmp_path / "analysis.ipynb",
+        ("code", ["import pandas as pd\n", "%matplotlib inline\n"]),
+        ("markdown", "# Cleaning"),
+        ("code", ["for name in names:\n", "    !echo {name}\n", "    df.isnull()\n"]),
+        ("code", "%%bash\nls -l df.isnull()\n"),
+        ("code", "result = employees.notnull("),
+    )
+
+
+def test_read_cells_keeps_code_cells(notebook):
+    """
+    Test that code cells are read with their position in the notebook.
+    """
+    assert [cell for cell, _ in read_cells(notebook)] == [1, 3, 4, 5]
+
+
+def test_strip_magics_keeps_line_numbers():
+    """
+    Test that IPython lines become `pass` at their indentation.
+    """
+    source = "files = !ls\nfor f in files:\n    %time f.isnull()\nf.values?\n"
+    assert strip_magics(source) == "pass\nfor f in files:\n    pass\npass\n"
+    assert strip_magics("%%bash\nls df.isnull()\n") is None
+    assert strip_magics("%%sql\nselect 1\n") is None
+    assert strip_magics("%%timeit -n 10\ndf.isnull()\n") == "pass\ndf.isnull()\n"
+    assert strip_magics("\n%%time\nx = df.isnull()\n") == "\npass\nx = df.isnull()\n"
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        "ok = (a\n      != b)\n",
+        "ok = a \\\n    != b\n",
+        "total = [a,\n         % b]\n",
+        'text = """\n!important\nwhy?\n"""\n',
+        "if a != b:  # why?\n    pass\n",
+        "x = 1  # (\n!ls\n",
+    ],
+)
+def test_strip_magics_keeps_python_lines(source):
+    """
+    Test that only lines starting a logical line can be IPython syntax.
+    """
+    expected = source.replace("!ls", "pass")
+    assert strip_magics(source) == expected
+
+
+def test_check_notebook_maps_errors_to_cells(notebook):
+    """
+    Test that errors are reported with their cell, line and column.
+    """
+    assert [error[:3] for error in check_notebook(notebook)] == [(3, 3, 4), (5, 1, 0)]
+
+
+def test_check_notebook_checks_python_cell_magics(tmp_path):
+    """
+    Test that the body of a cell timed with `%%time` is checked.
+    """
+    path = write_notebook(tmp_path / "timed.ipynb", ("code", "%%time\nx = df.isnull()"))
+    assert [error[:3] for error in check_notebook(path)] == [(1, 2, 4)]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_reports_notebook_cells(notebook, capsys, jobs):
+    """
+    Test that the CLI prints notebook errors as path:cell_N:line:col.
+    """
+    assert main([notebook, "--no-cache", "--jobs", jobs]) == 1
+    assert capsys.readouterr().out.splitlines() == [
+        f"{notebook}:cell_3:3:5: PD003 '.isna' is preferred to '.isnull'; "
+        "functionality is equivalent",
+        f"{notebook}:cell_5:1:1: E999 SyntaxError: '(' was never closed",
+    ]
+
+
+def test_cli_caches_notebook_cells(tmp_path, capsys):
+    """
+    Test that only the edited cell of a notebook is checked again.
+    """
+    cells = [("code", f"result_{i} = employees.isnull()\n") for i in range(5)]
+    path = write_notebook(tmp_path / "cached.ipynb", *cells)
+    arguments = [path, "--jobs", "1", "--cache-dir", str(tmp_path / "cache")]
+    main(arguments)
+    write_notebook(tmp_path / "cached.ipynb", *cells[:4], ("code", "edited.isnull()"))
+    hits, misses = stats.COUNTERS["cache_hits"], stats.COUNTERS["cache_misses"]
+    main(arguments)
+    assert stats.COUNTERS["cache_hits"] - hits == 4
+    assert stats.COUNTERS["cache_misses"] - misses == 1
+    assert len(capsys.readouterr().out.splitlines()) == 10
+
+
+def test_cli_reports_invalid_notebooks(tmp_path, capsys):
+    """
+    Test that a notebook that is not JSON is reported as unreadable.
+    """
+    (tmp_path / "broken.ipynb").write_text("{")
+    assert main([str(tmp_path / "broken.ipynb"), "--no-cache"]) == 1
+    assert ": E902 JSONDecodeError:" in capsys.readouterr().out
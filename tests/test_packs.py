@@ -0,0 +1,101 @@
+import ast
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from pandas_vet import CODES, PACKS, RULES, Code, Visitor, compile_rules, engine
+from pandas_vet.profile import rule_name
+
+
+def acme_rules():
+    """A rule pack registering its rules when called."""
+
+    @engine.pattern("PDACME001", ast.Call, "query")
+    def check_for_query(node):
+        """Report `.query()` calls."""
+
+    Code("PDACME001 '.query' strings are not checked; use boolean indexing")
+
+
+def bad_rules():
+    @engine.pattern("PD999", ast.Call, "query")
+    def check_for_query(node):
+        """Report `.query()` calls under a code outside of the namespace."""
+
+
+@pytest.fixture
+def registry():
+    """Restore the rules, codes and packs after loading packs."""
+    rules, codes, packs = list(RULES), list(CODES), dict(PACKS)
+    yield
+    RULES[:] = rules
+    CODES[:] = codes
+    PACKS.clear()
+    PACKS.update(packs)
+
+
+def pack(name, function):
+    return EntryPoint(name, f"{__name__}:{function}", engine.PACK_GROUP)
+
+
+def test_pack_rules_share_the_walk(registry):
+    """
+    Test that the rules of a pack are dispatched with the built-in rules.
+    """
+    engine.load_packs([pack("PDACME", "acme_rules")])
+    (rule,) = [rule for rule in RULES if rule.pack == "PDACME"]
+    assert rule.code == "PDACME001"
+    assert rule_name(rule) == "PDACME001 check_for_query [PDACME]"
+    assert "PDACME" in PACKS
+
+    visitor = Visitor(dispatch=compile_rules(RULES))
+    errors = visitor.check(ast.parse("employees.query('age > 3').isnull()"))
+    assert [e.message[:9] for e in errors] == ["PDACME001", "PD003 '.i"]
+
+
+def test_pack_loaded_once(registry):
+    """
+    Test that loading the packs again does not register their rules twice.
+    """
+    engine.load_packs([pack("PDACME", "acme_rules")])
+    engine.load_packs([pack("PDACME", "acme_rules")])
+    assert len([rule for rule in RULES if rule.pack == "PDACME"]) == 1
+
+
+def broken_rules():
+    raise ImportError("No module named 'acme'")
+
+
+@pytest.mark.parametrize(
+    "name, function",
+    [("ACME", "acme_rules"), ("PDX", "bad_rules"), ("PDBROKEN", "broken_rules")],
+)
+def test_broken_packs_are_skipped(registry, name, function):
+    """
+    Test that packs outside of a PD namespace, with codes outside of their
+    namespace or failing to load are skipped with a warning.
+    """
+    rules, codes = len(RULES), len(CODES)
+    with pytest.warns(UserWarning, match=f"skipping rule pack '{name}'"):
+        engine.load_packs([pack(name, function), pack("PDACME", "acme_rules")])
+    assert list(PACKS) == ["PDACME"]
+    assert [rule.pack for rule in RULES[rules:]] == ["PDACME"]
+    assert len(CODES) == codes + 1
+
+
+def test_installed_packs(registry, tmp_path, monkeypatch):
+    """
+    Test that the packs declared by installed distributions are loaded.
+    """
+    info = tmp_path / "acme_pandas_rules-1.2.dist-info"
+    info.mkdir()
+    (info / "METADATA").write_text(
+        "Metadata-Version: 2.1\nName: acme-pandas-rules\nVersion: 1.2\n"
+    )
+    (info / "entry_points.txt").write_text(
+        f"[{engine.PACK_GROUP}]\nPDACME = {__name__}:acme_rules\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    assert "PDACME" in [entry_point.name for entry_point in engine.installed_packs()]
+    engine.load_packs()
+    assert PACKS["PDACME"] == "1.2"
@@ -0,0 +1,52 @@
+import ast
+
+from pandas_vet import PD002, PD003, RULES, Rule, VetPlugin, compile_prefilter, stats
+
+
+def run(source):
+    lines = source.splitlines(keepends=True)
+    return list(VetPlugin(ast.parse(source), lines, "example.py").run())
+
+
+def test_prefilter_skips_sources_without_keywords():
+    """
+    Test that a source that cannot trigger any rule is not walked.
+    """
+    skipped = stats.COUNTERS["files_skipped"]
+    assert run("import os\nresult = os.path.join('a', 'b')\n") == []
+    assert stats.COUNTERS["files_skipped"] == skipped + 1
+
+
+def test_prefilter_walks_sources_with_keywords():
+    """
+    Test that a source mentioning a trigger is still checked.
+    """
+    skipped = stats.COUNTERS["files_skipped"]
+    assert run("result = employees.isnull()\n") == [PD003(1, 9)]
+    assert stats.COUNTERS["files_skipped"] == skipped
+
+
+def test_prefilter_agnostic_rules_force_a_walk_by_default():
+    """
+    Test that pandas-agnostic rules are still reported by default.
+    """
+    assert run("model.drop(inplace=True)\n") == [PD002(1, 0)]
+
+
+def test_prefilter_skip_agnostic(parse_options):
+    """
+    Test that --pandas-vet-skip-agnostic only walks sources with pandas keywords.
+    """
+    parse_options(pandas_vet_skip_agnostic=True)
+    assert run("model.drop(inplace=True)\n") == []
+    assert run("employees.drop(inplace=True).isnull()\n") == [
+        PD002(1, 0),
+        PD003(1, 0),
+    ]
+
+
+def test_prefilter_disabled_by_rule_without_keywords():
+    """
+    Test that a rule running on every node without keywords disables filtering.
+    """
+    assert compile_prefilter([*RULES, Rule("PD999", None, ast.Call)]) is None
@@ -0,0 +1,61 @@
+import ast
+import json
+import subprocess
+import sys
+from collections import Counter
+
+from pandas_vet import PD003, RULES, compile_rules, stats
+from pandas_vet.profile import ProfilingVisitor, instrument, report
+
+
+def test_profile_counts_rules_and_nodes():
+    """
+    Test that a profiled walk records calls, hits and visited nodes.
+    """
+    before = Counter(stats.COUNTERS)
+    visitor = ProfilingVisitor(dispatch=instrument(compile_rules(RULES, combine=False)))
+    errors = visitor.check(ast.parse("result = employees.isnull()"))
+    assert errors == [PD003(1, 9)]
+
+    def counted(key):
+        return stats.COUNTERS[key] - before[key]
+
+    assert counted("rule:PD003 check_for_isnull:calls") == 1
+    assert counted("rule:PD003 check_for_isnull:hits") == 1
+    assert counted("rule:PD002 check_inplace_false:hits") == 0
+    assert counted("node:Name") == 2
+
+
+def test_profile_json_report(tmp_path):
+    """
+    Test that the profile is written as JSON, arranged by rule and node type.
+    """
+    counters = Counter(
+        {
+            "files": 2,
+            "rule:PD003 check_for_isnull:calls": 4,
+            "rule:PD003 check_for_isnull:hits": 1,
+            "rule:PD003 check_for_isnull:seconds": 0.5,
+            "node:Call": 4,
+        }
+    )
+    path = tmp_path / "profile.json"
+    report(counters, str(path))
+    assert json.loads(path.read_text()) == {
+        "files": 2,
+        "rules": {"PD003 check_for_isnull": {"calls": 4, "hits": 1, "seconds": 0.5}},
+        "nodes": {"Call": 4},
+    }
+
+
+def test_profile_not_imported_when_off():
+    """
+    Test that profiling costs nothing, not even an import, while it is off.
+    """
+    code = (
+        "import ast, sys\n"
+        "from pandas_vet import VetPlugin\n"
+        "VetPlugin(ast.parse('df.isnull()')).run()\n"
+        "assert 'pandas_vet.profile' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,45 @@
+import ast
+
+from pandas_vet import PD003, PD901, VetPlugin
+
+
+def run(source):
+    lines = source.splitlines(keepends=True)
+    return list(VetPlugin(ast.parse(source), lines, "example.py").run())
+
+
+def test_select_disabled_by_default_not_dispatched(parse_options):
+    """
+    Test that Name nodes are not dispatched while PD901 is off by default.
+    """
+    parse_options()
+    VetPlugin.load()
+    assert ast.Name not in VetPlugin.visitor().dispatch
+    assert run("df = employees.isnull()\n") == [PD003(1, 5)]
+
+
+def test_select_annoy(parse_options):
+    """
+    Test that --annoy runs PD9xx and stops flake8 from ignoring them.
+    """
+    options = parse_options(annoy=True)
+    assert "PD9" not in options.extended_default_ignore
+    assert run("df = employees.isnull()\n") == [PD901(1, 0), PD003(1, 5)]
+
+
+def test_select_ignored_codes_not_run(parse_options):
+    """
+    Test that rules ignored through flake8 options are not run.
+    """
+    parse_options(extend_ignore=["PD003"])
+    assert run("result = employees.isnull()\n") == []
+
+
+def test_select_explicit(parse_options):
+    """
+    Test that an explicit --select only runs the selected rules.
+    """
+    parse_options(select=["PD901"])
+    VetPlugin.load()
+    assert list(VetPlugin.visitor().dispatch) == [ast.Name]
+    assert run("df = employees.isnull()\n") == [PD901(1, 0)]
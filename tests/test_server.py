@@ -0,0 +1,188 @@
+import ast
+import json
+import socket
+import threading
+
+import pytest
+
+from pandas_vet import PD002, PD003, PD011, VetPlugin
+from pandas_vet.server import Linter, Server, split_statements
+
+SOURCE = '''\
+"""Module docstring.
+
+import pandas
+"""
+import pandas as pd
+
+
+@decorate
+def clean(frame):
+    return frame.isnull()
+
+
+values = [
+1,
+2,
+]
+if values:
+    result = frame.values
+else:
+    result = None
+# a comment
+total = frame.notnull(
+)
+'''
+
+
+def expected(source):
+    return [e[:3] for e in VetPlugin(ast.parse(source)).run()]
+
+
+def test_split_statements_at_top_level():
+    """
+    Test that the source is split at the first line of top-level statements.
+    """
+    assert [start for start, _ in split_statements(SOURCE)] == [
+        1,
+        5,
+        8,
+        13,
+        14,
+        15,
+        17,
+        22,
+    ]
+
+
+def test_linter_matches_a_full_check():
+    """
+    Test that checking statement by statement gives the errors of a full check.
+    """
+    assert Linter().check("a.py", SOURCE) == expected(SOURCE)
+
+
+def test_linter_only_checks_changed_statements(monkeypatch):
+    """
+    Test that a new version of a file only parses the statements that changed.
+    """
+    linter = Linter()
+    linter.check("a.py", SOURCE)
+    parsed = []
+    parse_statement = Linter.parse_statement
+
+    def counted(text):
+        parsed.append(text)
+        return parse_statement(text)
+
+    monkeypatch.setattr(Linter, "parse_statement", staticmethod(counted))
+    edited = SOURCE.replace("return frame.isnull()", "return frame.isna()")
+    assert linter.check("a.py", edited) == expected(edited)
+    assert parsed == [edited[edited.index("@decorate") : edited.index("values = [")]]
+
+
+MODULE = """\
+import pandas as pd
+from pandas import merge
+
+frame = pd.read_csv("data.csv", usecols=["a", "b"], engine="pyarrow")
+frame["a"][frame["b"] > 0] = 1
+result = merge(frame, frame)
+subset = frame.copy()
+subset = subset[subset["a"] > 0]
+"""
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        ("from pandas import merge\n", ""),
+        ("pd.read_csv(", "load("),
+        ("subset = subset[", "other = subset["),
+        ("subset = frame.copy()", "subset = frame.copy()\nsubset.isnull()"),
+    ],
+)
+def test_linter_checks_statements_within_their_module(old, new):
+    """
+    Test that the errors depending on other statements follow their edits.
+    """
+    linter = Linter()
+    assert linter.check("a.py", MODULE) == expected(MODULE)
+    edited = MODULE.replace(old, new)
+    assert expected(edited) != expected(MODULE)
+    assert linter.check("a.py", edited) == expected(edited)
+    assert linter.check("a.py", MODULE) == expected(MODULE)
+
+
+def test_linter_repairs_wrong_splits():
+    """
+    Test that statements split in invalid pieces are parsed as a whole.
+    """
+    source = "frame = load(\nframe.values,\n)\nframe.isnull()\n"
+    assert Linter().check("a.py", source) == [PD011(2, 0)[:3], PD003(4, 0)[:3]]
+
+
+def test_linter_reports_syntax_errors():
+    """
+    Test that a syntax error is reported like flake8 does, as E999.
+    """
+    errors = Linter().check("a.py", "frame.isnull()\nresult = (\n")
+    assert errors == [PD003(1, 0)[:3], (2, 0, "E999 SyntaxError: '(' was never closed")]
+
+
+def test_linter_skip_agnostic(parse_options):
+    """
+    Test that sources without pandas keywords are skipped with --skip-agnostic.
+    """
+    assert Linter().check("a.py", "model.drop(inplace=True)\n") == [PD002(1, 0)[:3]]
+    parse_options(pandas_vet_skip_agnostic=True)
+    assert Linter().check("a.py", "model.drop(inplace=True)\n") == []
+    source = "employees.drop(inplace=True).isnull()\n"
+    assert Linter().check("a.py", source) == [PD002(1, 0)[:3], PD003(1, 0)[:3]]
+
+
+@pytest.fixture
+def client(tmp_path):
+    server = Server(str(tmp_path / "pandas-vet.sock"))
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    connection = socket.socket(socket.AF_UNIX)
+    connection.connect(server.server_address)
+    stream = connection.makefile("rwb")
+
+    def request(message=None, **fields):
+        stream.write(
+            json.dumps(fields if message is None else message).encode() + b"\n"
+        )
+        stream.flush()
+        return json.loads(stream.readline())
+
+    yield request
+    stream.close()
+    connection.close()
+    server.shutdown()
+    server.server_close()
+    thread.join()
+
+
+def test_server_answers_json_diagnostics(client):
+    """
+    Test the newline-delimited JSON protocol of the server.
+    """
+    response = client(id=7, path="a.py", source="result = frame.isnull()\n")
+    assert response["id"] == 7
+    assert response["elapsed_ms"] >= 0
+    assert response["diagnostics"] == [
+        {"line": 1, "column": 10, "code": "PD003", "message": PD003(1, 9).message}
+    ]
+    assert "diagnostics" not in client(method="close", path="a.py")
+    assert client(path="a.py")["error"].startswith("KeyError")
+
+
+@pytest.mark.parametrize("message", [[], [{"path": "a.py"}], "check", 1])
+def test_server_rejects_requests_that_are_not_objects(client, message):
+    """
+    Test that a request that is not a JSON object gets an error, not a hang-up.
+    """
+    assert client(message)["error"].startswith("TypeError")
+    assert client(path="a.py", source="")["diagnostics"] == []
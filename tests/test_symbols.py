@@ -0,0 +1,122 @@
+import ast
+
+import pytest
+
+from pandas_vet.symbols import Symbols
+
+
+def test_symbols_pandas_names():
+    """
+    Test that the names bound to pandas and its functions are found.
+    """
+    symbols = Symbols(
+        ast.parse(
+            "import pandas\n"
+            "import pandas.io.sql\n"
+            "import numpy as np, pandas as pds\n"
+            "from pandas import merge, read_csv as load\n"
+            "from .pandas import concat\n"
+        )
+    )
+    assert symbols.modules == {"pd", "pandas", "pds"}
+    assert symbols.functions == {"merge": "merge", "load": "read_csv"}
+
+
+def test_symbols_pd_rebound():
+    """
+    Test that `pd` is no longer pandas when bound to another module.
+    """
+    assert Symbols(ast.parse("import numpy as pd")).modules == set()
+
+
+def test_symbols_frames():
+    """
+    Test that names assigned or annotated with DataFrames are found.
+    """
+    symbols = Symbols(
+        ast.parse(
+            "from pandas import DataFrame, read_parquet\n"
+            "sales = pd.read_csv('sales.csv')\n"
+            "if True:\n"
+            "    stores = read_parquet('stores.parquet')\n"
+            "merged = sales.merge(stores)[['a', 'b']].dropna()\n"
+            "count = len(sales)\n"
+            "frame: pd.DataFrame = build()\n"
+            "def process(data: DataFrame, other, *, column: pd.Series = None):\n"
+            "    try:\n"
+            "        result = data.groupby('a').sum()\n"
+            "    finally:\n"
+            "        pass\n"
+            "class Model:\n"
+            "    table = pd.DataFrame()\n"
+        )
+    )
+    assert symbols.frames == {
+        "sales",
+        "stores",
+        "merged",
+        "frame",
+        "data",
+        "column",
+        "result",
+        "table",
+    }
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("sales", True),
+        ("sales.amount.mean()", True),
+        ("pd.concat([a, b])", True),
+        ("pd.to_numeric(x)", False),
+        ("np.zeros(3)", False),
+        ("pd.DataFrame", False),
+    ],
+)
+def test_symbols_is_frame(expression, expected):
+    symbols = Symbols(ast.parse("sales = pd.read_csv('sales.csv')"))
+    assert symbols.is_frame(ast.parse(expression, mode="eval").body) is expected
+
+
+def test_symbols_written():
+    """
+    Test that the files written by `to_csv` and `to_pickle` statements are found.
+    """
+    symbols = Symbols(
+        ast.parse(
+            "sales.to_csv('cleaned.csv')\n"
+            "if dump:\n"
+            "    sales.to_pickle(path=target)\n"
+            "sales.to_parquet('cleaned.parquet')\n"
+            "text = sales.to_csv()\n"
+            "sales.to_csv(folder / 'out.csv')\n"
+        )
+    )
+    assert symbols.written == {"cleaned.csv": "to_csv", "name:target": "to_pickle"}
+
+
+def test_symbols_reads():
+    """
+    Test that the names assigned the result of a pandas reader are found.
+    """
+    tree = ast.parse(
+        "sales = pd.read_csv(path)\nsales = sales.dropna()\nother = pd.concat(parts)\n"
+    )
+    symbols = Symbols(tree)
+    assert symbols.reads == {"sales": tree.body[0].value}
+
+
+def test_symbols_group_keys():
+    """
+    Test that string literals, and those in `.groupby` arguments, are counted once.
+    """
+    symbols = Symbols(
+        ast.parse(
+            "sales['region'] = sales['region'].astype(str)\n"
+            "def total(sales):\n"
+            "    return sales.groupby(['region', sales['year']])['price'].sum()\n"
+        )
+    )
+    assert symbols.strings == {"region": 3, "year": 1, "price": 1}
+    assert symbols.group_keys == {"region": 1, "year": 1}
@@ -0,0 +1,80 @@
+import ast
+import sys
+
+import pytest
+
+from pandas_vet import PD003, PD011, Rule, VetPlugin, Visitor, register
+
+
+def parse_deep(source):
+    """Parse a source nested deeper than the default recursion limit allows."""
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(100_000)
+    try:
+        return ast.parse(source)
+    finally:
+        sys.setrecursionlimit(limit)
+
+
+def test_visitor_walks_beyond_the_recursion_limit():
+    """
+    Test that nesting 10x deeper than the recursion limit is checked.
+    """
+    depth = 10 * sys.getrecursionlimit()
+    tree = parse_deep("result = employees" + ".isnull()" * depth)
+    errors = list(VetPlugin(tree).run())
+    assert len(errors) == depth
+    assert errors[0] == PD003(1, 9)
+
+
+def test_visitor_checks_children_first():
+    """
+    Test that errors come in the order of a recursive post-order walk.
+    """
+    tree = ast.parse("result = employees.isnull().values\n")
+    assert Visitor().check(tree) == [PD003(1, 9), PD011(1, 9)]
+
+
+def test_register_rejects_triggers_without_dispatch_key():
+    """
+    Test that triggers cannot be given for a node type without a dispatch key.
+    """
+    with pytest.raises(ValueError):
+        register("PD999", ast.Import, "pandas")
+
+
+def test_visitor_loops():
+    """
+    Test that only the loops repeating a node enclose it.
+    """
+    tree = ast.parse(
+        "for a in x:\n"
+        "    while b:\n"
+        "        c = 1\n"
+        "    else:\n"
+        "        d = 2\n"
+        "    def f():\n"
+        "        for e in f(g):\n"
+        "            h = 3\n"
+    )
+    outer = tree.body[0]
+    inner = outer.body[0]
+    function = outer.body[1]
+    loops = {}
+
+    def record(node, context):
+        loops[
+            node.targets[0].id if type(node) is ast.Assign else "f()"
+        ] = context.loops(node)
+
+    dispatch = {
+        ast.Assign: (None, {}, (Rule("PD999", record, ast.Assign, context=True),)),
+        ast.Call: (None, {}, (Rule("PD999", record, ast.Call, context=True),)),
+    }
+    Visitor(dispatch=dispatch, track_ancestors=True).check(tree)
+    assert loops == {
+        "c": [outer, inner],
+        "d": [outer],
+        "h": [function.body[0]],
+        "f()": [],
+    }